@@ -1,5 +1,7 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
+import pyarrow as pa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -8,6 +10,7 @@ from backend.core.security import get_current_active_user
 from backend.models.user import User
 from backend.models.dataset import Dataset
 from backend.services.data import DataService
+from backend.utils.dataset_reader import ARROW_STREAM_MEDIA_TYPE, parse_filter, iter_ipc_stream
 
 router = APIRouter()
 
@@ -18,16 +21,23 @@ async def create_dataset(
     project_id: int,
     version: str,
     file: UploadFile = File(...),
+    partition_columns: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     data_service = DataService(db)
-    dataset = await data_service.create_dataset(
-        name=name,
-        project_id=project_id,
-        version=version,
-        file=file
-    )
+    
+    try:
+        dataset = await data_service.create_dataset(
+            name=name,
+            project_id=project_id,
+            version=version,
+            file=file,
+            partition_columns=partition_columns.split(",") if partition_columns else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     return dataset
 
 
@@ -62,3 +72,60 @@ async def get_dataset(
         raise HTTPException(status_code=404, detail="Dataset not found")
     
     return dataset
+
+
+@router.get("/{dataset_id}/stats")
+async def get_dataset_stats(
+    dataset_id: int,
+    filters: Optional[List[str]] = Query(None),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    data_service = DataService(db)
+    
+    try:
+        stats = await data_service.get_dataset_stats(
+            dataset_id,
+            filters=[parse_filter(f) for f in filters or []]
+        )
+    except (ValueError, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not stats:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    
+    return stats
+
+
+@router.get("/{dataset_id}/data")
+async def read_dataset(
+    dataset_id: int,
+    columns: Optional[str] = None,
+    filters: Optional[List[str]] = Query(None),
+    row_start: Optional[int] = Query(None, ge=0),
+    row_end: Optional[int] = Query(None, ge=0),
+    row_group_start: Optional[int] = Query(None, ge=0),
+    row_group_end: Optional[int] = Query(None, ge=0),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    data_service = DataService(db)
+    
+    try:
+        scan = await data_service.read_dataset(
+            dataset_id,
+            columns=columns.split(",") if columns else None,
+            filters=[parse_filter(f) for f in filters or []],
+            row_start=row_start,
+            row_end=row_end,
+            row_group_start=row_group_start,
+            row_group_end=row_group_end
+        )
+    except (ValueError, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if scan is None:
+        raise HTTPException(status_code=404, detail="Dataset not found")
+    
+    schema, batches = scan
+    return StreamingResponse(iter_ipc_stream(schema, batches), media_type=ARROW_STREAM_MEDIA_TYPE)
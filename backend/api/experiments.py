@@ -1,17 +1,34 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from datetime import datetime
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from backend.core.config import settings
 from backend.core.database import get_db
+from backend.core.executor import run_in_thread
+from backend.core.request_body import read_capped_body
 from backend.core.security import get_current_active_user
 from backend.models.user import User
-from backend.models.experiment import Experiment, ExperimentRun, Metric, Parameter
+from backend.models.experiment import Experiment, ExperimentRun, Parameter
 from backend.schemas.experiment import (
     ExperimentCreate, ExperimentResponse,
     RunCreate, RunResponse, RunUpdate,
-    MetricLog, ParameterLog, MetricResponse
+    MetricLog, ParameterLog, MetricResponse, MetricHistoryResponse,
+    RunComparisonRequest, RunComparisonResponse, RunSearchRequest
 )
+from backend.services.metric_stream import (
+    MetricStreamSaturatedError, format_sse, metric_stream_hub, publish_run_event
+)
+from backend.services.tracking import (
+    ALIGN_METHODS, TERMINAL_RUN_STATUSES, MetricColumns, align_series, downsample_series, load_metric_series,
+    load_run_metrics, load_runs_metric_series, metric_buffer, parameter_float, parse_metric_batch, publish_metric_points,
+    search_runs, summarize_runs, write_metrics
+)
+from backend.utils.downsample import DOWNSAMPLE_METHODS
+from backend.utils.run_search import parse_order_by, parse_search
 
 router = APIRouter()
 
@@ -53,6 +70,49 @@ async def list_experiments(
     return experiments
 
 
+@router.post("/{experiment_id}/compare", response_model=RunComparisonResponse)
+async def compare_runs(
+    experiment_id: int,
+    comparison: RunComparisonRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if comparison.align not in ALIGN_METHODS:
+        raise HTTPException(status_code=400, detail=f"Unsupported alignment: {comparison.align}")
+    
+    query = select(ExperimentRun.id).where(ExperimentRun.experiment_id == experiment_id)
+    if comparison.run_ids:
+        query = query.where(ExperimentRun.id.in_(comparison.run_ids))
+    result = await db.execute(query.order_by(ExperimentRun.id).limit(settings.RUN_COMPARISON_MAX_RUNS + 1))
+    run_ids = list(result.scalars().all())
+    
+    if len(run_ids) > settings.RUN_COMPARISON_MAX_RUNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Comparison is limited to {settings.RUN_COMPARISON_MAX_RUNS} runs"
+        )
+    if comparison.run_ids and len(run_ids) != len(set(comparison.run_ids)):
+        raise HTTPException(status_code=404, detail="Some runs do not belong to this experiment")
+    
+    response = {
+        "experiment_id": experiment_id,
+        "run_ids": run_ids,
+        "summary": await summarize_runs(db, run_ids, comparison.keys) if run_ids else {}
+    }
+    
+    if comparison.include_series and run_ids:
+        series = await load_runs_metric_series(db, run_ids, comparison.keys)
+        response["series"] = await run_in_thread(
+            "tracking.align",
+            align_series,
+            series,
+            comparison.grid_points,
+            comparison.align
+        )
+    
+    return response
+
+
 @router.post("/runs", response_model=RunResponse, status_code=status.HTTP_201_CREATED)
 async def create_run(
     run_data: RunCreate,
@@ -73,6 +133,27 @@ async def create_run(
     return run
 
 
+@router.post("/runs/search", response_model=List[RunResponse])
+async def search_experiment_runs(
+    search: RunSearchRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        clauses = parse_search(search.filter)
+        order_by = parse_order_by(search.order_by) if search.order_by else None
+        return await search_runs(
+            db,
+            clauses,
+            experiment_ids=search.experiment_ids,
+            order_by=order_by,
+            limit=search.limit,
+            offset=search.offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid run search: {e}")
+
+
 @router.post("/runs/{run_id}/metrics", status_code=status.HTTP_201_CREATED)
 async def log_metrics(
     run_id: int,
@@ -80,17 +161,104 @@ async def log_metrics(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    metric_objects = [
-        Metric(run_id=run_id, key=m.key, value=m.value, step=m.step)
-        for m in metrics
-    ]
-    
-    db.add_all(metric_objects)
+    columns = MetricColumns(
+        [m.key for m in metrics],
+        [m.value for m in metrics],
+        [m.step or 0 for m in metrics]
+    )
+    await write_metrics(db, run_id, columns)
     await db.commit()
+    await publish_metric_points(run_id, columns)
     
     return {"status": "success", "count": len(metrics)}
 
 
+@router.post("/runs/{run_id}/metrics/batch", status_code=status.HTTP_201_CREATED)
+async def log_metrics_batch(
+    run_id: int,
+    request: Request,
+    buffered: bool = False,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    body = await read_capped_body(request, settings.METRIC_BATCH_MAX_BYTES)
+    content_type = request.headers.get("content-type", "application/json")
+    
+    try:
+        metrics = await run_in_thread("tracking.parse_metrics", parse_metric_batch, body, content_type)
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse metric batch: {e}")
+    
+    if len(metrics) > settings.METRIC_BATCH_MAX_POINTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.METRIC_BATCH_MAX_POINTS} points"
+        )
+    
+    result = await db.execute(select(ExperimentRun.id).where(ExperimentRun.id == run_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    
+    if buffered:
+        await metric_buffer.add(run_id, metrics)
+        return {"status": "accepted", "count": len(metrics)}
+    
+    count = await write_metrics(db, run_id, metrics)
+    await db.commit()
+    await publish_metric_points(run_id, metrics)
+    
+    return {"status": "success", "count": count}
+
+
+@router.get("/runs/{run_id}/metrics/stream")
+async def stream_run_metrics(
+    run_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    result = await db.execute(select(ExperimentRun.status).where(ExperimentRun.id == run_id))
+    run_status = result.scalar_one_or_none()
+    if run_status is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    
+    # Only check capacity here: the generator may never run if the client
+    # disconnects first, so the subscription itself is taken inside it.
+    if not metric_stream_hub.has_capacity():
+        raise HTTPException(status_code=503, detail="Too many live metric subscribers", headers={"Retry-After": "5"})
+    
+    async def events():
+        yield "retry: 3000\n\n"
+        if run_status in TERMINAL_RUN_STATUSES:
+            yield format_sse("status", json.dumps({"status": run_status.value}))
+            return
+        
+        try:
+            subscription = metric_stream_hub.subscribe(run_id)
+        except MetricStreamSaturatedError as e:
+            yield format_sse("error", json.dumps({"detail": str(e)}))
+            return
+        
+        try:
+            while not await request.is_disconnected():
+                event = await subscription.next_event(settings.METRIC_STREAM_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                yield format_sse(*event)
+                if event[0] == "status":
+                    return
+        finally:
+            metric_stream_hub.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/runs/{run_id}/parameters", status_code=status.HTTP_201_CREATED)
 async def log_parameters(
     run_id: int,
@@ -99,7 +267,7 @@ async def log_parameters(
     db: AsyncSession = Depends(get_db)
 ):
     param_objects = [
-        Parameter(run_id=run_id, key=p.key, value=p.value)
+        Parameter(run_id=run_id, key=p.key, value=p.value, value_float=parameter_float(p.value))
         for p in parameters
     ]
     
@@ -130,9 +298,33 @@ async def get_run_metrics(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Metric).where(Metric.run_id == run_id))
-    metrics = result.scalars().all()
-    return metrics
+    return await load_run_metrics(db, run_id)
+
+
+@router.get("/runs/{run_id}/metrics/history", response_model=MetricHistoryResponse)
+async def get_run_metric_history(
+    run_id: int,
+    keys: Optional[List[str]] = Query(None),
+    step_min: Optional[int] = None,
+    step_max: Optional[int] = None,
+    max_points: int = Query(1000, ge=4, le=100000),
+    method: str = "lttb",
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if method not in DOWNSAMPLE_METHODS:
+        raise HTTPException(status_code=400, detail=f"Unsupported downsampling method: {method}")
+    
+    series = await load_metric_series(db, run_id, keys, step_min, step_max)
+    series = await run_in_thread(
+        "tracking.downsample",
+        downsample_series,
+        series,
+        max_points,
+        method
+    )
+    
+    return {"run_id": run_id, "series": series}
 
 
 @router.put("/runs/{run_id}", response_model=RunResponse)
@@ -150,10 +342,15 @@ async def update_run(
     
     if run_data.status:
         run.status = run_data.status
+        if run.status in TERMINAL_RUN_STATUSES and run.end_time is None:
+            run.end_time = datetime.utcnow()
     if run_data.metadata:
         run.metadata = run_data.metadata
     
     await db.commit()
     await db.refresh(run)
     
+    if run.status in TERMINAL_RUN_STATUSES:
+        await publish_run_event(run.id, "status", {"status": run.status.value})
+    
     return run
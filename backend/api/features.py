@@ -1,13 +1,26 @@
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+import pyarrow as pa
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from backend.core.config import settings
 from backend.core.database import get_db
 from backend.core.security import get_current_active_user
 from backend.models.user import User
 from backend.models.feature import FeatureGroup, Feature
-from backend.services.data import FeatureStoreService
+from backend.core.executor import run_in_thread
+from backend.core.redis_pool import get_redis
+from backend.core.request_body import read_capped_body
+from backend.schemas.feature import OnlineFeatureRequest, OnlineFeatureResponse
+from backend.services.data import FeatureStoreService, parse_feature_batch
+from backend.services.feature_cache import online_feature_cache
+from backend.services.feature_registry import feature_group_cache, get_feature_group
+from backend.services.feature_stream import stream_key, stream_lag
+from backend.utils.dataset_reader import ARROW_STREAM_MEDIA_TYPE, iter_ipc_stream
+from backend.utils.feature_codecs import ENCODING_MSGPACK, SUPPORTED_ENCODINGS
+from backend.utils.transformations import compile_plan
 
 router = APIRouter()
 
@@ -18,24 +31,37 @@ async def create_feature_group(
     project_id: int,
     entity_columns: List[str],
     description: str = None,
+    event_time_column: str = None,
+    online_encoding: str = ENCODING_MSGPACK,
+    online_ttl_seconds: Optional[int] = Query(None, gt=0),
+    max_staleness_seconds: Optional[int] = Query(None, gt=0),
     online_enabled: bool = True,
     offline_enabled: bool = True,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
+    if online_encoding not in SUPPORTED_ENCODINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported online encoding: {online_encoding}")
+    
     feature_group = FeatureGroup(
         name=name,
         description=description,
         project_id=project_id,
         online_enabled=online_enabled,
         offline_enabled=offline_enabled,
-        entity_columns=entity_columns
+        entity_columns=entity_columns,
+        event_time_column=event_time_column,
+        online_encoding=online_encoding,
+        online_ttl_seconds=online_ttl_seconds,
+        max_staleness_seconds=max_staleness_seconds
     )
     
     db.add(feature_group)
     await db.commit()
     await db.refresh(feature_group)
     
+    await FeatureStoreService(db).invalidate_group(feature_group.id, feature_group.name)
+    
     return feature_group
 
 
@@ -45,20 +71,41 @@ async def add_feature(
     name: str,
     dtype: str,
     description: str = None,
+    transformation: Optional[Dict[str, Any]] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
+    if transformation:
+        result = await db.execute(
+            select(Feature.name, Feature.transformation).where(Feature.feature_group_id == group_id)
+        )
+        declarations = {row.name: row.transformation for row in result if row.transformation}
+        declarations[name] = transformation
+        
+        try:
+            compile_plan(declarations)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     feature = Feature(
         name=name,
         description=description,
         feature_group_id=group_id,
-        dtype=dtype
+        dtype=dtype,
+        transformation=transformation
     )
     
     db.add(feature)
+    await db.execute(
+        update(FeatureGroup)
+        .where(FeatureGroup.id == group_id)
+        .values(version=FeatureGroup.version + 1)
+    )
     await db.commit()
     await db.refresh(feature)
     
+    await FeatureStoreService(db).invalidate_group(group_id)
+    
     return feature
 
 
@@ -70,17 +117,169 @@ async def ingest_features(
     db: AsyncSession = Depends(get_db)
 ):
     feature_service = FeatureStoreService(db)
-    await feature_service.ingest_features(group_id, features)
+    
+    try:
+        await feature_service.ingest_features(group_id, features)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     return {"status": "success", "message": "Features ingested"}
 
 
+@router.get("/groups/{group_id}/stream")
+async def get_stream_status(
+    group_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    group = await get_feature_group(db, group_id)
+    if not group:
+        raise HTTPException(status_code=404, detail="Feature group not found")
+    
+    return {
+        "stream": stream_key(group.name),
+        **await stream_lag(get_redis(), group.name)
+    }
+
+
+@router.get("/groups/{group_id}/freshness")
+async def get_freshness_report(
+    group_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    group = await get_feature_group(db, group_id)
+    if not group:
+        raise HTTPException(status_code=404, detail="Feature group not found")
+    
+    report = await FeatureStoreService(db).get_freshness_report(group.name)
+    if report is None:
+        raise HTTPException(status_code=404, detail="No freshness report yet")
+    
+    return report
+
+
+@router.post("/groups/{group_id}/ingest/bulk")
+async def ingest_features_bulk(
+    group_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    body = await read_capped_body(request, settings.FEATURE_STORE_BULK_MAX_BYTES)
+    content_type = request.headers.get("content-type", "application/x-ndjson")
+    
+    try:
+        table = await run_in_thread("features.bulk_parse", parse_feature_batch, body, content_type)
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse feature batch: {e}")
+    
+    if table.num_rows > settings.FEATURE_STORE_BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.FEATURE_STORE_BULK_MAX_ROWS} rows"
+        )
+    
+    feature_service = FeatureStoreService(db)
+    
+    try:
+        count = await feature_service.ingest_batch(group_id, table)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {"status": "success", "count": count}
+
+
 @router.get("/groups/{group_id}/features")
 async def get_online_features(
     group_id: int,
-    entity_id: str,
+    entity_id: List[str] = Query(...),
+    max_age_seconds: Optional[float] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     feature_service = FeatureStoreService(db)
-    features = await feature_service.get_online_features(group_id, entity_id)
+    
+    try:
+        features = await feature_service.get_online_features(
+            group_id,
+            entity_id,
+            max_age_seconds=max_age_seconds
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     return features
+
+
+@router.get("/cache/stats")
+async def get_cache_stats(
+    current_user: User = Depends(get_current_active_user)
+):
+    return {
+        "online": online_feature_cache.stats(),
+        "feature_groups": feature_group_cache.stats()
+    }
+
+
+@router.post("/online", response_model=OnlineFeatureResponse)
+async def get_online_features_batch(
+    request: OnlineFeatureRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    feature_service = FeatureStoreService(db)
+    
+    try:
+        features, freshness = await feature_service.get_online_features_batch(
+            request.entity_ids,
+            request.features,
+            max_age_seconds=request.max_age_seconds
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return OnlineFeatureResponse(
+        entity_ids=request.entity_ids,
+        features=features,
+        freshness=freshness
+    )
+
+
+@router.post("/historical")
+async def get_historical_features(
+    request: Request,
+    features: List[str] = Query(...),
+    timestamp_column: str = "event_timestamp",
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    body = await read_capped_body(request, settings.FEATURE_STORE_BULK_MAX_BYTES)
+    content_type = request.headers.get("content-type", "application/x-ndjson")
+    
+    try:
+        entities = await run_in_thread("features.bulk_parse", parse_feature_batch, body, content_type)
+    except (ValueError, OSError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse entity rows: {e}")
+    
+    feature_service = FeatureStoreService(db)
+    
+    try:
+        training_df = await feature_service.get_historical_features(
+            entities.to_pandas(),
+            features,
+            timestamp_column=timestamp_column
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    table = await run_in_thread(
+        "features.historical_encode",
+        pa.Table.from_pandas,
+        training_df,
+        preserve_index=False
+    )
+    return StreamingResponse(
+        iter_ipc_stream(table.schema, iter(table.to_batches())),
+        media_type=ARROW_STREAM_MEDIA_TYPE
+    )
@@ -0,0 +1,158 @@
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import functools
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from backend.core.config import settings
+from backend.core.telemetry import get_meter
+
+meter = get_meter(__name__)
+operation_duration = meter.create_histogram(
+    "zenith.executor.operation.duration",
+    unit="s",
+    description="Wall time of CPU-bound data operations run off the event loop"
+)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    pass
+
+
+class ExecutorTimeoutError(RuntimeError):
+    pass
+
+
+class BoundedExecutor:
+    def __init__(self, name: str, pool: Executor, max_workers: int, max_queue: int):
+        self.name = name
+        self.pool = pool
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self.operations: Dict[str, Dict[str, float]] = {}
+    
+    async def run(
+        self,
+        operation: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ExecutorSaturatedError(f"{self.name} executor queue is full")
+        
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        started = time.perf_counter()
+        failed = False
+        
+        # The slot is held until the pool work itself finishes, not until the
+        # caller stops waiting: a timed-out call keeps running in the pool
+        # and must still count against the admission bound.
+        try:
+            future = self.pool.submit(functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self.in_flight -= 1
+            raise
+        future.add_done_callback(lambda _: self._release_threadsafe(loop))
+        
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or settings.DATA_EXECUTOR_TIMEOUT)
+        except TimeoutError as e:
+            failed = True
+            raise ExecutorTimeoutError(f"{self.name} executor operation {operation} timed out") from e
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(operation, time.perf_counter() - started, failed)
+    
+    def _release(self):
+        self.in_flight -= 1
+    
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop):
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # The loop is already closed during shutdown.
+            pass
+    
+    def _record(self, operation: str, elapsed: float, failed: bool):
+        stats = self.operations.setdefault(
+            operation,
+            {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        stats["count"] += 1
+        stats["errors"] += int(failed)
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        
+        operation_duration.record(
+            elapsed,
+            {"executor": self.name, "operation": operation, "failed": failed}
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": max(self.in_flight - self.max_workers, 0),
+            "rejected": self.rejected,
+            "operations": {
+                operation: {
+                    **stats,
+                    "mean_seconds": stats["total_seconds"] / stats["count"] if stats["count"] else 0.0
+                }
+                for operation, stats in self.operations.items()
+            }
+        }
+    
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executors: Dict[str, BoundedExecutor] = {}
+
+
+def _get_executor(kind: str) -> BoundedExecutor:
+    executor = _executors.get(kind)
+    if executor:
+        return executor
+    
+    if kind == "process" and settings.DATA_EXECUTOR_PROCESSES > 0:
+        workers = settings.DATA_EXECUTOR_PROCESSES
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        workers = settings.DATA_EXECUTOR_THREADS
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"zenith-{kind}")
+    
+    executor = BoundedExecutor(kind, pool, workers, settings.DATA_EXECUTOR_MAX_QUEUE)
+    _executors[kind] = executor
+    return executor
+
+
+async def run_cpu_bound(operation: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await _get_executor("process").run(operation, fn, *args, **kwargs)
+
+
+async def run_in_thread(operation: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await _get_executor("thread").run(operation, fn, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Any]:
+    return {kind: executor.stats() for kind, executor in _executors.items()}
+
+
+def shutdown_executors():
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
@@ -0,0 +1,92 @@
+from typing import Any, Dict, Iterable, Optional
+import time
+import redis.asyncio as aioredis
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from backend.core.config import settings
+from backend.core.telemetry import get_meter
+
+meter = get_meter(__name__)
+
+_client: Optional[aioredis.Redis] = None
+
+
+def _pool_counts() -> Dict[str, int]:
+    if _client is None:
+        return {"in_use": 0, "idle": 0}
+    
+    pool = _client.connection_pool
+    return {
+        "in_use": len(getattr(pool, "_in_use_connections", ())),
+        "idle": len(getattr(pool, "_available_connections", ()))
+    }
+
+
+def _observe_connections(options: CallbackOptions) -> Iterable[Observation]:
+    counts = _pool_counts()
+    return [
+        Observation(counts["in_use"], {"state": "in_use"}),
+        Observation(counts["idle"], {"state": "idle"})
+    ]
+
+
+meter.create_observable_gauge(
+    "zenith.redis.pool.connections",
+    callbacks=[_observe_connections],
+    description="Connections held by the shared Redis pool"
+)
+
+
+def init_redis() -> aioredis.Redis:
+    global _client
+    
+    if _client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL
+        )
+        _client = aioredis.Redis(connection_pool=pool)
+    
+    return _client
+
+
+def get_redis() -> aioredis.Redis:
+    return _client or init_redis()
+
+
+async def close_redis():
+    global _client
+    
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+        await client.connection_pool.disconnect()
+
+
+def redis_pool_stats() -> Dict[str, Any]:
+    counts = _pool_counts()
+    return {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "in_use": counts["in_use"],
+        "idle": counts["idle"],
+        "utilization": counts["in_use"] / settings.REDIS_MAX_CONNECTIONS
+    }
+
+
+async def redis_health() -> Dict[str, Any]:
+    started = time.perf_counter()
+    
+    try:
+        await get_redis().ping()
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e), "pool": redis_pool_stats()}
+    
+    return {
+        "status": "healthy",
+        "latency_ms": (time.perf_counter() - started) * 1000,
+        "pool": redis_pool_stats()
+    }
@@ -0,0 +1,24 @@
+from fastapi import HTTPException, Request
+
+
+async def read_capped_body(request: Request, limit: int) -> bytes:
+    # Reject oversized uploads before buffering them; row and point caps only
+    # apply after parsing, by which point the whole body is in memory.
+    too_large = HTTPException(status_code=413, detail=f"Request body exceeds {limit} bytes")
+    
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+        if declared > limit:
+            raise too_large
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > limit:
+            raise too_large
+    
+    return bytes(body)
@@ -1,5 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -7,6 +8,11 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from backend.core.config import settings
 from backend.core.database import engine, Base
 from backend.core.telemetry import setup_telemetry
+from backend.core.executor import ExecutorSaturatedError, ExecutorTimeoutError, executor_stats, shutdown_executors
+from backend.core.redis_pool import close_redis, init_redis, redis_health
+from backend.services.feature_registry import listen_for_invalidations
+from backend.services.metric_stream import metric_stream_hub
+from backend.services.tracking import metric_buffer
 from backend.api import auth, projects, datasets, features, experiments, models, deploy, monitor, agents, prompts
 
 
@@ -18,8 +24,18 @@ async def lifespan(app: FastAPI):
     if settings.OTEL_ENABLED:
         setup_telemetry()
     
+    app.state.redis = init_redis()
+    invalidation_listener = asyncio.create_task(listen_for_invalidations(app.state.redis))
+    metric_stream_listener = asyncio.create_task(metric_stream_hub.listen(app.state.redis))
+    metric_buffer.start()
+    
     yield
     
+    await metric_buffer.stop()
+    metric_stream_listener.cancel()
+    invalidation_listener.cancel()
+    shutdown_executors()
+    await close_redis()
     await engine.dispose()
 
 
@@ -55,6 +71,20 @@ app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
 app.include_router(prompts.router, prefix="/api/v1/prompts", tags=["prompts"])
 
 
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(ExecutorTimeoutError)
+async def executor_timeout_handler(request: Request, exc: ExecutorTimeoutError):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
 @app.get("/health")
 async def health_check():
     return JSONResponse(
@@ -66,6 +96,30 @@ async def health_check():
     )
 
 
+@app.get("/health/executors")
+async def executors_health():
+    return executor_stats()
+
+
+@app.get("/health/metric-buffer")
+async def metric_buffer_health():
+    return metric_buffer.stats()
+
+
+@app.get("/health/metric-stream")
+async def metric_stream_health():
+    return metric_stream_hub.stats()
+
+
+@app.get("/health/redis")
+async def redis_health_check():
+    health = await redis_health()
+    return JSONResponse(
+        status_code=200 if health["status"] == "healthy" else 503,
+        content=health
+    )
+
+
 @app.get("/")
 async def root():
     return {
@@ -13,9 +13,11 @@ class Dataset(Base):
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
     version: Mapped[str] = mapped_column(String(50), nullable=False)
     storage_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), index=True, nullable=True)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=True)
     num_rows: Mapped[int] = mapped_column(Integer, nullable=True)
     num_features: Mapped[int] = mapped_column(Integer, nullable=True)
     schema: Mapped[dict] = mapped_column(JSON, nullable=True)
     metadata: Mapped[dict] = mapped_column(JSON, nullable=True)
+    stats: Mapped[dict] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Float, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy import String, Text, Integer, Float, ForeignKey, DateTime, JSON, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.core.database import Base
 import enum
@@ -24,6 +25,10 @@ class Experiment(Base):
 
 class ExperimentRun(Base):
     __tablename__ = "experiment_runs"
+    __table_args__ = (
+        Index("ix_experiment_runs_experiment_start", "experiment_id", "start_time"),
+        Index("ix_experiment_runs_tags", "tags", postgresql_using="gin"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     experiment_id: Mapped[int] = mapped_column(ForeignKey("experiments.id"), nullable=False)
@@ -33,20 +38,29 @@ class ExperimentRun(Base):
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     artifact_uri: Mapped[str] = mapped_column(String(500), nullable=True)
     metadata: Mapped[dict] = mapped_column(JSON, nullable=True)
-    tags: Mapped[dict] = mapped_column(JSON, nullable=True)
+    tags: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    metrics_archive: Mapped[str] = mapped_column(String(500), nullable=True)
 
 
 class Parameter(Base):
     __tablename__ = "parameters"
+    __table_args__ = (
+        Index("ix_parameters_key_value_float", "key", "value_float"),
+        Index("ix_parameters_run_id", "run_id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     run_id: Mapped[int] = mapped_column(ForeignKey("experiment_runs.id"), nullable=False)
     key: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     value: Mapped[str] = mapped_column(Text, nullable=False)
+    value_float: Mapped[float] = mapped_column(Float, nullable=True)
 
 
 class Metric(Base):
     __tablename__ = "metrics"
+    __table_args__ = (
+        Index("ix_metrics_run_key_step", "run_id", "key", "step"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     run_id: Mapped[int] = mapped_column(ForeignKey("experiment_runs.id"), nullable=False)
@@ -54,3 +68,20 @@ class Metric(Base):
     value: Mapped[float] = mapped_column(Float, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     step: Mapped[int] = mapped_column(Integer, default=0, nullable=True)
+
+
+class MetricSummary(Base):
+    __tablename__ = "metric_summaries"
+    __table_args__ = (
+        Index("ix_metric_summaries_key_last_value", "key", "last_value"),
+    )
+    
+    run_id: Mapped[int] = mapped_column(ForeignKey("experiment_runs.id"), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    last_value: Mapped[float] = mapped_column(Float, nullable=False)
+    last_step: Mapped[int] = mapped_column(Integer, nullable=False)
+    min_value: Mapped[float] = mapped_column(Float, nullable=False)
+    max_value: Mapped[float] = mapped_column(Float, nullable=False)
+    sum_value: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -14,6 +14,11 @@ class FeatureGroup(Base):
     online_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     offline_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     entity_columns: Mapped[list] = mapped_column(JSON, nullable=False)
+    event_time_column: Mapped[str] = mapped_column(String(255), nullable=True)
+    online_encoding: Mapped[str] = mapped_column(String(20), default="msgpack", nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    online_ttl_seconds: Mapped[int] = mapped_column(Integer, nullable=True)
+    max_staleness_seconds: Mapped[int] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
 
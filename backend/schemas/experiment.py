@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from backend.models.experiment import RunStatus
@@ -52,6 +52,61 @@ class MetricLog(BaseModel):
     step: Optional[int] = 0
 
 
+class MetricBatch(BaseModel):
+    keys: List[str]
+    values: List[float]
+    steps: Optional[List[int]] = None
+    timestamps: Optional[List[datetime]] = None
+
+
+class MetricSeries(BaseModel):
+    steps: List[int]
+    values: List[Optional[float]]
+    total_points: int
+
+
+class MetricHistoryResponse(BaseModel):
+    run_id: int
+    series: Dict[str, MetricSeries]
+
+
+class RunSearchRequest(BaseModel):
+    experiment_ids: Optional[List[int]] = None
+    filter: str = ""
+    order_by: Optional[str] = None
+    limit: int = Field(100, ge=1, le=1000)
+    offset: int = Field(0, ge=0)
+
+
+class RunComparisonRequest(BaseModel):
+    run_ids: Optional[List[int]] = None
+    keys: Optional[List[str]] = None
+    include_series: bool = True
+    grid_points: int = Field(200, ge=2, le=5000)
+    align: str = "linear"
+
+
+class RunMetricSummary(BaseModel):
+    last: Optional[float]
+    last_step: Optional[int]
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+    count: int
+
+
+class AlignedMetricSeries(BaseModel):
+    steps: List[int]
+    values: Dict[int, List[Optional[float]]]
+
+
+class RunComparisonResponse(BaseModel):
+    experiment_id: int
+    run_ids: List[int]
+    summary: Dict[str, Dict[int, RunMetricSummary]]
+    series: Dict[str, AlignedMetricSeries] = {}
+
+
 class ParameterLog(BaseModel):
     key: str
     value: str
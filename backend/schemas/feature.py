@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any, List, Union
+
+
+class OnlineFeatureRequest(BaseModel):
+    entity_ids: List[Union[str, List[str]]]
+    features: List[str]
+    max_age_seconds: Optional[float] = None
+
+
+class OnlineFeatureResponse(BaseModel):
+    entity_ids: List[Union[str, List[str]]]
+    features: Dict[str, List[Any]]
+    freshness: Dict[str, List[Optional[float]]] = {}
+
+
+class FeatureSpec(BaseModel):
+    id: int
+    name: str
+    dtype: str
+    transformation: Optional[Dict[str, Any]] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class FeatureGroupSpec(BaseModel):
+    id: int
+    name: str
+    project_id: int
+    online_enabled: bool
+    offline_enabled: bool
+    entity_columns: List[str]
+    event_time_column: Optional[str] = None
+    online_encoding: str = "msgpack"
+    version: int = 1
+    online_ttl_seconds: Optional[int] = None
+    max_staleness_seconds: Optional[int] = None
+    features: List[FeatureSpec] = []
+    
+    class Config:
+        from_attributes = True
@@ -1,7 +1,16 @@
-from typing import Dict, Any, Optional
-import aiofiles
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime
+import asyncio
 import json
+import time
+import uuid
+import aiofiles
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
 import pyarrow.parquet as pq
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,8 +19,71 @@ from fastapi import UploadFile
 import redis.asyncio as aioredis
 
 from backend.models.dataset import Dataset
-from backend.models.feature import FeatureGroup
 from backend.core.config import settings
+from backend.core.executor import run_cpu_bound, run_in_thread
+from backend.core.redis_pool import get_redis
+from backend.utils.dataset_reader import ARROW_STREAM_MEDIA_TYPE, scan_dataset
+from backend.services.dataset_store import ChunkStore, deserialize_schema
+from backend.services.feature_registry import (
+    get_feature_group, get_feature_groups_by_name, get_transformation_plan, publish_invalidation
+)
+from backend.services.feature_cache import is_missing, online_feature_cache, publish_online_invalidation
+from backend.schemas.feature import FeatureGroupSpec
+from backend.services.offline_store import INGESTED_AT_COLUMN, OfflineFeatureStore
+from backend.services.materialization import (
+    MATERIALIZATION_STATE, build_materialization_table, resume_checkpoint
+)
+from backend.utils.point_in_time import assemble_training_frame, point_in_time_join, prepare_entity_frame
+from backend.utils.feature_codecs import decode_record, encode_record, is_embedding_dtype
+from backend.utils.entity_keys import EntityKey, entity_key_mask, normalize_entity_key, online_key
+from backend.utils.dataset_stats import compute_parquet_stats, merge_stats, summarize_stats
+
+FRESHNESS_FIELD = "_age_seconds"
+FRESHNESS_REPORT_KEY = "zenith:features:freshness"
+
+
+def _iter_upload_batches(path: Path, is_csv: bool) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    if is_csv:
+        reader = pa_csv.open_csv(
+            path,
+            read_options=pa_csv.ReadOptions(block_size=settings.DATASET_CSV_BLOCK_SIZE)
+        )
+        return reader.schema, iter(reader)
+    
+    parquet_file = pq.ParquetFile(path)
+    return parquet_file.schema_arrow, parquet_file.iter_batches(batch_size=settings.DATASET_ROW_GROUP_SIZE)
+
+
+def _ingest_upload(
+    path: Path,
+    is_csv: bool,
+    store_root: Path,
+    partition_columns: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    schema, batches = _iter_upload_batches(path, is_csv)
+    return ChunkStore(store_root).write_batches(schema, batches, partition_columns)
+
+
+def _is_manifest(dataset: Dataset) -> bool:
+    return dataset.storage_path.endswith(".json")
+
+
+def _dataset_source(
+    dataset: Dataset,
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+) -> Dict[str, Any]:
+    if not _is_manifest(dataset):
+        return {"paths": [dataset.storage_path]}
+    
+    store = ChunkStore.for_manifest(dataset.storage_path)
+    manifest = store.load_manifest(dataset.storage_path)
+    return store.scan_source(manifest, store.select_chunks(manifest, filters))
+
+
+def _partition_stats(manifest_path: str, filters: List[Tuple[str, str, Any]]) -> Dict[str, Any]:
+    manifest = ChunkStore.load_manifest(manifest_path)
+    entries = ChunkStore.select_chunks(manifest, filters)
+    return summarize_stats(ChunkStore.manifest_stats(manifest, entries))
 
 
 class DataService:
@@ -19,32 +91,83 @@ class DataService:
         self.db = db
         self.storage_path = Path("/app/artifacts/datasets")
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.upload_path = self.storage_path / ".uploads"
+        self.upload_path.mkdir(parents=True, exist_ok=True)
+    
+    async def _spool_upload(self, file: UploadFile) -> Tuple[Path, int]:
+        spool_path = self.upload_path / f"{uuid.uuid4().hex}.part"
+        size_bytes = 0
+        
+        try:
+            async with aiofiles.open(spool_path, 'wb') as f:
+                while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+                    size_bytes += len(chunk)
+                    if size_bytes > settings.MAX_UPLOAD_SIZE:
+                        raise ValueError("Upload exceeds maximum allowed size")
+                    await f.write(chunk)
+        except BaseException:
+            spool_path.unlink(missing_ok=True)
+            raise
+        
+        return spool_path, size_bytes
     
     async def create_dataset(
         self,
         name: str,
         project_id: int,
         version: str,
-        file: UploadFile
+        file: UploadFile,
+        partition_columns: Optional[List[str]] = None
     ) -> Dataset:
-        file_path = self.storage_path / f"{name}_{version}.parquet"
+        store_root = self.storage_path / name
+        spool_path, _ = await self._spool_upload(file)
         
-        content = await file.read()
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+        try:
+            manifest = await run_cpu_bound(
+                "dataset.ingest",
+                _ingest_upload,
+                spool_path,
+                file.filename.endswith('.csv'),
+                store_root,
+                partition_columns
+            )
+        except (pa.ArrowInvalid, OSError) as e:
+            raise ValueError(f"Could not parse uploaded file: {e}") from e
+        finally:
+            spool_path.unlink(missing_ok=True)
         
-        df = pd.read_csv(pd.io.common.BytesIO(content)) if file.filename.endswith('.csv') else pd.read_parquet(pd.io.common.BytesIO(content))
+        result = await self.db.execute(
+            select(Dataset).where(
+                Dataset.project_id == project_id,
+                Dataset.name == name,
+                Dataset.content_hash == manifest["digest"]
+            )
+        )
+        existing = result.scalars().first()
+        
+        if existing:
+            return existing
+        
+        schema = deserialize_schema(manifest["schema"])
+        dtypes = schema.empty_table().to_pandas().dtypes
         
         dataset = Dataset(
             name=name,
             project_id=project_id,
             version=version,
-            storage_path=str(file_path),
-            size_bytes=len(content),
-            num_rows=len(df),
-            num_features=len(df.columns),
-            schema={col: str(dtype) for col, dtype in df.dtypes.items()},
-            metadata={"columns": list(df.columns)}
+            storage_path=str(ChunkStore(store_root).manifest_path(manifest["digest"])),
+            content_hash=manifest["digest"],
+            size_bytes=manifest["size_bytes"],
+            num_rows=manifest["num_rows"],
+            num_features=len(schema.names),
+            schema={col: str(dtype) for col, dtype in dtypes.items()},
+            metadata={
+                "columns": list(schema.names),
+                "num_chunks": len(manifest["chunks"]),
+                "partition_columns": manifest["partition_columns"],
+                "partitions": ChunkStore.partition_index(manifest)
+            },
+            stats=ChunkStore.manifest_stats(manifest)
         )
         
         self.db.add(dataset)
@@ -53,108 +176,545 @@ class DataService:
         
         return dataset
     
-    async def get_dataset_stats(self, dataset_id: int) -> Dict[str, Any]:
+    async def get_dataset_stats(
+        self,
+        dataset_id: int,
+        filters: Optional[List[Tuple[str, str, Any]]] = None
+    ) -> Dict[str, Any]:
         result = await self.db.execute(select(Dataset).where(Dataset.id == dataset_id))
         dataset = result.scalar_one_or_none()
         
         if not dataset:
             return {}
         
-        df = pd.read_parquet(dataset.storage_path)
+        if filters:
+            partition_columns = (dataset.metadata or {}).get("partition_columns", [])
+            unsupported = [column for column, _, _ in filters if column not in partition_columns]
+            if unsupported or not _is_manifest(dataset):
+                raise ValueError("Stats filters must reference partition columns")
+            
+            return await run_in_thread("dataset.partition_stats", _partition_stats, dataset.storage_path, filters)
         
-        return {
-            "num_rows": len(df),
-            "num_columns": len(df.columns),
-            "memory_usage": df.memory_usage(deep=True).sum(),
-            "column_types": df.dtypes.to_dict(),
-            "missing_values": df.isnull().sum().to_dict(),
-            "numeric_summary": df.describe().to_dict()
-        }
+        if dataset.stats is None:
+            paths = _dataset_source(dataset)["paths"]
+            partials = [await run_cpu_bound("dataset.stats", compute_parquet_stats, path) for path in paths]
+            dataset.stats = merge_stats(partials)
+            await self.db.commit()
+        
+        return summarize_stats(dataset.stats)
+    
+    async def read_dataset(
+        self,
+        dataset_id: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+        row_start: Optional[int] = None,
+        row_end: Optional[int] = None,
+        row_group_start: Optional[int] = None,
+        row_group_end: Optional[int] = None
+    ) -> Optional[Tuple[pa.Schema, Iterator[pa.RecordBatch]]]:
+        result = await self.db.execute(select(Dataset).where(Dataset.id == dataset_id))
+        dataset = result.scalar_one_or_none()
+        
+        if not dataset:
+            return None
+        
+        source = await run_in_thread("dataset.resolve", _dataset_source, dataset, filters)
+        
+        return await run_in_thread(
+            "dataset.scan",
+            scan_dataset,
+            **source,
+            columns=columns,
+            filters=filters,
+            row_start=row_start,
+            row_end=row_end,
+            row_group_start=row_group_start,
+            row_group_end=row_group_end
+        )
+
+
+def parse_feature_batch(body: bytes, content_type: str) -> pa.Table:
+    if content_type.startswith(ARROW_STREAM_MEDIA_TYPE):
+        return pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+    
+    return pa_json.read_json(pa.BufferReader(body))
+
+
+def online_ttl(group: FeatureGroupSpec) -> int:
+    return group.online_ttl_seconds or settings.FEATURE_STORE_ONLINE_TTL
+
+
+def record_age(record: Dict[str, Any], now: float) -> Optional[float]:
+    ingested_at = record.get(INGESTED_AT_COLUMN)
+    if isinstance(ingested_at, (int, float)):
+        return max(now - ingested_at, 0.0)
+    return None
+
+
+def _encode_online_rows(table: pa.Table, group: FeatureGroupSpec) -> List[Tuple[str, bytes, int]]:
+    ttl = online_ttl(group)
+    now = time.time()
+    narrow = frozenset(f.name for f in group.features if is_embedding_dtype(f.dtype))
+    rows = []
+    
+    for row in table.to_pylist():
+        ingested_at = row.get(INGESTED_AT_COLUMN)
+        row[INGESTED_AT_COLUMN] = ingested_at.timestamp() if isinstance(ingested_at, datetime) else now
+        
+        # The key TTL counts from this write, so backfilled or replayed rows
+        # are still served; they keep their original ingest time, and reads
+        # drop them once it is older than the group's max staleness.
+        rows.append((
+            online_key(group.name, [row[col] for col in group.entity_columns]),
+            encode_record(row, group.online_encoding, narrow),
+            ttl
+        ))
+    
+    return rows
+
+
+def _read_entities(
+    offline_store: OfflineFeatureStore,
+    group: FeatureGroupSpec,
+    entity_keys: List[Tuple[Any, ...]],
+    feature_names: Optional[List[str]] = None
+) -> pa.Table:
+    dataset = offline_store.dataset(group.name)
+    entity_columns = group.entity_columns
+    
+    if dataset is None or any(col not in dataset.schema.names for col in entity_columns):
+        return pa.table({})
+    
+    filter_expr = None
+    for idx, col in enumerate(entity_columns):
+        predicate = pc.field(col).isin(list({key[idx] for key in entity_keys}))
+        filter_expr = predicate if filter_expr is None else filter_expr & predicate
+    
+    columns = None
+    if feature_names:
+        columns = [
+            c for c in dict.fromkeys(entity_columns + feature_names)
+            if c in dataset.schema.names
+        ]
+    
+    table = dataset.to_table(columns=columns, filter=filter_expr)
+    if len(entity_columns) == 1 or not table.num_rows:
+        return table
+    
+    return table.filter(entity_key_mask(table, entity_keys, entity_columns))
+
+
+def _join_group_history(
+    offline_store: OfflineFeatureStore,
+    group: FeatureGroupSpec,
+    feature_names: List[str],
+    entity_df: pd.DataFrame,
+    timestamp_column: str
+) -> pd.DataFrame:
+    entity_columns = group.entity_columns
+    time_col = group.event_time_column or INGESTED_AT_COLUMN
+    dataset = offline_store.dataset(group.name)
+    
+    if (
+        dataset is None
+        or time_col not in dataset.schema.names
+        or any(col not in dataset.schema.names for col in entity_columns)
+    ):
+        feature_df = pd.DataFrame()
+    else:
+        filter_expr = None
+        for col in entity_columns:
+            predicate = pc.field(col).isin(entity_df[col].unique().tolist())
+            filter_expr = predicate if filter_expr is None else filter_expr & predicate
+        if pa.types.is_timestamp(dataset.schema.field(time_col).type):
+            filter_expr &= pc.field(time_col) <= pa.scalar(
+                entity_df[timestamp_column].max(),
+                dataset.schema.field(time_col).type
+            )
+        
+        plan = get_transformation_plan(group)
+        columns = None if plan else [
+            c for c in dict.fromkeys(entity_columns + [time_col, INGESTED_AT_COLUMN] + feature_names)
+            if c in dataset.schema.names
+        ]
+        feature_df = dataset.to_table(columns=columns, filter=filter_expr).to_pandas()
+        feature_df = plan.apply_frame(feature_df, entity_columns, time_col)
+    
+    return point_in_time_join(
+        entity_df,
+        feature_df,
+        entity_columns=entity_columns,
+        timestamp_column=timestamp_column,
+        feature_timestamp_column=time_col,
+        feature_names=feature_names,
+        prefix=f"{group.name}:",
+        tiebreak_columns=[INGESTED_AT_COLUMN]
+    )
 
 
 class FeatureStoreService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis_client: Optional[aioredis.Redis] = None):
         self.db = db
-        self.redis_client = aioredis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        self.redis_client = redis_client or get_redis()
         self.offline_path = Path("/app/artifacts/features")
-        self.offline_path.mkdir(parents=True, exist_ok=True)
+        self.offline_store = OfflineFeatureStore(self.offline_path)
+    
+    async def invalidate_group(self, group_id: Optional[int] = None, name: Optional[str] = None):
+        await publish_invalidation(self.redis_client, group_id=group_id, name=name)
     
     async def ingest_features(
         self,
         group_id: int,
         features: Dict[str, Any]
     ):
-        result = await self.db.execute(select(FeatureGroup).where(FeatureGroup.id == group_id))
-        group = result.scalar_one_or_none()
+        await self.ingest_batch(group_id, pa.Table.from_pylist([features]))
+    
+    async def ingest_batch(
+        self,
+        group_id: int,
+        table: pa.Table
+    ) -> int:
+        group = await get_feature_group(self.db, group_id)
         
         if not group:
             raise ValueError("Feature group not found")
         
-        if group.online_enabled:
-            entity_key = features.get(group.entity_columns[0])
-            redis_key = f"features:{group.name}:{entity_key}"
-            await self.redis_client.setex(
-                redis_key,
-                settings.FEATURE_STORE_ONLINE_TTL,
-                json.dumps(features)
+        missing = [col for col in group.entity_columns if col not in table.column_names]
+        if missing:
+            raise ValueError(f"Missing entity columns: {', '.join(missing)}")
+        
+        plan = get_transformation_plan(group)
+        if plan.ingest_steps and table.num_rows:
+            table = await run_in_thread("features.transform", plan.apply_table, table)
+        
+        if group.online_enabled and table.num_rows:
+            await self._write_online(group, table)
+        
+        if group.offline_enabled and table.num_rows:
+            await run_in_thread(
+                "features.offline_ingest",
+                self.offline_store.append,
+                group.name,
+                table
             )
         
-        if group.offline_enabled:
-            offline_file = self.offline_path / f"{group.name}.parquet"
-            df = pd.DataFrame([features])
-            
-            if offline_file.exists():
-                existing_df = pd.read_parquet(offline_file)
-                df = pd.concat([existing_df, df], ignore_index=True)
+        return table.num_rows
+    
+    async def _write_online(self, group: FeatureGroupSpec, table: pa.Table):
+        rows = await run_in_thread(
+            "features.online_encode",
+            _encode_online_rows,
+            table,
+            group
+        )
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for redis_key, payload, ttl in rows:
+                pipe.setex(redis_key, ttl, payload)
+            await pipe.execute()
+        
+        await publish_online_invalidation(
+            self.redis_client,
+            group.name,
+            [redis_key for redis_key, _, _ in rows]
+        )
+    
+    async def materialize(
+        self,
+        group_name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        full: bool = False
+    ) -> Dict[str, Any]:
+        group = await get_feature_group(self.db, name=group_name)
+        
+        if not group:
+            raise ValueError("Feature group not found")
+        if not group.online_enabled:
+            raise ValueError(f"Feature group {group_name} is not online enabled")
+        
+        state = await run_in_thread(
+            "features.materialize_state",
+            self.offline_store.load_state,
+            group.name,
+            MATERIALIZATION_STATE
+        )
+        checkpoint = resume_checkpoint(state, start, end, full)
+        
+        if checkpoint is None:
+            until = time.time_ns() // 1000 - settings.FEATURE_STORE_MATERIALIZATION_SAFETY_SECONDS * 1_000_000
+            checkpoint = {
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "full": full,
+                "since": None if full else state.get("watermark"),
+                "until": max(until, state.get("watermark") or 0),
+                "rows_done": 0
+            }
+        
+        table = await run_in_thread(
+            "features.materialize_plan",
+            build_materialization_table,
+            self.offline_store,
+            group,
+            plan=get_transformation_plan(group),
+            start=start,
+            end=end,
+            since=checkpoint["since"],
+            until=checkpoint["until"]
+        )
+        
+        batch_rows = settings.FEATURE_STORE_MATERIALIZATION_BATCH_ROWS
+        concurrency = settings.FEATURE_STORE_MATERIALIZATION_CONCURRENCY
+        offsets = list(range(checkpoint["rows_done"], table.num_rows, batch_rows))
+        
+        for wave_start in range(0, len(offsets), concurrency):
+            wave = offsets[wave_start:wave_start + concurrency]
+            await asyncio.gather(*(
+                self._write_online(group, table.slice(offset, batch_rows))
+                for offset in wave
+            ))
             
-            df.to_parquet(offline_file, index=False)
+            checkpoint["rows_done"] = min(wave[-1] + batch_rows, table.num_rows)
+            await run_in_thread(
+                "features.materialize_state",
+                self.offline_store.save_state,
+                group.name,
+                MATERIALIZATION_STATE,
+                {**state, "checkpoint": checkpoint}
+            )
+        
+        summary = {
+            "group": group.name,
+            "entities": table.num_rows,
+            "incremental": checkpoint["since"] is not None,
+            "watermark": checkpoint["until"]
+        }
+        await run_in_thread(
+            "features.materialize_state",
+            self.offline_store.save_state,
+            group.name,
+            MATERIALIZATION_STATE,
+            {"watermark": checkpoint["until"], "last_run": summary}
+        )
+        
+        return summary
     
     async def get_online_features(
         self,
         group_id: int,
-        entity_id: str
+        entity_key: EntityKey,
+        max_age_seconds: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
-        result = await self.db.execute(select(FeatureGroup).where(FeatureGroup.id == group_id))
-        group = result.scalar_one_or_none()
+        group = await get_feature_group(self.db, group_id)
         
         if not group:
             return None
         
-        redis_key = f"features:{group.name}:{entity_id}"
-        features_json = await self.redis_client.get(redis_key)
+        redis_key = online_key(group.name, normalize_entity_key(entity_key, group.entity_columns))
+        record = online_feature_cache.get(redis_key)
+        
+        if is_missing(record):
+            payload = await self.redis_client.get(redis_key)
+            record = decode_record(payload) if payload else None
+            if record is not None:
+                online_feature_cache.put(redis_key, group.name, record)
+        
+        if record is None:
+            return None
+        
+        age = record_age(record, time.time())
+        max_age = max_age_seconds if max_age_seconds is not None else group.max_staleness_seconds
+        if max_age is not None and age is not None and age > max_age:
+            return None
         
-        if features_json:
-            return json.loads(features_json)
+        record = get_transformation_plan(group).apply_records([record])[0]
+        return {**record, FRESHNESS_FIELD: age}
+    
+    async def sweep_freshness(self, group: FeatureGroupSpec) -> Dict[str, Any]:
+        now = time.time()
+        ages: List[float] = []
+        untracked = 0
+        cursor = 0
         
-        return None
+        while True:
+            cursor, keys = await self.redis_client.scan(
+                cursor,
+                match=f"features:{group.name}:*",
+                count=settings.FEATURE_STORE_SWEEP_BATCH_SIZE
+            )
+            if keys:
+                for payload in await self.redis_client.mget(keys):
+                    age = record_age(decode_record(payload), now) if payload else None
+                    if age is None:
+                        untracked += int(payload is not None)
+                    else:
+                        ages.append(age)
+            if cursor == 0:
+                break
+        
+        ages_array = np.asarray(ages, dtype="float64")
+        threshold = group.max_staleness_seconds
+        report = {
+            "group": group.name,
+            "swept_at": now,
+            "online_ttl_seconds": online_ttl(group),
+            "max_staleness_seconds": threshold,
+            "entities": len(ages) + untracked,
+            "untracked": untracked,
+            "stale": int((ages_array > threshold).sum()) if threshold is not None else None,
+            "age_p50": float(np.percentile(ages_array, 50)) if len(ages) else None,
+            "age_p99": float(np.percentile(ages_array, 99)) if len(ages) else None,
+            "age_max": float(ages_array.max()) if len(ages) else None
+        }
+        
+        await self.redis_client.hset(FRESHNESS_REPORT_KEY, group.name, json.dumps(report))
+        return report
+    
+    async def get_freshness_report(self, group_name: str) -> Optional[Dict[str, Any]]:
+        report = await self.redis_client.hget(FRESHNESS_REPORT_KEY, group_name)
+        return json.loads(report) if report else None
+    
+    async def _resolve_feature_refs(
+        self,
+        feature_refs: List[str]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, FeatureGroupSpec]]:
+        requested: Dict[str, List[str]] = {}
+        for ref in feature_refs:
+            group_name, sep, feature_name = ref.partition(":")
+            if not sep or not feature_name:
+                raise ValueError(f"Invalid feature reference: {ref}")
+            requested.setdefault(group_name, []).append(feature_name)
+        
+        groups = await get_feature_groups_by_name(self.db, list(requested))
+        
+        unknown = [name for name in requested if name not in groups]
+        if unknown:
+            raise ValueError(f"Unknown feature groups: {', '.join(unknown)}")
+        
+        return requested, groups
+    
+    async def get_online_features_batch(
+        self,
+        entity_ids: List[EntityKey],
+        feature_refs: List[str],
+        max_age_seconds: Optional[float] = None
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, List[Optional[float]]]]:
+        requested, groups = await self._resolve_feature_refs(feature_refs)
+        
+        group_names = list(requested)
+        keys = [
+            online_key(group_name, normalize_entity_key(entity_id, groups[group_name].entity_columns))
+            for group_name in group_names
+            for entity_id in entity_ids
+        ]
+        cached = [online_feature_cache.get(key) for key in keys]
+        missing = [idx for idx, record in enumerate(cached) if is_missing(record)]
+        values = await self.redis_client.mget([keys[idx] for idx in missing]) if missing else []
+        
+        num_entities = len(entity_ids)
+        for idx, value in zip(missing, values):
+            cached[idx] = decode_record(value) if value else None
+            if value:
+                online_feature_cache.put(keys[idx], group_names[idx // num_entities], cached[idx])
+        
+        columns: Dict[str, List[Any]] = {}
+        freshness: Dict[str, List[Optional[float]]] = {}
+        now = time.time()
+        
+        for idx, group_name in enumerate(group_names):
+            group = groups[group_name]
+            max_age = max_age_seconds if max_age_seconds is not None else group.max_staleness_seconds
+            records = cached[idx * num_entities:(idx + 1) * num_entities]
+            ages = [record_age(record, now) if record else None for record in records]
+            
+            if max_age is not None:
+                records = [
+                    None if age is not None and age > max_age else record
+                    for record, age in zip(records, ages)
+                ]
+                ages = [age if record else None for record, age in zip(records, ages)]
+            
+            records = get_transformation_plan(group).apply_records(records)
+            freshness[group_name] = ages
+            
+            names = requested[group_name]
+            if "*" in names:
+                names = [n for n in names if n != "*"] + sorted({
+                    key for record in records if record for key in record
+                } - set(names) - {INGESTED_AT_COLUMN})
+            
+            for feature_name in names:
+                columns[f"{group_name}:{feature_name}"] = [
+                    record.get(feature_name) if record else None
+                    for record in records
+                ]
+        
+        return columns, freshness
     
     async def get_offline_features(
         self,
         group_id: int,
-        entity_ids: list,
+        entity_ids: List[EntityKey],
         feature_names: list = None
     ) -> pd.DataFrame:
-        result = await self.db.execute(select(FeatureGroup).where(FeatureGroup.id == group_id))
-        group = result.scalar_one_or_none()
+        group = await get_feature_group(self.db, group_id)
         
         if not group:
             return pd.DataFrame()
         
-        offline_file = self.offline_path / f"{group.name}.parquet"
-        
-        if not offline_file.exists():
-            return pd.DataFrame()
+        entity_keys = [normalize_entity_key(e, group.entity_columns) for e in entity_ids]
+        table = await run_in_thread(
+            "features.offline_read",
+            _read_entities,
+            self.offline_store,
+            group,
+            entity_keys,
+            feature_names
+        )
         
-        df = pd.read_parquet(offline_file)
-        entity_col = group.entity_columns[0]
-        df = df[df[entity_col].isin(entity_ids)]
+        return table.to_pandas()
+    
+    async def get_historical_features(
+        self,
+        entity_df: pd.DataFrame,
+        feature_refs: List[str],
+        timestamp_column: str = "event_timestamp"
+    ) -> pd.DataFrame:
+        requested, groups = await self._resolve_feature_refs(feature_refs)
+        entity_df = await run_in_thread(
+            "features.historical_prepare",
+            prepare_entity_frame,
+            entity_df,
+            timestamp_column
+        )
         
-        if feature_names:
-            cols = [entity_col] + feature_names
-            df = df[cols]
+        joined = []
+        for group_name, names in requested.items():
+            group = groups[group_name]
+            if "*" in names:
+                names = [n for n in names if n != "*"] + [
+                    f.name for f in group.features if f.name not in names
+                ]
+            
+            missing = [col for col in group.entity_columns if col not in entity_df.columns]
+            if missing:
+                raise ValueError(f"Missing entity columns for {group_name}: {', '.join(missing)}")
+            
+            joined.append(await run_in_thread(
+                "features.historical_join",
+                _join_group_history,
+                self.offline_store,
+                group,
+                names,
+                entity_df,
+                timestamp_column
+            ))
         
-        return df
+        return await run_in_thread(
+            "features.historical_assemble",
+            assemble_training_frame,
+            entity_df,
+            joined
+        )
@@ -0,0 +1,283 @@
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import base64
+import hashlib
+import json
+import os
+import uuid
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pathlib import Path
+from urllib.parse import quote
+
+from backend.core.config import settings
+from backend.utils.dataset_reader import build_filter_expression, coerce_filters
+from backend.utils.dataset_stats import compute_table_stats, merge_stats
+
+MANIFEST_FORMAT_VERSION = 1
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+HASH_BATCH_ROWS = 65536
+
+
+def _hash_table(table: pa.Table) -> str:
+    # Upstream chunking (CSV block size, Parquet row groups) is not part of
+    # the content, so hash a canonical re-chunking of the rows.
+    table = table.combine_chunks()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=HASH_BATCH_ROWS)
+    return hashlib.sha256(sink.getvalue()).hexdigest()
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _partition_value(value: Any) -> str:
+    return HIVE_NULL_PARTITION if value is None else str(value)
+
+
+def _partition_dir(partition: Dict[str, str]) -> str:
+    return "/".join(f"{col}={quote(value, safe='')}" for col, value in partition.items())
+
+
+def _split_by_partition(
+    batch: pa.RecordBatch,
+    partition_columns: List[str]
+) -> Iterator[Tuple[Tuple[str, ...], pa.RecordBatch]]:
+    if not partition_columns:
+        yield (), batch
+        return
+    
+    table = pa.Table.from_batches([batch])
+    keys = table.select(partition_columns).group_by(partition_columns).aggregate([])
+    
+    for values in keys.to_pylist():
+        expression = None
+        for col in partition_columns:
+            field = pc.field(col)
+            predicate = field.is_null() if values[col] is None else field == values[col]
+            expression = predicate if expression is None else expression & predicate
+        
+        part = table.filter(expression).combine_chunks()
+        key = tuple(_partition_value(values[col]) for col in partition_columns)
+        
+        for chunk in part.to_batches():
+            yield key, chunk
+
+
+def serialize_schema(schema: pa.Schema) -> str:
+    return base64.b64encode(schema.serialize().to_pybytes()).decode("ascii")
+
+
+def deserialize_schema(encoded: str) -> pa.Schema:
+    return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(encoded)))
+
+
+class ChunkStore:
+    def __init__(self, root: Path):
+        self.root = root
+        self.chunks_path = root / "chunks"
+        self.manifests_path = root / "manifests"
+        self.chunks_path.mkdir(parents=True, exist_ok=True)
+        self.manifests_path.mkdir(parents=True, exist_ok=True)
+    
+    @classmethod
+    def for_manifest(cls, manifest_path: str) -> "ChunkStore":
+        return cls(Path(manifest_path).parent.parent)
+    
+    def chunk_path(self, entry: Dict[str, Any]) -> Path:
+        return self.chunks_path / entry.get("path", f"{entry['digest']}.parquet")
+    
+    def put_chunk(self, table: pa.Table, partition: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        stats = compute_table_stats(table)
+        
+        if partition:
+            table = table.drop_columns(list(partition))
+        
+        digest = _hash_table(table)
+        relative_path = f"{digest}.parquet"
+        if partition:
+            relative_path = f"{_partition_dir(partition)}/{relative_path}"
+        
+        path = self.chunks_path / relative_path
+        
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _temp_path(path)
+            pq.write_table(table, tmp_path, row_group_size=max(table.num_rows, 1), compression="zstd")
+            os.replace(tmp_path, path)
+        
+        entry = {
+            "digest": digest,
+            "path": relative_path,
+            "num_rows": table.num_rows,
+            "size_bytes": path.stat().st_size,
+            "stats": stats
+        }
+        if partition:
+            entry["partition"] = partition
+        
+        return entry
+    
+    def write_batches(
+        self,
+        schema: pa.Schema,
+        batches: Iterator[pa.RecordBatch],
+        partition_columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        partition_columns = partition_columns or []
+        unknown = [c for c in partition_columns if schema.get_field_index(c) < 0]
+        if unknown:
+            raise ValueError(f"Unknown partition columns: {', '.join(unknown)}")
+        
+        chunk_rows = settings.DATASET_CHUNK_ROWS
+        entries: List[Dict[str, Any]] = []
+        pending: Dict[Tuple[str, ...], List[pa.RecordBatch]] = {}
+        pending_rows: Dict[Tuple[str, ...], int] = {}
+        
+        def flush(key: Tuple[str, ...], num_rows: int):
+            table = pa.Table.from_batches(pending[key], schema)
+            partition = dict(zip(partition_columns, key))
+            entries.append(self.put_chunk(table.slice(0, num_rows), partition))
+            
+            rest = table.slice(num_rows)
+            pending[key] = rest.to_batches()
+            pending_rows[key] = rest.num_rows
+            if not rest.num_rows:
+                del pending[key], pending_rows[key]
+        
+        for batch in batches:
+            for key, part in _split_by_partition(batch, partition_columns):
+                pending.setdefault(key, []).append(part)
+                pending_rows[key] = pending_rows.get(key, 0) + part.num_rows
+                
+                while pending_rows.get(key, 0) >= chunk_rows:
+                    flush(key, chunk_rows)
+            
+            if sum(pending_rows.values()) >= chunk_rows:
+                largest = max(pending_rows, key=pending_rows.get)
+                flush(largest, pending_rows[largest])
+        
+        for key in sorted(pending):
+            flush(key, pending_rows[key])
+        
+        return self.put_manifest(schema, entries, partition_columns)
+    
+    def put_manifest(
+        self,
+        schema: pa.Schema,
+        entries: List[Dict[str, Any]],
+        partition_columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        encoded_schema = serialize_schema(schema)
+        content = hashlib.sha256(encoded_schema.encode("ascii"))
+        for entry in entries:
+            content.update(entry["path"].encode("utf-8"))
+        
+        manifest = {
+            "format_version": MANIFEST_FORMAT_VERSION,
+            "digest": content.hexdigest(),
+            "schema": encoded_schema,
+            "partition_columns": partition_columns or [],
+            "num_rows": sum(entry["num_rows"] for entry in entries),
+            "size_bytes": sum(entry["size_bytes"] for entry in entries),
+            "chunks": entries
+        }
+        
+        path = self.manifest_path(manifest["digest"])
+        if not path.exists():
+            tmp_path = _temp_path(path)
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, path)
+        
+        return manifest
+    
+    def manifest_path(self, digest: str) -> Path:
+        return self.manifests_path / f"{digest}.json"
+    
+    @staticmethod
+    def load_manifest(path: str) -> Dict[str, Any]:
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    @staticmethod
+    def select_chunks(
+        manifest: Dict[str, Any],
+        filters: Optional[List[Tuple[str, str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        entries = manifest["chunks"]
+        partition_columns = manifest.get("partition_columns") or []
+        partition_filters = [f for f in filters or [] if f[0] in partition_columns]
+        
+        if not entries or not partition_filters:
+            return entries
+        
+        schema = deserialize_schema(manifest["schema"])
+        partition_filters = coerce_filters(partition_filters, schema)
+        index = pa.table({
+            col: pa.array(
+                [
+                    None if entry["partition"][col] == HIVE_NULL_PARTITION else entry["partition"][col]
+                    for entry in entries
+                ],
+                pa.string()
+            ).cast(schema.field(col).type)
+            for col in partition_columns
+        })
+        index = index.append_column("_chunk", pa.array(range(len(entries)), pa.int64()))
+        try:
+            selected = index.filter(build_filter_expression(partition_filters)).column("_chunk")
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+            raise ValueError(f"Invalid partition filter: {e}")
+        
+        return [entries[i] for i in selected.to_pylist()]
+    
+    def scan_source(
+        self,
+        manifest: Dict[str, Any],
+        entries: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        entries = manifest["chunks"] if entries is None else entries
+        schema = deserialize_schema(manifest["schema"])
+        source = {
+            "paths": [str(self.chunk_path(entry)) for entry in entries],
+            "schema": schema
+        }
+        
+        partition_columns = manifest.get("partition_columns") or []
+        if partition_columns:
+            source["partitioning"] = ds.HivePartitioning(
+                pa.schema([schema.field(col) for col in partition_columns])
+            )
+            source["partition_base_dir"] = str(self.chunks_path)
+        
+        return source
+    
+    @staticmethod
+    def manifest_stats(
+        manifest: Dict[str, Any],
+        entries: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        entries = manifest["chunks"] if entries is None else entries
+        return merge_stats(entry["stats"] for entry in entries)
+    
+    @staticmethod
+    def partition_index(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+        index: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        
+        for entry in manifest["chunks"]:
+            partition = entry.get("partition")
+            if not partition:
+                continue
+            
+            key = tuple(partition[col] for col in manifest["partition_columns"])
+            summary = index.setdefault(key, {"values": partition, "num_rows": 0, "num_chunks": 0})
+            summary["num_rows"] += entry["num_rows"]
+            summary["num_chunks"] += 1
+        
+        return list(index.values())
@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import json
+import time
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.telemetry import get_meter
+
+ONLINE_INVALIDATION_CHANNEL = "zenith:features:invalidate"
+
+meter = get_meter(__name__)
+near_cache_requests = meter.create_counter(
+    "zenith.feature_store.near_cache.requests",
+    description="Online feature lookups served from or missed by the in-process near-cache"
+)
+
+_MISSING = object()
+
+
+class OnlineFeatureCache:
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled and max_entries > 0
+        self._entries: "OrderedDict[str, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def get(self, key: str) -> Any:
+        if not self.enabled:
+            return _MISSING
+        
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            near_cache_requests.add(1, {"result": "miss"})
+            return _MISSING
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        near_cache_requests.add(1, {"result": "hit"})
+        return entry[2]
+    
+    def put(self, key: str, group_name: str, record: Dict[str, Any]):
+        if not self.enabled:
+            return
+        
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, group_name, record)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, keys: Optional[List[str]] = None, group_name: Optional[str] = None):
+        if keys:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+        
+        if group_name:
+            stale = [key for key, entry in self._entries.items() if entry[1] == group_name]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+online_feature_cache = OnlineFeatureCache(
+    settings.FEATURE_STORE_NEAR_CACHE_SIZE,
+    settings.FEATURE_STORE_NEAR_CACHE_TTL,
+    enabled=settings.FEATURE_STORE_NEAR_CACHE_ENABLED
+)
+
+
+def is_missing(value: Any) -> bool:
+    return value is _MISSING
+
+
+async def publish_online_invalidation(
+    redis_client: aioredis.Redis,
+    group_name: str,
+    keys: List[str]
+):
+    # Always publish: writers (stream worker, Celery) may run with the
+    # near-cache off while API pods have it on, and a publish nobody
+    # listens to is cheap.
+    if len(keys) > settings.FEATURE_STORE_NEAR_CACHE_MAX_INVALIDATION_KEYS:
+        message = {"group": group_name}
+    else:
+        message = {"group": None, "keys": keys}
+    
+    online_feature_cache.invalidate(keys=message.get("keys"), group_name=message["group"])
+    await redis_client.publish(ONLINE_INVALIDATION_CHANNEL, json.dumps(message))
+
+
+def apply_online_invalidation(payload: Dict[str, Any]):
+    online_feature_cache.invalidate(keys=payload.get("keys"), group_name=payload.get("group"))
@@ -0,0 +1,188 @@
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import time
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.redis_pool import get_redis
+from backend.services.feature_cache import (
+    ONLINE_INVALIDATION_CHANNEL, apply_online_invalidation, online_feature_cache
+)
+from backend.models.feature import FeatureGroup, Feature
+from backend.schemas.feature import FeatureGroupSpec, FeatureSpec
+from backend.utils.transformations import TransformationPlan, compile_plan
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "zenith:feature_groups:invalidate"
+
+
+class FeatureGroupCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._by_id: Dict[int, Tuple[float, FeatureGroupSpec]] = {}
+        self._ids_by_name: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, group_id: Optional[int] = None, name: Optional[str] = None) -> Optional[FeatureGroupSpec]:
+        if group_id is None:
+            group_id = self._ids_by_name.get(name)
+        
+        entry = self._by_id.get(group_id) if group_id is not None else None
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, spec: FeatureGroupSpec):
+        self.invalidate(spec.id)
+        self._by_id[spec.id] = (time.monotonic() + self.ttl_seconds, spec)
+        self._ids_by_name[spec.name] = spec.id
+    
+    def invalidate(self, group_id: Optional[int] = None, name: Optional[str] = None):
+        if group_id is None:
+            group_id = self._ids_by_name.get(name)
+        
+        entry = self._by_id.pop(group_id, None) if group_id is not None else None
+        if entry:
+            self._ids_by_name.pop(entry[1].name, None)
+        if name:
+            self._ids_by_name.pop(name, None)
+    
+    def clear(self):
+        self._by_id.clear()
+        self._ids_by_name.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._by_id), "hits": self.hits, "misses": self.misses}
+
+
+feature_group_cache = FeatureGroupCache(settings.FEATURE_STORE_METADATA_TTL)
+
+
+_transformation_plans: Dict[int, Tuple[int, TransformationPlan]] = {}
+
+
+def get_transformation_plan(group: FeatureGroupSpec) -> TransformationPlan:
+    cached = _transformation_plans.get(group.id)
+    if cached and cached[0] == group.version:
+        return cached[1]
+    
+    plan = compile_plan({
+        feature.name: feature.transformation
+        for feature in group.features
+        if feature.transformation
+    })
+    _transformation_plans[group.id] = (group.version, plan)
+    return plan
+
+
+async def _load_groups(db: AsyncSession, condition) -> List[FeatureGroupSpec]:
+    result = await db.execute(select(FeatureGroup).where(condition))
+    groups = result.scalars().all()
+    if not groups:
+        return []
+    
+    result = await db.execute(
+        select(Feature).where(Feature.feature_group_id.in_([group.id for group in groups]))
+    )
+    features: Dict[int, List[FeatureSpec]] = {}
+    for feature in result.scalars().all():
+        features.setdefault(feature.feature_group_id, []).append(FeatureSpec.model_validate(feature))
+    
+    specs = []
+    for group in groups:
+        spec = FeatureGroupSpec.model_validate(group).model_copy(
+            update={"features": features.get(group.id, [])}
+        )
+        feature_group_cache.put(spec)
+        specs.append(spec)
+    
+    return specs
+
+
+async def get_feature_group(
+    db: AsyncSession,
+    group_id: Optional[int] = None,
+    name: Optional[str] = None
+) -> Optional[FeatureGroupSpec]:
+    spec = feature_group_cache.get(group_id=group_id, name=name)
+    if spec:
+        return spec
+    
+    condition = FeatureGroup.id == group_id if group_id is not None else FeatureGroup.name == name
+    specs = await _load_groups(db, condition)
+    return specs[0] if specs else None
+
+
+async def get_feature_groups_by_name(db: AsyncSession, names: List[str]) -> Dict[str, FeatureGroupSpec]:
+    specs = {}
+    missing = []
+    
+    for name in names:
+        spec = feature_group_cache.get(name=name)
+        if spec:
+            specs[name] = spec
+        else:
+            missing.append(name)
+    
+    if missing:
+        for spec in await _load_groups(db, FeatureGroup.name.in_(missing)):
+            specs[spec.name] = spec
+    
+    return specs
+
+
+async def publish_invalidation(
+    redis_client: aioredis.Redis,
+    group_id: Optional[int] = None,
+    name: Optional[str] = None
+):
+    feature_group_cache.invalidate(group_id=group_id, name=name)
+    await redis_client.publish(
+        INVALIDATION_CHANNEL,
+        json.dumps({"group_id": group_id, "name": name})
+    )
+
+
+async def listen_for_invalidations(redis_client: Optional[aioredis.Redis] = None):
+    while True:
+        try:
+            async with (redis_client or get_redis()).pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL, ONLINE_INVALIDATION_CHANNEL)
+                feature_group_cache.clear()
+                online_feature_cache.clear()
+                
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    payload = json.loads(message["data"])
+                    
+                    if channel == ONLINE_INVALIDATION_CHANNEL:
+                        apply_online_invalidation(payload)
+                        continue
+                    
+                    feature_group_cache.invalidate(
+                        group_id=payload.get("group_id"),
+                        name=payload.get("name")
+                    )
+                    if payload.get("name"):
+                        online_feature_cache.invalidate(group_name=payload["name"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Feature group invalidation listener disconnected")
+            feature_group_cache.clear()
+            online_feature_cache.clear()
+            await asyncio.sleep(1)
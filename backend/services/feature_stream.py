@@ -0,0 +1,290 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import socket
+import pyarrow as pa
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from backend.core.config import settings
+from backend.core.database import async_session_maker
+from backend.core.redis_pool import get_redis
+from backend.core.telemetry import get_meter
+from backend.services.data import FeatureStoreService
+from backend.services.feature_registry import get_feature_group
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY_PREFIX = "zenith:features:stream:"
+CONSUMER_GROUP = "zenith-feature-ingest"
+
+meter = get_meter(__name__)
+stream_messages = meter.create_counter(
+    "zenith.feature_stream.messages",
+    description="Feature stream messages processed by outcome"
+)
+stream_batch_size = meter.create_histogram(
+    "zenith.feature_stream.batch.size",
+    description="Rows per micro-batch written from the feature stream"
+)
+
+_consumer_lag: Dict[str, Dict[str, int]] = {}
+
+
+def _observe_lag(options: CallbackOptions) -> Iterable[Observation]:
+    return [
+        Observation(stats["lag"], {"group": group_name})
+        for group_name, stats in _consumer_lag.items()
+    ]
+
+
+def _observe_pending(options: CallbackOptions) -> Iterable[Observation]:
+    return [
+        Observation(stats["pending"], {"group": group_name})
+        for group_name, stats in _consumer_lag.items()
+    ]
+
+
+meter.create_observable_gauge(
+    "zenith.feature_stream.lag",
+    callbacks=[_observe_lag],
+    description="Stream entries not yet delivered to the ingest consumer group"
+)
+meter.create_observable_gauge(
+    "zenith.feature_stream.pending",
+    callbacks=[_observe_pending],
+    description="Stream entries delivered but not yet acknowledged"
+)
+
+
+def stream_key(group_name: str) -> str:
+    return f"{STREAM_KEY_PREFIX}{group_name}"
+
+
+def dead_letter_key(group_name: str) -> str:
+    return f"{stream_key(group_name)}:dead"
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class FeatureStreamConsumer:
+    def __init__(
+        self,
+        group_names: List[str],
+        consumer_name: Optional[str] = None,
+        redis_client: Optional[aioredis.Redis] = None,
+        batch_size: int = settings.FEATURE_STREAM_BATCH_SIZE,
+        linger_ms: int = settings.FEATURE_STREAM_LINGER_MS
+    ):
+        self.group_names = group_names
+        self.consumer_name = consumer_name or socket.gethostname()
+        self.redis_client = redis_client or get_redis()
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self._stopping = asyncio.Event()
+    
+    def stop(self):
+        self._stopping.set()
+    
+    async def _ensure_groups(self):
+        for group_name in self.group_names:
+            try:
+                await self.redis_client.xgroup_create(
+                    stream_key(group_name),
+                    CONSUMER_GROUP,
+                    id="0",
+                    mkstream=True
+                )
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+    
+    async def run(self):
+        await self._ensure_groups()
+        loop = asyncio.get_running_loop()
+        next_maintenance = 0.0
+        
+        while not self._stopping.is_set():
+            try:
+                if loop.time() >= next_maintenance:
+                    await self._reclaim()
+                    await self.refresh_lag()
+                    next_maintenance = loop.time() + settings.FEATURE_STREAM_MAINTENANCE_INTERVAL
+                
+                entries = await self._read_batch()
+                if entries:
+                    await self._process(entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Feature stream consumer iteration failed")
+                await asyncio.sleep(1)
+    
+    async def _read_batch(self) -> List[Tuple[str, bytes, Dict[bytes, bytes]]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.linger_ms / 1000
+        streams = {stream_key(name): ">" for name in self.group_names}
+        entries: List[Tuple[str, bytes, Dict[bytes, bytes]]] = []
+        
+        while len(entries) < self.batch_size and not self._stopping.is_set():
+            remaining_ms = int((deadline - loop.time()) * 1000)
+            if remaining_ms <= 0:
+                break
+            
+            response = await self.redis_client.xreadgroup(
+                CONSUMER_GROUP,
+                self.consumer_name,
+                streams,
+                count=self.batch_size - len(entries),
+                block=remaining_ms
+            )
+            if not response:
+                break
+            
+            for key, messages in response:
+                group_name = _decode(key)[len(STREAM_KEY_PREFIX):]
+                entries.extend((group_name, message_id, fields) for message_id, fields in messages)
+        
+        return entries
+    
+    async def _reclaim(self):
+        for group_name in self.group_names:
+            _, messages, *rest = await self.redis_client.xautoclaim(
+                stream_key(group_name),
+                CONSUMER_GROUP,
+                self.consumer_name,
+                min_idle_time=settings.FEATURE_STREAM_CLAIM_IDLE_MS,
+                count=self.batch_size
+            )
+            # Redis 7 returns ids of pending entries trimmed from the stream
+            # separately; they can never be delivered, so just clear them.
+            deleted = rest[0] if rest else []
+            if deleted:
+                await self.redis_client.xack(stream_key(group_name), CONSUMER_GROUP, *deleted)
+            if messages:
+                await self._process([(group_name, message_id, fields) for message_id, fields in messages])
+    
+    async def _process(self, entries: List[Tuple[str, bytes, Dict[bytes, bytes]]]):
+        by_group: Dict[str, List[Tuple[bytes, Dict[bytes, bytes]]]] = {}
+        for group_name, message_id, fields in entries:
+            by_group.setdefault(group_name, []).append((message_id, fields))
+        
+        for group_name, messages in by_group.items():
+            await self._ingest_group(group_name, messages)
+    
+    async def _ingest_group(self, group_name: str, messages: List[Tuple[bytes, Dict[bytes, bytes]]]):
+        rows: List[Dict[str, Any]] = []
+        row_ids: List[bytes] = []
+        rejected: List[Tuple[bytes, str]] = []
+        deleted: List[bytes] = []
+        
+        for message_id, fields in messages:
+            if fields is None:
+                # Claimed after the entry was trimmed; nothing left to ingest.
+                deleted.append(message_id)
+                continue
+            try:
+                row = json.loads(fields[b"data"])
+                if not isinstance(row, dict):
+                    raise ValueError("expected a JSON object")
+                rows.append(row)
+                row_ids.append(message_id)
+            except (KeyError, TypeError, ValueError) as e:
+                rejected.append((message_id, f"Invalid message: {e}"))
+        
+        if rows:
+            failures = await self._ingest_rows(group_name, rows)
+            if failures is not None:
+                rejected.extend((row_ids[idx], error) for idx, error in failures)
+                failed = {idx for idx, _ in failures}
+                row_ids = [message_id for idx, message_id in enumerate(row_ids) if idx not in failed]
+        
+        if rejected:
+            await self._dead_letter(group_name, messages, rejected)
+        
+        ids = row_ids + [message_id for message_id, _ in rejected] + deleted
+        await self.redis_client.xack(stream_key(group_name), CONSUMER_GROUP, *ids)
+        
+        stream_batch_size.record(len(row_ids), {"group": group_name})
+        stream_messages.add(len(row_ids), {"group": group_name, "outcome": "ingested"})
+        stream_messages.add(len(rejected), {"group": group_name, "outcome": "dead_lettered"})
+        stream_messages.add(len(deleted), {"group": group_name, "outcome": "deleted"})
+    
+    async def _write(self, group_name: str, rows: List[Dict[str, Any]]):
+        async with async_session_maker() as session:
+            group = await get_feature_group(session, name=group_name)
+            if not group:
+                raise ValueError(f"Unknown feature group: {group_name}")
+            
+            await FeatureStoreService(session, self.redis_client).ingest_batch(
+                group.id,
+                pa.Table.from_pylist(rows)
+            )
+    
+    async def _ingest_rows(
+        self,
+        group_name: str,
+        rows: List[Dict[str, Any]]
+    ) -> Optional[List[Tuple[int, str]]]:
+        try:
+            await self._write(group_name, rows)
+            return None
+        except ValueError as e:
+            if len(rows) == 1:
+                return [(0, str(e))]
+        
+        # One bad row rejects the whole micro-batch; retry row by row so only
+        # the offending messages are dead-lettered.
+        failures = []
+        for idx, row in enumerate(rows):
+            try:
+                await self._write(group_name, [row])
+            except ValueError as e:
+                failures.append((idx, str(e)))
+        return failures
+    
+    async def _dead_letter(
+        self,
+        group_name: str,
+        messages: List[Tuple[bytes, Dict[bytes, bytes]]],
+        rejected: List[Tuple[bytes, str]]
+    ):
+        fields_by_id = dict(messages)
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for message_id, error in rejected:
+                pipe.xadd(
+                    dead_letter_key(group_name),
+                    {
+                        "id": message_id,
+                        "error": error,
+                        "data": (fields_by_id.get(message_id) or {}).get(b"data", b"")
+                    },
+                    maxlen=settings.FEATURE_STREAM_MAXLEN,
+                    approximate=True
+                )
+            await pipe.execute()
+    
+    async def refresh_lag(self) -> Dict[str, Dict[str, int]]:
+        for group_name in self.group_names:
+            _consumer_lag[group_name] = await stream_lag(self.redis_client, group_name)
+        
+        return dict(_consumer_lag)
+
+
+async def stream_lag(redis_client: aioredis.Redis, group_name: str) -> Dict[str, int]:
+    try:
+        groups = await redis_client.xinfo_groups(stream_key(group_name))
+    except ResponseError:
+        groups = []
+    
+    for info in groups:
+        if _decode(info["name"]) == CONSUMER_GROUP:
+            return {"lag": info.get("lag") or 0, "pending": info.get("pending") or 0}
+    
+    return {"lag": 0, "pending": 0}
+
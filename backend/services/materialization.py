@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from backend.schemas.feature import FeatureGroupSpec
+from backend.services.offline_store import INGESTED_AT_COLUMN, OfflineFeatureStore
+from backend.utils.entity_keys import entity_key_mask
+from backend.utils.transformations import TransformationPlan
+
+MATERIALIZATION_STATE = "materialization"
+
+
+def _timestamp_scalar(value: Any, data_type: pa.DataType) -> pa.Scalar:
+    if isinstance(value, int):
+        return pa.scalar(value, pa.timestamp("us", tz="UTC")).cast(data_type)
+    return pa.scalar(value, data_type)
+
+
+def latest_per_entity(table: pa.Table, entity_columns: List[str], time_column: str) -> pa.Table:
+    order = [(col, "ascending") for col in entity_columns] + [(time_column, "descending")]
+    if time_column != INGESTED_AT_COLUMN and INGESTED_AT_COLUMN in table.column_names:
+        order.append((INGESTED_AT_COLUMN, "descending"))
+    
+    table = table.sort_by(order)
+    first = ~table.select(entity_columns).to_pandas().duplicated(keep="first")
+    return table.filter(pa.array(first.to_numpy()))
+
+
+def build_materialization_table(
+    offline_store: OfflineFeatureStore,
+    group: FeatureGroupSpec,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+    plan: Optional[TransformationPlan] = None
+) -> pa.Table:
+    dataset = offline_store.dataset(group.name)
+    entity_columns = group.entity_columns
+    time_column = group.event_time_column or INGESTED_AT_COLUMN
+    
+    if dataset is None or any(
+        col not in dataset.schema.names for col in entity_columns + [time_column]
+    ):
+        return pa.table({})
+    
+    window = None
+    if (start or end) and not pa.types.is_timestamp(dataset.schema.field(time_column).type):
+        raise ValueError(f"Event time column {time_column} is not a timestamp")
+    if start:
+        window = pc.field(time_column) >= _timestamp_scalar(start, dataset.schema.field(time_column).type)
+    if end:
+        predicate = pc.field(time_column) <= _timestamp_scalar(end, dataset.schema.field(time_column).type)
+        window = predicate if window is None else window & predicate
+    
+    if INGESTED_AT_COLUMN in dataset.schema.names and until is not None:
+        ingested_type = dataset.schema.field(INGESTED_AT_COLUMN).type
+        predicate = pc.field(INGESTED_AT_COLUMN) <= _timestamp_scalar(until, ingested_type)
+        window = predicate if window is None else window & predicate
+        
+        if since is not None:
+            changed_filter = pc.field(INGESTED_AT_COLUMN) > _timestamp_scalar(since, ingested_type)
+            changed = dataset.to_table(
+                columns=entity_columns,
+                filter=window & changed_filter
+            ).group_by(entity_columns).aggregate([])
+            
+            if not changed.num_rows:
+                return pa.table({})
+            
+            for col in entity_columns:
+                window &= pc.field(col).isin(changed.column(col).unique())
+            
+            table = dataset.to_table(filter=window)
+            if len(entity_columns) > 1:
+                changed_keys = list(zip(*(changed.column(col).to_pylist() for col in entity_columns)))
+                table = table.filter(entity_key_mask(table, changed_keys, entity_columns))
+            return _online_view(table, entity_columns, time_column, plan)
+    
+    table = dataset.to_table(filter=window)
+    if not table.num_rows:
+        return table
+    
+    return _online_view(table, entity_columns, time_column, plan)
+
+
+def _online_view(
+    table: pa.Table,
+    entity_columns: List[str],
+    time_column: str,
+    plan: Optional[TransformationPlan]
+) -> pa.Table:
+    if plan:
+        df = plan.apply_frame(table.to_pandas(), entity_columns, time_column, include_on_demand=False)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    return latest_per_entity(table, entity_columns, time_column)
+
+
+def resume_checkpoint(
+    state: Dict[str, Any],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    full: bool
+) -> Optional[Dict[str, Any]]:
+    checkpoint = state.get("checkpoint")
+    if not checkpoint:
+        return None
+    
+    requested = {
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+        "full": full
+    }
+    if any(checkpoint.get(key) != value for key, value in requested.items()):
+        return None
+    
+    return checkpoint
@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional
+import os
+import uuid
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pathlib import Path
+
+from backend.core.config import settings
+from backend.services.offline_store import _write_parquet_atomic
+
+METRIC_ARCHIVE_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("key", pa.string()),
+    ("value", pa.float64()),
+    ("timestamp", pa.timestamp("us")),
+    ("step", pa.int64())
+])
+
+
+def summarize_archive(table: pa.Table) -> List[Dict[str, Any]]:
+    # The table is sorted by key, step and id, so with ordered (single
+    # threaded) grouping "last" is the latest point of each metric.
+    summary = table.group_by("key", use_threads=False).aggregate([
+        ("value", "last"),
+        ("step", "last"),
+        ("value", "min"),
+        ("value", "max"),
+        ("value", "sum"),
+        ("value", "count")
+    ])
+    return summary.to_pylist()
+
+
+class MetricArchive:
+    def __init__(self, root: Path):
+        self.root = root
+    
+    def _path(self, name: str) -> Path:
+        return self.root / name
+    
+    def build(self, tables: List[pa.Table], previous: Optional[str] = None) -> pa.Table:
+        if previous:
+            tables = [self.read(previous)] + tables
+        
+        # Sorted by key and step, each row group covers a narrow key/step
+        # range, so reads for one metric or a step window skip the rest.
+        return pa.concat_tables(tables).sort_by([
+            ("key", "ascending"),
+            ("step", "ascending"),
+            ("id", "ascending")
+        ])
+    
+    def write(self, run_id: int, table: pa.Table) -> str:
+        name = f"{run_id // 1000:06d}/run-{run_id}-{uuid.uuid4().hex[:8]}.parquet"
+        path = self._path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_parquet_atomic(
+            table,
+            path,
+            row_group_size=settings.METRIC_ARCHIVE_ROW_GROUP_SIZE,
+            use_byte_stream_split=["value"]
+        )
+        return name
+    
+    def read(
+        self,
+        name: str,
+        keys: Optional[List[str]] = None,
+        step_min: Optional[int] = None,
+        step_max: Optional[int] = None,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        conditions = []
+        if keys:
+            conditions.append(pc.field("key").isin(keys))
+        if step_min is not None:
+            conditions.append(pc.field("step") >= step_min)
+        if step_max is not None:
+            conditions.append(pc.field("step") <= step_max)
+        
+        filter_expr = None
+        for condition in conditions:
+            filter_expr = condition if filter_expr is None else filter_expr & condition
+        
+        return pq.read_table(self._path(name), columns=columns, filters=filter_expr)
+    
+    def read_runs(
+        self,
+        archives: Dict[int, str],
+        keys: Optional[List[str]] = None,
+        step_min: Optional[int] = None,
+        step_max: Optional[int] = None,
+        columns: Optional[List[str]] = None
+    ) -> Dict[int, pa.Table]:
+        return {
+            run_id: self.read(name, keys, step_min, step_max, columns)
+            for run_id, name in archives.items()
+        }
+    
+    def remove(self, name: str):
+        self._path(name).unlink(missing_ok=True)
+    
+    def retire(self, name: str):
+        # Readers may still hold the old name; stamp the retirement time so
+        # garbage collection keeps the file for a grace period from now.
+        try:
+            os.utime(self._path(name))
+        except FileNotFoundError:
+            pass
+    
+    def stale_names(self, older_than: float) -> List[str]:
+        return [
+            str(path.relative_to(self.root))
+            for path in self.root.glob("*/*.parquet")
+            if path.stat().st_mtime < older_than
+        ]
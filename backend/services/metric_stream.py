@@ -0,0 +1,163 @@
+from typing import Any, Dict, Optional, Set, Tuple
+import asyncio
+import json
+import logging
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.redis_pool import get_redis
+from backend.core.telemetry import get_meter
+
+logger = logging.getLogger(__name__)
+
+RUN_CHANNEL_PREFIX = "zenith:metrics:run:"
+
+meter = get_meter(__name__)
+stream_events_dropped = meter.create_counter(
+    "zenith.metric_stream.dropped",
+    description="Live metric events dropped because a subscriber fell behind"
+)
+
+StreamEvent = Tuple[str, str]
+
+
+def run_channel(run_id: int) -> str:
+    return f"{RUN_CHANNEL_PREFIX}{run_id}"
+
+
+class MetricStreamSaturatedError(RuntimeError):
+    pass
+
+
+class MetricSubscription:
+    def __init__(self, run_id: int, max_queue: int):
+        self.run_id = run_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+    
+    def offer(self, event: StreamEvent):
+        # A slow client must never stall the fan-out; drop its oldest event
+        # and let it know how many points to backfill from history.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            stream_events_dropped.add(1)
+        self.queue.put_nowait(event)
+    
+    async def next_event(self, timeout: float) -> Optional[StreamEvent]:
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return "gap", json.dumps({"dropped_events": dropped})
+        
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class MetricStreamHub:
+    def __init__(self, max_queue: int, max_subscribers: int):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self._subscribers: Dict[int, Set[MetricSubscription]] = {}
+        self._changed = asyncio.Event()
+        self.delivered = 0
+    
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+    
+    def has_capacity(self) -> bool:
+        return self.subscriber_count < self.max_subscribers
+    
+    def subscribe(self, run_id: int) -> MetricSubscription:
+        if not self.has_capacity():
+            raise MetricStreamSaturatedError("Too many live metric subscribers")
+        
+        subscription = MetricSubscription(run_id, self.max_queue)
+        self._subscribers.setdefault(run_id, set()).add(subscription)
+        self._changed.set()
+        return subscription
+    
+    def unsubscribe(self, subscription: MetricSubscription):
+        subscriptions = self._subscribers.get(subscription.run_id)
+        if subscriptions is None:
+            return
+        
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.run_id]
+            self._changed.set()
+    
+    def dispatch(self, run_id: int, event: StreamEvent):
+        for subscription in self._subscribers.get(run_id, ()):
+            subscription.offer(event)
+            self.delivered += 1
+    
+    def _dispatch_message(self, message: Dict[str, Any]):
+        payload = json.loads(message["data"])
+        self.dispatch(payload["run_id"], (payload["event"], json.dumps(payload["data"])))
+    
+    async def listen(self, redis_client: Optional[aioredis.Redis] = None):
+        while True:
+            try:
+                async with (redis_client or get_redis()).pubsub() as pubsub:
+                    subscribed: Set[str] = set()
+                    
+                    while True:
+                        self._changed.clear()
+                        wanted = {run_channel(run_id) for run_id in self._subscribers}
+                        if wanted - subscribed:
+                            await pubsub.subscribe(*(wanted - subscribed))
+                        if subscribed - wanted:
+                            await pubsub.unsubscribe(*(subscribed - wanted))
+                        subscribed = wanted
+                        
+                        if not subscribed:
+                            await self._changed.wait()
+                            continue
+                        
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.5)
+                        if message and message["type"] == "message":
+                            self._dispatch_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Live metric listener disconnected")
+                await asyncio.sleep(1)
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "runs": len(self._subscribers),
+            "subscribers": self.subscriber_count,
+            "delivered_events": self.delivered,
+            "lagging_subscribers": sum(
+                1
+                for subscriptions in self._subscribers.values()
+                for subscription in subscriptions
+                if subscription.queue.full()
+            )
+        }
+
+
+async def publish_run_event(
+    run_id: int,
+    event: str,
+    data: Dict[str, Any],
+    redis_client: Optional[aioredis.Redis] = None
+):
+    try:
+        await (redis_client or get_redis()).publish(
+            run_channel(run_id),
+            json.dumps({"run_id": run_id, "event": event, "data": data})
+        )
+    except Exception:
+        # Live updates are best effort; ingest must not fail because of them.
+        logger.warning("Failed to publish %s event for run %s", event, run_id, exc_info=True)
+
+
+def format_sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+metric_stream_hub = MetricStreamHub(settings.METRIC_STREAM_QUEUE_SIZE, settings.METRIC_STREAM_MAX_SUBSCRIBERS)
@@ -0,0 +1,231 @@
+from typing import Dict, Any, List, Optional
+import fcntl
+import json
+import os
+import time
+import uuid
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pathlib import Path
+
+from backend.core.config import settings
+
+INGESTED_AT_COLUMN = "_ingested_at"
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _write_parquet_atomic(table: pa.Table, path: Path, **kwargs):
+    tmp_path = _temp_path(path)
+    pq.write_table(table, tmp_path, compression="zstd", **kwargs)
+    os.replace(tmp_path, path)
+
+
+def _write_json_atomic(data: Dict[str, Any], path: Path):
+    tmp_path = _temp_path(path)
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class OfflineFeatureStore:
+    def __init__(self, root: Path):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def _group_path(self, group_name: str) -> Path:
+        return self.root / group_name
+    
+    def _segments_path(self, group_name: str) -> Path:
+        path = self._group_path(group_name) / "segments"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    
+    def _parts_path(self, group_name: str) -> Path:
+        path = self._group_path(group_name) / "parts"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    
+    def _manifest_path(self, group_name: str) -> Path:
+        return self._group_path(group_name) / "_manifest.json"
+    
+    def _legacy_path(self, group_name: str) -> Path:
+        return self.root / f"{group_name}.parquet"
+    
+    def load_manifest(self, group_name: str) -> Dict[str, Any]:
+        path = self._manifest_path(group_name)
+        if not path.exists():
+            return {"parts": [], "compacted_segments": {}}
+        
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    def _write_manifest(self, group_name: str, manifest: Dict[str, Any]):
+        _write_json_atomic(manifest, self._manifest_path(group_name))
+    
+    def _state_path(self, group_name: str, name: str) -> Path:
+        return self._group_path(group_name) / f"_{name}.json"
+    
+    def load_state(self, group_name: str, name: str) -> Dict[str, Any]:
+        path = self._state_path(group_name, name)
+        if not path.exists():
+            return {}
+        
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    def save_state(self, group_name: str, name: str, state: Dict[str, Any]):
+        self._group_path(group_name).mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(state, self._state_path(group_name, name))
+    
+    def append(self, group_name: str, table: pa.Table) -> Path:
+        if INGESTED_AT_COLUMN not in table.column_names:
+            table = table.append_column(
+                INGESTED_AT_COLUMN,
+                pa.array([time.time_ns() // 1000] * table.num_rows, pa.timestamp("us", tz="UTC"))
+            )
+        
+        segment_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        path = self._segments_path(group_name) / f"{segment_id}.parquet"
+        _write_parquet_atomic(table, path)
+        return path
+    
+    def list_files(self, group_name: str) -> List[str]:
+        manifest = self.load_manifest(group_name)
+        parts_path = self._parts_path(group_name)
+        compacted = manifest["compacted_segments"]
+        
+        files = [str(parts_path / part) for part in manifest["parts"]]
+        files.extend(
+            str(path)
+            for path in sorted(self._segments_path(group_name).glob("*.parquet"))
+            if path.name not in compacted
+        )
+        
+        legacy_path = self._legacy_path(group_name)
+        if legacy_path.exists():
+            files.insert(0, str(legacy_path))
+        
+        return files
+    
+    def dataset(self, group_name: str) -> Optional[ds.Dataset]:
+        files = self.list_files(group_name)
+        if not files:
+            return None
+        
+        schema = pa.unify_schemas(
+            [pq.read_schema(path) for path in files],
+            promote_options="permissive"
+        )
+        return ds.dataset(files, schema=schema, format="parquet")
+    
+    def read(
+        self,
+        group_name: str,
+        columns: Optional[List[str]] = None,
+        filter_expr: Optional[ds.Expression] = None
+    ) -> pa.Table:
+        dataset = self.dataset(group_name)
+        if dataset is None:
+            return pa.table({})
+        
+        if columns:
+            columns = [c for c in columns if c in dataset.schema.names]
+        
+        return dataset.to_table(columns=columns, filter=filter_expr)
+    
+    def compact(self, group_name: str, sort_columns: List[str]) -> Optional[Dict[str, Any]]:
+        group_path = self._group_path(group_name)
+        if not group_path.exists():
+            return None
+        
+        with open(group_path / ".compaction.lock", "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None
+            
+            try:
+                return self._compact_locked(group_name, sort_columns)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _compact_locked(self, group_name: str, sort_columns: List[str]) -> Dict[str, Any]:
+        manifest = self.load_manifest(group_name)
+        compacted = manifest["compacted_segments"]
+        segments = [
+            path for path in sorted(self._segments_path(group_name).glob("*.parquet"))
+            if path.name not in compacted
+        ]
+        
+        new_parts: List[str] = []
+        merged_segments: List[str] = []
+        batch: List[Path] = []
+        batch_rows = 0
+        
+        def flush():
+            if not batch:
+                return
+            
+            schema = pa.unify_schemas(
+                [pq.read_schema(path) for path in batch],
+                promote_options="permissive"
+            )
+            table = ds.dataset([str(path) for path in batch], schema=schema, format="parquet").to_table()
+            keys = [c for c in sort_columns + [INGESTED_AT_COLUMN] if c in table.column_names]
+            if keys:
+                table = table.sort_by([(key, "ascending") for key in keys])
+            
+            part_name = f"part-{batch[-1].stem}.parquet"
+            _write_parquet_atomic(
+                table,
+                self._parts_path(group_name) / part_name,
+                row_group_size=settings.FEATURE_STORE_ROW_GROUP_SIZE
+            )
+            new_parts.append(part_name)
+            merged_segments.extend(path.name for path in batch)
+        
+        for path in segments:
+            num_rows = pq.ParquetFile(path).metadata.num_rows
+            if batch and batch_rows + num_rows > settings.FEATURE_STORE_COMPACTION_MAX_ROWS:
+                flush()
+                batch, batch_rows = [], 0
+            batch.append(path)
+            batch_rows += num_rows
+        flush()
+        
+        compacted_at = time.time()
+        compacted = self._collect_garbage(group_name, compacted)
+        compacted.update((name, compacted_at) for name in merged_segments)
+        
+        manifest = {
+            "parts": manifest["parts"] + new_parts,
+            "compacted_segments": compacted
+        }
+        self._write_manifest(group_name, manifest)
+        
+        return {
+            "group": group_name,
+            "segments_compacted": len(merged_segments),
+            "parts_written": len(new_parts),
+            "total_parts": len(manifest["parts"])
+        }
+    
+    def _collect_garbage(self, group_name: str, compacted: Dict[str, float]) -> Dict[str, float]:
+        cutoff = time.time() - settings.FEATURE_STORE_COMPACTION_GRACE_SECONDS
+        retained = {}
+        
+        for name, compacted_at in compacted.items():
+            path = self._segments_path(group_name) / name
+            if compacted_at >= cutoff:
+                retained[name] = compacted_at
+            else:
+                path.unlink(missing_ok=True)
+        
+        return retained
+    
+    def group_names(self) -> List[str]:
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir())
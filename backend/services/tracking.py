@@ -0,0 +1,859 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+import asyncio
+import logging
+import math
+import operator
+import time
+import numpy as np
+import pyarrow as pa
+from pathlib import Path
+from sqlalchemy import case, delete, exists, func, insert, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from backend.core.config import settings
+from backend.core.database import async_session_maker
+from backend.core.executor import run_in_thread
+from backend.core.telemetry import get_meter
+from backend.models.experiment import ExperimentRun, Metric, MetricSummary, Parameter, RunStatus
+from backend.services.metric_archive import METRIC_ARCHIVE_SCHEMA, MetricArchive, summarize_archive
+from backend.services.metric_stream import publish_run_event
+from backend.schemas.experiment import MetricBatch
+from backend.utils.dataset_reader import ARROW_STREAM_MEDIA_TYPE
+from backend.utils.downsample import downsample
+from backend.utils.run_search import SearchClause
+
+logger = logging.getLogger(__name__)
+
+METRIC_COLUMNS = ["run_id", "key", "value", "timestamp", "step"]
+ALIGN_METHODS = ("linear", "previous")
+TERMINAL_RUN_STATUSES = (RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.STOPPED)
+SEARCH_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+
+MetricSeriesMap = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+meter = get_meter(__name__)
+metric_points = meter.create_counter(
+    "zenith.tracking.metric_points",
+    description="Metric points written to the tracking store"
+)
+archived_points = meter.create_counter(
+    "zenith.tracking.archived_points",
+    description="Metric points moved from the metrics table to Parquet archives"
+)
+
+metric_archive = MetricArchive(Path("/app/artifacts/metrics"))
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class MetricColumns:
+    def __init__(
+        self,
+        keys: Sequence[str],
+        values: np.ndarray,
+        steps: np.ndarray,
+        timestamps: Optional[Sequence[datetime]] = None
+    ):
+        if not (len(keys) == len(values) == len(steps)):
+            raise ValueError("keys, values and steps must have the same length")
+        if timestamps is not None and len(timestamps) != len(values):
+            raise ValueError("timestamps must have the same length as values")
+        
+        self.keys = list(keys)
+        self.values = np.asarray(values, dtype="float64")
+        self.steps = np.asarray(steps, dtype="int64")
+        self.timestamps = list(timestamps) if timestamps is not None else None
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> "MetricColumns":
+        missing = [c for c in ("key", "value") if c not in table.column_names]
+        if missing:
+            raise ValueError(f"Missing metric columns: {', '.join(missing)}")
+        
+        steps = (
+            table.column("step").fill_null(0).to_numpy()
+            if "step" in table.column_names
+            else np.zeros(table.num_rows, dtype="int64")
+        )
+        timestamps = (
+            table.column("timestamp").to_pylist()
+            if "timestamp" in table.column_names
+            else None
+        )
+        return cls(
+            table.column("key").to_pylist(),
+            table.column("value").to_numpy(zero_copy_only=False),
+            steps,
+            timestamps
+        )
+    
+    def records(self, run_id: int) -> List[tuple]:
+        now = datetime.utcnow()
+        timestamps = self.timestamps or [now] * len(self)
+        return list(zip(
+            [run_id] * len(self),
+            self.keys,
+            self.values.tolist(),
+            [_naive_utc(ts) if ts else now for ts in timestamps],
+            self.steps.tolist()
+        ))
+
+
+def parse_metric_batch(body: bytes, content_type: str) -> MetricColumns:
+    if content_type.startswith(ARROW_STREAM_MEDIA_TYPE):
+        return MetricColumns.from_arrow(pa.ipc.open_stream(pa.py_buffer(body)).read_all())
+    
+    batch = MetricBatch.model_validate_json(body)
+    return MetricColumns(batch.keys, batch.values, batch.steps or [0] * len(batch.values), batch.timestamps)
+
+
+async def _copy_records(db: AsyncSession, records: List[tuple]) -> bool:
+    connection = await db.connection()
+    if connection.dialect.driver != "asyncpg":
+        return False
+    
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        Metric.__tablename__,
+        records=records,
+        columns=METRIC_COLUMNS
+    )
+    return True
+
+
+def _batch_summaries(run_id: int, metrics: MetricColumns) -> List[Dict[str, Any]]:
+    names, inverse = np.unique(np.asarray(metrics.keys, dtype=object), return_inverse=True)
+    
+    # Sort by key, then step; lexsort is stable so equal steps keep arrival
+    # order and the last row of each group is the latest point.
+    order = np.lexsort((metrics.steps, inverse))
+    grouped = inverse[order]
+    last = order[np.append(np.flatnonzero(grouped[1:] != grouped[:-1]), len(order) - 1)]
+    
+    mins = np.full(len(names), np.inf)
+    maxs = np.full(len(names), -np.inf)
+    np.minimum.at(mins, inverse, metrics.values)
+    np.maximum.at(maxs, inverse, metrics.values)
+    counts = np.bincount(inverse, minlength=len(names))
+    sums = np.bincount(inverse, weights=metrics.values, minlength=len(names))
+    
+    now = datetime.utcnow()
+    return [
+        {
+            "run_id": run_id,
+            "key": name,
+            "last_value": float(metrics.values[idx]),
+            "last_step": int(metrics.steps[idx]),
+            "min_value": float(mins[group]),
+            "max_value": float(maxs[group]),
+            "sum_value": float(sums[group]),
+            "count": int(counts[group]),
+            "updated_at": now
+        }
+        for group, (name, idx) in enumerate(zip(names, last))
+    ]
+
+
+async def _summary_insert(db: AsyncSession, rows: List[Dict[str, Any]]):
+    connection = await db.connection()
+    dialect_insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    return dialect_insert(MetricSummary).values(rows)
+
+
+async def update_metric_summaries(db: AsyncSession, run_id: int, metrics: MetricColumns):
+    stmt = await _summary_insert(db, _batch_summaries(run_id, metrics))
+    excluded = stmt.excluded
+    newer = excluded.last_step >= MetricSummary.last_step
+    
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[MetricSummary.run_id, MetricSummary.key],
+        set_={
+            "last_value": case((newer, excluded.last_value), else_=MetricSummary.last_value),
+            "last_step": case((newer, excluded.last_step), else_=MetricSummary.last_step),
+            "min_value": case(
+                (excluded.min_value < MetricSummary.min_value, excluded.min_value),
+                else_=MetricSummary.min_value
+            ),
+            "max_value": case(
+                (excluded.max_value > MetricSummary.max_value, excluded.max_value),
+                else_=MetricSummary.max_value
+            ),
+            "sum_value": MetricSummary.sum_value + excluded.sum_value,
+            "count": MetricSummary.count + excluded.count,
+            "updated_at": excluded.updated_at
+        }
+    ))
+
+
+async def replace_metric_summaries(db: AsyncSession, run_id: int, rows: List[Dict[str, Any]]):
+    now = datetime.utcnow()
+    stmt = await _summary_insert(db, [
+        {
+            "run_id": run_id,
+            "key": row["key"],
+            "last_value": row["value_last"],
+            "last_step": row["step_last"] or 0,
+            "min_value": row["value_min"],
+            "max_value": row["value_max"],
+            "sum_value": row["value_sum"],
+            "count": row["value_count"],
+            "updated_at": now
+        }
+        for row in rows
+    ])
+    
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[MetricSummary.run_id, MetricSummary.key],
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                "last_value", "last_step", "min_value", "max_value", "sum_value", "count", "updated_at"
+            )
+        }
+    ))
+
+
+async def write_metrics(db: AsyncSession, run_id: int, metrics: MetricColumns) -> int:
+    if not len(metrics):
+        return 0
+    
+    records = metrics.records(run_id)
+    
+    if not await _copy_records(db, records):
+        await db.execute(
+            insert(Metric),
+            [dict(zip(METRIC_COLUMNS, record)) for record in records]
+        )
+    await update_metric_summaries(db, run_id, metrics)
+    
+    metric_points.add(len(records))
+    return len(records)
+
+
+async def publish_metric_points(run_id: int, metrics: MetricColumns):
+    if not len(metrics):
+        return
+    
+    if len(metrics) > settings.METRIC_STREAM_MAX_POINTS:
+        # Too large to push through pub/sub; tell clients to read history.
+        await publish_run_event(run_id, "gap", {"dropped_points": len(metrics)})
+        return
+    
+    values = metrics.values
+    await publish_run_event(run_id, "metrics", {
+        "keys": metrics.keys,
+        "steps": metrics.steps.tolist(),
+        "values": np.where(np.isnan(values), None, values).tolist()
+    })
+
+
+async def load_runs_metric_series(
+    db: AsyncSession,
+    run_ids: List[int],
+    keys: Optional[List[str]] = None,
+    step_min: Optional[int] = None,
+    step_max: Optional[int] = None
+) -> Dict[int, MetricSeriesMap]:
+    query = select(Metric.run_id, Metric.key, Metric.step, Metric.value).where(Metric.run_id.in_(run_ids))
+    if keys:
+        query = query.where(Metric.key.in_(keys))
+    if step_min is not None:
+        query = query.where(Metric.step >= step_min)
+    if step_max is not None:
+        query = query.where(Metric.step <= step_max)
+    
+    result = await db.execute(query.order_by(Metric.run_id, Metric.key, Metric.step, Metric.id))
+    rows = result.all()
+    archived = await _read_archives(db, run_ids, keys, step_min, step_max, ["key", "step", "value"])
+    
+    parts = []
+    if rows:
+        row_runs, row_keys, steps, values = zip(*rows)
+        parts.append((
+            np.asarray(row_runs, dtype="int64"),
+            np.asarray(row_keys, dtype=object),
+            np.asarray([s or 0 for s in steps], dtype="int64"),
+            np.asarray(values, dtype="float64")
+        ))
+    for run_id, table in archived.items():
+        parts.append((
+            np.full(table.num_rows, run_id, dtype="int64"),
+            np.asarray(table.column("key").to_pylist(), dtype=object),
+            table.column("step").fill_null(0).to_numpy(),
+            table.column("value").to_numpy(zero_copy_only=False)
+        ))
+    if not any(len(part[0]) for part in parts):
+        return {}
+    
+    runs, row_keys, steps, values = (np.concatenate(column) for column in zip(*parts))
+    if archived:
+        # Rows logged after a run was archived still live in the table, so
+        # restore (run, key, step) order across both sources.
+        _, key_codes = np.unique(row_keys, return_inverse=True)
+        order = np.lexsort((steps, key_codes, runs))
+        runs, row_keys, steps, values = runs[order], row_keys[order], steps[order], values[order]
+    
+    return _split_series(runs, row_keys, steps, values)
+
+
+async def _archived_runs(db: AsyncSession, run_ids: List[int]) -> Dict[int, str]:
+    result = await db.execute(
+        select(ExperimentRun.id, ExperimentRun.metrics_archive).where(
+            ExperimentRun.id.in_(run_ids),
+            ExperimentRun.metrics_archive.is_not(None)
+        )
+    )
+    return dict(result.all())
+
+
+async def _read_archives(
+    db: AsyncSession,
+    run_ids: List[int],
+    keys: Optional[List[str]] = None,
+    step_min: Optional[int] = None,
+    step_max: Optional[int] = None,
+    columns: Optional[List[str]] = None
+) -> Dict[int, pa.Table]:
+    archives = await _archived_runs(db, run_ids)
+    if not archives:
+        return {}
+    
+    return await run_in_thread(
+        "tracking.read_archive",
+        metric_archive.read_runs,
+        archives,
+        keys,
+        step_min,
+        step_max,
+        columns
+    )
+
+
+async def load_run_metrics(db: AsyncSession, run_id: int) -> List[Any]:
+    archived = await _read_archives(db, [run_id])
+    rows: List[Any] = [
+        {"run_id": run_id, **row}
+        for table in archived.values()
+        for row in table.to_pylist()
+    ]
+    
+    result = await db.execute(select(Metric).where(Metric.run_id == run_id))
+    rows.extend(result.scalars().all())
+    return rows
+
+
+async def load_metric_series(
+    db: AsyncSession,
+    run_id: int,
+    keys: Optional[List[str]] = None,
+    step_min: Optional[int] = None,
+    step_max: Optional[int] = None
+) -> MetricSeriesMap:
+    series = await load_runs_metric_series(db, [run_id], keys, step_min, step_max)
+    return series.get(run_id, {})
+
+
+def _split_series(
+    runs: np.ndarray,
+    keys: np.ndarray,
+    steps: np.ndarray,
+    values: np.ndarray
+) -> Dict[int, MetricSeriesMap]:
+    changed = (runs[1:] != runs[:-1]) | (keys[1:] != keys[:-1])
+    boundaries = np.flatnonzero(changed) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(keys)]))
+    
+    series: Dict[int, MetricSeriesMap] = {}
+    for start, end in zip(starts, ends):
+        series.setdefault(int(runs[start]), {})[keys[start]] = (steps[start:end], values[start:end])
+    
+    return series
+
+
+async def summarize_runs(
+    db: AsyncSession,
+    run_ids: List[int],
+    keys: Optional[List[str]] = None
+) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    # Archived runs read the per-key aggregates stored at compaction time
+    # (and kept current by later ingest); everything else is aggregated
+    # over the raw rows.
+    archived = await _archived_runs(db, run_ids)
+    run_ids = [run_id for run_id in run_ids if run_id not in archived]
+    
+    partition = (Metric.run_id, Metric.key)
+    ranked = select(
+        Metric.run_id,
+        Metric.key,
+        Metric.value,
+        Metric.step,
+        func.count().over(partition_by=partition).label("count"),
+        func.min(Metric.value).over(partition_by=partition).label("min"),
+        func.max(Metric.value).over(partition_by=partition).label("max"),
+        func.avg(Metric.value).over(partition_by=partition).label("mean"),
+        func.row_number().over(
+            partition_by=partition,
+            order_by=(Metric.step.desc(), Metric.id.desc())
+        ).label("position")
+    ).where(Metric.run_id.in_(run_ids))
+    if keys:
+        ranked = ranked.where(Metric.key.in_(keys))
+    ranked = ranked.subquery()
+    
+    result = await db.execute(
+        select(
+            ranked.c.run_id,
+            ranked.c.key,
+            ranked.c.value,
+            ranked.c.step,
+            ranked.c.count,
+            ranked.c.min,
+            ranked.c.max,
+            ranked.c.mean
+        ).where(ranked.c.position == 1)
+    )
+    
+    summary: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    for row in result:
+        summary.setdefault(row.key, {})[row.run_id] = {
+            "last": row.value,
+            "last_step": row.step,
+            "min": row.min,
+            "max": row.max,
+            "mean": float(row.mean) if row.mean is not None else None,
+            "count": row.count
+        }
+    
+    if archived:
+        query = select(MetricSummary).where(MetricSummary.run_id.in_(list(archived)))
+        if keys:
+            query = query.where(MetricSummary.key.in_(keys))
+        result = await db.execute(query)
+        
+        for row in result.scalars().all():
+            summary.setdefault(row.key, {})[row.run_id] = {
+                "last": _finite(row.last_value),
+                "last_step": row.last_step,
+                "min": _finite(row.min_value),
+                "max": _finite(row.max_value),
+                "mean": _finite(row.sum_value / row.count) if row.count else None,
+                "count": row.count
+            }
+    
+    return summary
+
+
+def _finite(value: float) -> Optional[float]:
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _write_archive(
+    run_id: int,
+    tables: List[pa.Table],
+    previous: Optional[str]
+) -> Tuple[str, List[Dict[str, Any]]]:
+    table = metric_archive.build(tables, previous)
+    return metric_archive.write(run_id, table), summarize_archive(table)
+
+
+async def compact_run_metrics(db: AsyncSession, run_id: int) -> Optional[Dict[str, Any]]:
+    run = await db.get(ExperimentRun, run_id)
+    if run is None or run.status not in TERMINAL_RUN_STATUSES:
+        return None
+    
+    # Delete first and archive exactly the rows the DELETE returned. Rows
+    # inserted concurrently are not visible to it and stay in the table for
+    # the next pass, and a failure below rolls the delete back.
+    result = await db.execute(
+        delete(Metric)
+        .where(Metric.run_id == run_id)
+        .returning(Metric.id, Metric.key, Metric.value, Metric.timestamp, Metric.step)
+        .execution_options(synchronize_session=False)
+    )
+    tables = [
+        pa.Table.from_pydict(
+            dict(zip(METRIC_ARCHIVE_SCHEMA.names, zip(*partition))),
+            schema=METRIC_ARCHIVE_SCHEMA
+        )
+        for partition in result.partitions(settings.METRIC_ARCHIVE_ROW_GROUP_SIZE)
+    ]
+    if not tables:
+        await db.rollback()
+        return None
+    
+    points = sum(table.num_rows for table in tables)
+    previous = run.metrics_archive
+    name = None
+    
+    try:
+        name, aggregates = await run_in_thread("tracking.write_archive", _write_archive, run_id, tables, previous)
+        await replace_metric_summaries(db, run_id, aggregates)
+        run.metrics_archive = name
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        if name:
+            metric_archive.remove(name)
+        raise
+    
+    if previous:
+        metric_archive.retire(previous)
+    
+    archived_points.add(points)
+    return {"run_id": run_id, "points": points, "archive": name}
+
+
+async def collect_archive_garbage(db: AsyncSession) -> int:
+    cutoff = time.time() - settings.METRIC_ARCHIVE_GC_GRACE_SECONDS
+    names = await run_in_thread("tracking.list_archives", metric_archive.stale_names, cutoff)
+    
+    removed = 0
+    for start in range(0, len(names), 1000):
+        chunk = names[start:start + 1000]
+        result = await db.execute(
+            select(ExperimentRun.metrics_archive).where(ExperimentRun.metrics_archive.in_(chunk))
+        )
+        referenced = set(result.scalars().all())
+        for name in chunk:
+            if name not in referenced:
+                metric_archive.remove(name)
+                removed += 1
+    
+    return removed
+
+
+def parameter_float(value: str) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+async def backfill_parameter_floats(db: AsyncSession, after_id: int = 0, limit: int = 1000) -> Optional[int]:
+    result = await db.execute(
+        select(Parameter.id, Parameter.value)
+        .where(Parameter.id > after_id, Parameter.value_float.is_(None))
+        .order_by(Parameter.id)
+        .limit(limit)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    
+    updates = []
+    for param_id, value in rows:
+        number = parameter_float(value)
+        if number is not None:
+            updates.append({"id": param_id, "value_float": number})
+    
+    if updates:
+        await db.execute(update(Parameter), updates)
+    await db.commit()
+    
+    return rows[-1].id
+
+
+async def _run_summaries_from_rows(db: AsyncSession, run_id: int) -> List[Dict[str, Any]]:
+    ranked = select(
+        Metric.key,
+        Metric.value,
+        Metric.step,
+        func.row_number().over(
+            partition_by=Metric.key,
+            order_by=(func.coalesce(Metric.step, 0).desc(), Metric.id.desc())
+        ).label("position")
+    ).where(Metric.run_id == run_id).subquery()
+    
+    result = await db.execute(
+        select(ranked.c.key, ranked.c.value, ranked.c.step).where(ranked.c.position == 1)
+    )
+    latest = {row.key: row for row in result}
+    
+    result = await db.execute(
+        select(
+            Metric.key,
+            func.min(Metric.value),
+            func.max(Metric.value),
+            func.sum(Metric.value),
+            func.count()
+        )
+        .where(Metric.run_id == run_id)
+        .group_by(Metric.key)
+    )
+    
+    return [
+        {
+            "key": key,
+            "value_last": latest[key].value,
+            "step_last": latest[key].step,
+            "value_min": value_min,
+            "value_max": value_max,
+            "value_sum": value_sum,
+            "value_count": value_count
+        }
+        for key, value_min, value_max, value_sum, value_count in result
+    ]
+
+
+async def backfill_metric_summaries(db: AsyncSession, after_run_id: int = 0, limit: int = 100) -> Optional[int]:
+    # Archived runs got their summaries at compaction time and only keep late
+    # rows in the metrics table, so rebuilding from rows would undercount.
+    result = await db.execute(
+        select(ExperimentRun.id)
+        .where(
+            ExperimentRun.id > after_run_id,
+            ExperimentRun.metrics_archive.is_(None),
+            exists().where(Metric.run_id == ExperimentRun.id)
+        )
+        .order_by(ExperimentRun.id)
+        .limit(limit)
+    )
+    run_ids = list(result.scalars().all())
+    if not run_ids:
+        return None
+    
+    for run_id in run_ids:
+        rows = await _run_summaries_from_rows(db, run_id)
+        if rows:
+            await replace_metric_summaries(db, run_id, rows)
+        await db.commit()
+    
+    return run_ids[-1]
+
+
+def _search_condition(clause: SearchClause, dialect: str):
+    compare = SEARCH_OPERATORS[clause.op]
+    
+    if clause.entity == "metric":
+        return ExperimentRun.id.in_(
+            select(MetricSummary.run_id).where(
+                MetricSummary.key == clause.key,
+                compare(MetricSummary.last_value, clause.value)
+            )
+        )
+    
+    if clause.entity == "param":
+        column = Parameter.value_float if isinstance(clause.value, float) else Parameter.value
+        return ExperimentRun.id.in_(
+            select(Parameter.run_id).where(
+                Parameter.key == clause.key,
+                compare(column, clause.value)
+            )
+        )
+    
+    if clause.entity == "tag":
+        if dialect == "postgresql":
+            # Containment is answered by the GIN index on tags.
+            matched = type_coerce(ExperimentRun.tags, JSONB).contains({clause.key: clause.value})
+        else:
+            matched = ExperimentRun.tags[clause.key].as_string() == clause.value
+        matched = func.coalesce(matched, False)
+        return matched if clause.op == "=" else ~matched
+    
+    if clause.key == "status":
+        return compare(ExperimentRun.status, RunStatus(clause.value))
+    return compare(getattr(ExperimentRun, clause.key), clause.value)
+
+
+async def search_runs(
+    db: AsyncSession,
+    clauses: List[SearchClause],
+    experiment_ids: Optional[List[int]] = None,
+    order_by: Optional[Tuple[str, str, bool]] = None,
+    limit: int = 100,
+    offset: int = 0
+) -> List[ExperimentRun]:
+    connection = await db.connection()
+    query = select(ExperimentRun)
+    
+    if experiment_ids:
+        query = query.where(ExperimentRun.experiment_id.in_(experiment_ids))
+    for clause in clauses:
+        query = query.where(_search_condition(clause, connection.dialect.name))
+    
+    entity, key, descending = order_by or ("attribute", "start_time", True)
+    if entity == "metric":
+        summary = aliased(MetricSummary)
+        query = query.outerjoin(
+            summary,
+            (summary.run_id == ExperimentRun.id) & (summary.key == key)
+        )
+        sort_column = summary.last_value
+    else:
+        sort_column = getattr(ExperimentRun, key)
+    
+    sort_column = sort_column.desc() if descending else sort_column.asc()
+    query = query.order_by(sort_column.nulls_last(), ExperimentRun.id.desc())
+    
+    result = await db.execute(query.offset(offset).limit(limit))
+    return list(result.scalars().all())
+
+
+def align_series(
+    series_by_run: Dict[int, MetricSeriesMap],
+    grid_points: int,
+    method: str = "linear"
+) -> Dict[str, Dict[str, Any]]:
+    by_key: Dict[str, Dict[int, Tuple[np.ndarray, np.ndarray]]] = {}
+    for run_id, series in series_by_run.items():
+        for key, points in series.items():
+            by_key.setdefault(key, {})[run_id] = points
+    
+    aligned = {}
+    for key, runs in by_key.items():
+        lo = min(int(steps[0]) for steps, _ in runs.values())
+        hi = max(int(steps[-1]) for steps, _ in runs.values())
+        grid = np.unique(np.linspace(lo, hi, grid_points).round().astype("int64"))
+        
+        values_by_run = {}
+        for run_id, (steps, values) in runs.items():
+            if method == "previous":
+                idx = np.searchsorted(steps, grid, side="right") - 1
+                sampled = values[np.clip(idx, 0, None)]
+                sampled[(idx < 0) | (grid > steps[-1])] = np.nan
+            else:
+                sampled = np.interp(grid, steps, values, left=np.nan, right=np.nan)
+            values_by_run[run_id] = np.where(np.isnan(sampled), None, sampled).tolist()
+        
+        aligned[key] = {"steps": grid.tolist(), "values": values_by_run}
+    
+    return aligned
+
+
+def downsample_series(
+    series: MetricSeriesMap,
+    max_points: int,
+    method: str = "lttb"
+) -> Dict[str, Dict[str, Any]]:
+    result = {}
+    
+    for key, (steps, values) in series.items():
+        indices = downsample(steps, values, max_points, method)
+        sampled = values[indices]
+        result[key] = {
+            "steps": steps[indices].tolist(),
+            "values": np.where(np.isnan(sampled), None, sampled).tolist(),
+            "total_points": len(steps)
+        }
+    
+    return result
+
+
+class MetricBuffer:
+    def __init__(self, max_points: int, flush_interval: float, max_retries: int = settings.METRIC_BUFFER_MAX_RETRIES):
+        self.max_points = max_points
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self._pending: Dict[int, List[MetricColumns]] = {}
+        self._pending_points = 0
+        self._attempts: Dict[int, int] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.flushed_points = 0
+        self.failed_flushes = 0
+        self.dropped_points = 0
+    
+    async def add(self, run_id: int, metrics: MetricColumns):
+        self._pending.setdefault(run_id, []).append(metrics)
+        self._pending_points += len(metrics)
+        
+        if self._pending_points >= self.max_points:
+            await self.flush()
+    
+    def _requeue(self, run_id: int, batches: List[MetricColumns]):
+        # Clients were already told these points were accepted, so keep them
+        # ahead of anything buffered since and retry on the next flush.
+        points = sum(len(metrics) for metrics in batches)
+        attempts = self._attempts.get(run_id, 0) + 1
+        
+        if attempts > self.max_retries:
+            self._attempts.pop(run_id, None)
+            self.dropped_points += points
+            logger.error(
+                "Dropping %d buffered metric points for run %s after %d failed flushes",
+                points, run_id, attempts
+            )
+            return
+        
+        self._attempts[run_id] = attempts
+        self._pending[run_id] = batches + self._pending.get(run_id, [])
+        self._pending_points += points
+    
+    async def flush(self) -> int:
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_points = 0
+            if not pending:
+                return 0
+            
+            written = 0
+            for run_id, batches in pending.items():
+                # One run failing (e.g. deleted mid-flight) must not take the
+                # other runs' points down with it.
+                try:
+                    async with async_session_maker() as session:
+                        run_written = 0
+                        for metrics in batches:
+                            run_written += await write_metrics(session, run_id, metrics)
+                        await session.commit()
+                except Exception:
+                    self.failed_flushes += 1
+                    logger.exception("Failed to flush %d buffered metric batches for run %s", len(batches), run_id)
+                    self._requeue(run_id, batches)
+                    continue
+                
+                self._attempts.pop(run_id, None)
+                written += run_written
+                for metrics in batches:
+                    await publish_metric_points(run_id, metrics)
+            
+            self.flushed_points += written
+            return written
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending_points": self._pending_points,
+            "pending_runs": len(self._pending),
+            "flushed_points": self.flushed_points,
+            "failed_flushes": self.failed_flushes,
+            "dropped_points": self.dropped_points
+        }
+
+
+metric_buffer = MetricBuffer(settings.METRIC_BUFFER_MAX_POINTS, settings.METRIC_BUFFER_FLUSH_INTERVAL)
@@ -16,6 +16,24 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,
     task_soft_time_limit=3000,
+    beat_schedule={
+        "compact-offline-features": {
+            "task": "compact_offline_features",
+            "schedule": settings.FEATURE_STORE_COMPACTION_INTERVAL,
+        },
+        "materialize-online-features": {
+            "task": "materialize_online_features",
+            "schedule": settings.FEATURE_STORE_MATERIALIZATION_INTERVAL,
+        },
+        "sweep-online-freshness": {
+            "task": "sweep_online_freshness",
+            "schedule": settings.FEATURE_STORE_SWEEP_INTERVAL,
+        },
+        "compact-run-metrics": {
+            "task": "compact_run_metrics",
+            "schedule": settings.METRIC_COMPACTION_INTERVAL,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(["backend.tasks"])
@@ -0,0 +1,101 @@
+from typing import Optional
+from datetime import datetime
+import logging
+from pathlib import Path
+from sqlalchemy import select
+from backend.tasks.celery_app import celery_app
+from backend.tasks.training_tasks import AsyncTask
+from backend.core.database import async_session_maker
+from backend.models.feature import FeatureGroup
+from backend.services.data import FeatureStoreService
+from backend.services.feature_registry import get_feature_group
+from backend.services.offline_store import OfflineFeatureStore
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(base=AsyncTask, name="compact_offline_features")
+async def compact_offline_features_task(group_name: Optional[str] = None):
+    offline_store = OfflineFeatureStore(Path("/app/artifacts/features"))
+    
+    async with async_session_maker() as session:
+        query = select(FeatureGroup).where(FeatureGroup.offline_enabled.is_(True))
+        if group_name:
+            query = query.where(FeatureGroup.name == group_name)
+        
+        result = await session.execute(query)
+        groups = result.scalars().all()
+    
+    compacted = []
+    for group in groups:
+        summary = offline_store.compact(group.name, list(group.entity_columns))
+        if summary:
+            compacted.append(summary)
+    
+    return {
+        "status": "completed",
+        "groups": compacted
+    }
+
+
+@celery_app.task(base=AsyncTask, name="materialize_online_features")
+async def materialize_online_features_task(
+    group_name: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    full: bool = False
+):
+    async with async_session_maker() as session:
+        query = select(FeatureGroup.name).where(
+            FeatureGroup.online_enabled.is_(True),
+            FeatureGroup.offline_enabled.is_(True)
+        )
+        if group_name:
+            query = query.where(FeatureGroup.name == group_name)
+        
+        result = await session.execute(query)
+        group_names = result.scalars().all()
+        
+        feature_service = FeatureStoreService(session)
+        materialized = []
+        for name in group_names:
+            materialized.append(await feature_service.materialize(
+                name,
+                start=datetime.fromisoformat(start) if start else None,
+                end=datetime.fromisoformat(end) if end else None,
+                full=full
+            ))
+    
+    return {
+        "status": "completed",
+        "groups": materialized
+    }
+
+
+@celery_app.task(base=AsyncTask, name="sweep_online_freshness")
+async def sweep_online_freshness_task(group_name: Optional[str] = None):
+    async with async_session_maker() as session:
+        query = select(FeatureGroup.name).where(FeatureGroup.online_enabled.is_(True))
+        if group_name:
+            query = query.where(FeatureGroup.name == group_name)
+        
+        result = await session.execute(query)
+        feature_service = FeatureStoreService(session)
+        
+        reports = []
+        for name in result.scalars().all():
+            group = await get_feature_group(session, name=name)
+            report = await feature_service.sweep_freshness(group)
+            if report["stale"]:
+                logger.warning(
+                    "Feature group %s has %d stale online entities (older than %ss)",
+                    name,
+                    report["stale"],
+                    report["max_staleness_seconds"]
+                )
+            reports.append(report)
+    
+    return {
+        "status": "completed",
+        "groups": reports
+    }
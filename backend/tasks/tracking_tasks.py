@@ -0,0 +1,79 @@
+from typing import Optional
+from datetime import datetime, timedelta
+import logging
+from sqlalchemy import exists, func, select
+from backend.tasks.celery_app import celery_app
+from backend.tasks.training_tasks import AsyncTask
+from backend.core.config import settings
+from backend.core.database import async_session_maker
+from backend.models.experiment import ExperimentRun, Metric
+from backend.services.tracking import (
+    TERMINAL_RUN_STATUSES,
+    backfill_metric_summaries,
+    backfill_parameter_floats,
+    collect_archive_garbage,
+    compact_run_metrics
+)
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(base=AsyncTask, name="compact_run_metrics")
+async def compact_run_metrics_task(run_id: Optional[int] = None):
+    async with async_session_maker() as session:
+        if run_id is not None:
+            run_ids = [run_id]
+        else:
+            # Runs get a grace period after finishing so late metric writes
+            # land before their rows are archived and pruned.
+            cutoff = datetime.utcnow() - timedelta(seconds=settings.METRIC_COMPACTION_GRACE_SECONDS)
+            result = await session.execute(
+                select(ExperimentRun.id)
+                .where(
+                    ExperimentRun.status.in_(TERMINAL_RUN_STATUSES),
+                    func.coalesce(ExperimentRun.end_time, ExperimentRun.start_time) < cutoff,
+                    exists().where(Metric.run_id == ExperimentRun.id)
+                )
+                .order_by(ExperimentRun.id)
+                .limit(settings.METRIC_COMPACTION_BATCH_RUNS)
+            )
+            run_ids = list(result.scalars().all())
+        
+        compacted = []
+        for candidate in run_ids:
+            try:
+                summary = await compact_run_metrics(session, candidate)
+            except Exception:
+                logger.exception("Failed to compact metrics for run %s", candidate)
+                continue
+            if summary:
+                compacted.append(summary)
+        
+        removed = await collect_archive_garbage(session)
+    
+    return {
+        "status": "completed",
+        "runs": compacted,
+        "archives_removed": removed
+    }
+
+
+@celery_app.task(base=AsyncTask, name="backfill_run_search")
+async def backfill_run_search_task():
+    # One-off after scripts/migrate_tracking_schema.py: fills value_float and
+    # metric summaries for rows logged before run search existed. Re-running
+    # is safe; both passes rewrite values derived from the raw rows.
+    batches = {"parameters": 0, "runs": 0}
+    
+    async with async_session_maker() as session:
+        cursor = await backfill_parameter_floats(session)
+        while cursor is not None:
+            batches["parameters"] += 1
+            cursor = await backfill_parameter_floats(session, cursor)
+        
+        cursor = await backfill_metric_summaries(session)
+        while cursor is not None:
+            batches["runs"] += 1
+            cursor = await backfill_metric_summaries(session, cursor)
+    
+    return {"status": "completed", "batches": batches}
@@ -0,0 +1,257 @@
+from typing import Any, Iterator, List, Optional, Tuple
+import io
+import re
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from backend.core.config import settings
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+_FILTER_PATTERN = re.compile(r"^\s*([A-Za-z_][\w.]*)\s*(==|!=|>=|<=|=|>|<|\bin\b)\s*(.+?)\s*$")
+
+
+def _parse_value(raw: str) -> Any:
+    raw = raw.strip()
+    
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "'\"":
+        return raw[1:-1]
+    if raw.lower() in ("true", "false"):
+        return raw.lower() == "true"
+    if raw.lower() == "null":
+        return None
+    
+    for cast in (int, float):
+        try:
+            return cast(raw)
+        except ValueError:
+            pass
+    
+    return raw
+
+
+def parse_filter(expression: str) -> Tuple[str, str, Any]:
+    match = _FILTER_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter expression: {expression}")
+    
+    column, op, raw_value = match.groups()
+    
+    if op == "in":
+        value = [_parse_value(v) for v in raw_value.strip("()[]").split(",") if v.strip()]
+    else:
+        value = _parse_value(raw_value)
+    
+    return column, "==" if op == "=" else op, value
+
+
+def _is_string_type(data_type: pa.DataType) -> bool:
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+def _coerce_literal(value: Any, data_type: pa.DataType) -> Any:
+    # Literals are parsed without knowing the column; quoted dates and
+    # timestamps arrive as strings and must be cast before they can be
+    # compared, as must bare numbers against string columns.
+    if value is None or isinstance(value, str) == _is_string_type(data_type):
+        return value
+    return pa.scalar(value).cast(data_type).as_py()
+
+
+def coerce_filters(
+    filters: List[Tuple[str, str, Any]],
+    schema: pa.Schema
+) -> List[Tuple[str, str, Any]]:
+    coerced = []
+    
+    for column, op, value in filters:
+        index = schema.get_field_index(column)
+        if index < 0:
+            coerced.append((column, op, value))
+            continue
+        
+        data_type = schema.field(index).type
+        try:
+            if op == "in":
+                literal = [_coerce_literal(v, data_type) for v in value]
+            else:
+                literal = _coerce_literal(value, data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+            raise ValueError(f"Cannot compare {column} ({data_type}) with {value!r}: {e}")
+        
+        coerced.append((column, op, literal))
+    
+    return coerced
+
+
+def build_filter_expression(filters: List[Tuple[str, str, Any]]) -> Optional[pc.Expression]:
+    expression = None
+    
+    for column, op, value in filters:
+        field = pc.field(column)
+        
+        if op == "in":
+            predicate = field.isin(value)
+        elif value is None:
+            predicate = field.is_null() if op == "==" else field.is_valid()
+        elif op == "==":
+            predicate = field == value
+        elif op == "!=":
+            predicate = field != value
+        elif op == ">":
+            predicate = field > value
+        elif op == ">=":
+            predicate = field >= value
+        elif op == "<":
+            predicate = field < value
+        else:
+            predicate = field <= value
+        
+        expression = predicate if expression is None else expression & predicate
+    
+    return expression
+
+
+def _project_schema(schema: pa.Schema, columns: Optional[List[str]]) -> pa.Schema:
+    if not columns:
+        return schema
+    
+    unknown = [c for c in columns if schema.get_field_index(c) < 0]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    
+    return pa.schema([schema.field(c) for c in columns])
+
+
+def scan_dataset(
+    paths: List[str],
+    schema: Optional[pa.Schema] = None,
+    partitioning: Optional[ds.Partitioning] = None,
+    partition_base_dir: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    row_start: Optional[int] = None,
+    row_end: Optional[int] = None,
+    row_group_start: Optional[int] = None,
+    row_group_end: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    dataset = ds.dataset(
+        paths,
+        schema=schema,
+        format="parquet",
+        partitioning=partitioning,
+        partition_base_dir=partition_base_dir
+    )
+    schema = _project_schema(dataset.schema, columns)
+    batch_size = batch_size or settings.DATASET_ROW_GROUP_SIZE
+    
+    for column, _, _ in filters or []:
+        if dataset.schema.get_field_index(column) < 0:
+            raise ValueError(f"Unknown filter column: {column}")
+    
+    filters = coerce_filters(filters or [], dataset.schema)
+    filter_expr = build_filter_expression(filters)
+    
+    # Batches are produced lazily while the response streams, so bind the
+    # filter against an empty table now to surface type errors up front.
+    if filter_expr is not None:
+        try:
+            dataset.schema.empty_table().filter(filter_expr)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+            raise ValueError(f"Invalid filter: {e}")
+    
+    row_groups = [
+        row_group
+        for fragment in dataset.get_fragments()
+        for row_group in fragment.split_by_row_group()
+    ]
+    row_groups = row_groups[row_group_start:row_group_end]
+    
+    positional = row_start is not None or row_end is not None
+    row_start = row_start or 0
+    
+    # Positional reads filter after slicing, so decode the projected columns
+    # plus whatever the filter references, and nothing else.
+    needed = set(schema.names) | {column for column, _, _ in filters or []}
+    scan_columns = [name for name in dataset.schema.names if name in needed]
+    
+    def batches() -> Iterator[pa.RecordBatch]:
+        offset = 0
+        
+        for row_group in row_groups:
+            num_rows = row_group.row_groups[0].num_rows
+            group_start, offset = offset, offset + num_rows
+            
+            if not positional:
+                scanner = row_group.scanner(
+                    schema=dataset.schema,
+                    columns=schema.names,
+                    filter=filter_expr,
+                    batch_size=batch_size
+                )
+                yield from (batch for batch in scanner.to_batches() if batch.num_rows)
+                continue
+            
+            if offset <= row_start:
+                continue
+            if row_end is not None and group_start >= row_end:
+                break
+            
+            scanner = row_group.scanner(
+                schema=dataset.schema,
+                columns=scan_columns,
+                batch_size=batch_size
+            )
+            position = group_start
+            
+            for batch in scanner.to_batches():
+                lo = max(row_start - position, 0)
+                hi = batch.num_rows if row_end is None else min(row_end - position, batch.num_rows)
+                position += batch.num_rows
+                
+                if hi <= lo:
+                    continue
+                
+                table = pa.Table.from_batches([batch.slice(lo, hi - lo)])
+                if filter_expr is not None:
+                    table = table.filter(filter_expr)
+                
+                yield from table.select(schema.names).to_batches()
+    
+    return schema, batches()
+
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_ipc_stream(schema: pa.Schema, batches: Iterator[pa.RecordBatch]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    
+    with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            yield sink.drain()
+    
+    yield sink.drain()
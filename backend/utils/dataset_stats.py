@@ -0,0 +1,178 @@
+from typing import Dict, Any, Iterable
+import math
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from backend.core.config import settings
+
+
+def _empty_column_stats() -> Dict[str, Any]:
+    return {"null_count": 0, "count": 0, "mean": None, "m2": None, "min": None, "max": None}
+
+
+def _is_numeric(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+
+
+def _merge_moments(target: Dict[str, Any], count: int, mean: float, m2: float):
+    if count == 0:
+        return
+    
+    if not target["count"] or target["mean"] is None:
+        target["count"], target["mean"], target["m2"] = count, mean, m2
+        return
+    
+    total = target["count"] + count
+    delta = mean - target["mean"]
+    target["mean"] += delta * count / total
+    target["m2"] += m2 + delta * delta * target["count"] * count / total
+    target["count"] = total
+
+
+def _merge_bounds(target: Dict[str, Any], minimum: Any, maximum: Any):
+    if minimum is not None:
+        target["min"] = minimum if target["min"] is None else min(target["min"], minimum)
+    if maximum is not None:
+        target["max"] = maximum if target["max"] is None else max(target["max"], maximum)
+
+
+def _accumulate_numeric(target: Dict[str, Any], array: pa.Array, with_bounds: bool):
+    count = len(array) - array.null_count
+    if count == 0:
+        return
+    
+    mean = pc.mean(array).as_py()
+    m2 = pc.variance(array, ddof=0).as_py() * count
+    _merge_moments(target, count, mean, m2)
+    
+    if with_bounds:
+        bounds = pc.min_max(array)
+        _merge_bounds(target, bounds["min"].as_py(), bounds["max"].as_py())
+
+
+def _column_types(schema: pa.Schema) -> Dict[str, str]:
+    dtypes = schema.empty_table().to_pandas().dtypes
+    return {col: str(dtype) for col, dtype in dtypes.items()}
+
+
+def compute_table_stats(table: pa.Table) -> Dict[str, Any]:
+    columns = {}
+    
+    for name, array in zip(table.column_names, table.columns):
+        target = _empty_column_stats()
+        target["null_count"] = array.null_count
+        if _is_numeric(array.type):
+            _accumulate_numeric(target, array, with_bounds=True)
+        columns[name] = target
+    
+    return {
+        "num_rows": table.num_rows,
+        "uncompressed_bytes": table.nbytes,
+        "column_types": _column_types(table.schema),
+        "columns": columns
+    }
+
+
+def compute_parquet_stats(path: str) -> Dict[str, Any]:
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    
+    columns = {name: _empty_column_stats() for name in schema.names}
+    missing_footer_stats = set()
+    uncompressed_bytes = 0
+    
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        uncompressed_bytes += row_group.total_byte_size
+        
+        for idx in range(row_group.num_columns):
+            column_chunk = row_group.column(idx)
+            name = column_chunk.path_in_schema
+            if name not in columns:
+                continue
+            
+            statistics = column_chunk.statistics
+            if statistics is None or not statistics.has_null_count:
+                missing_footer_stats.add(name)
+                continue
+            
+            columns[name]["null_count"] += statistics.null_count
+            if _is_numeric(schema.field(name).type) and statistics.has_min_max:
+                _merge_bounds(columns[name], statistics.min, statistics.max)
+    
+    for name in missing_footer_stats:
+        columns[name] = _empty_column_stats()
+    
+    numeric_columns = [field.name for field in schema if _is_numeric(field.type)]
+    scan_columns = sorted(set(numeric_columns) | missing_footer_stats)
+    
+    if scan_columns:
+        for batch in parquet_file.iter_batches(
+            batch_size=settings.DATASET_ROW_GROUP_SIZE,
+            columns=scan_columns
+        ):
+            for name in scan_columns:
+                array = batch.column(name)
+                
+                if name in missing_footer_stats:
+                    columns[name]["null_count"] += array.null_count
+                
+                if name in numeric_columns:
+                    _accumulate_numeric(
+                        columns[name],
+                        array,
+                        with_bounds=name in missing_footer_stats
+                    )
+    
+    return {
+        "num_rows": metadata.num_rows,
+        "uncompressed_bytes": uncompressed_bytes,
+        "column_types": _column_types(schema),
+        "columns": columns
+    }
+
+
+def merge_stats(partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = {"num_rows": 0, "uncompressed_bytes": 0, "column_types": {}, "columns": {}}
+    
+    for partial in partials:
+        merged["num_rows"] += partial["num_rows"]
+        merged["uncompressed_bytes"] += partial["uncompressed_bytes"]
+        merged["column_types"].update(partial["column_types"])
+        
+        for name, stats in partial["columns"].items():
+            target = merged["columns"].setdefault(name, _empty_column_stats())
+            target["null_count"] += stats["null_count"]
+            if stats["mean"] is not None:
+                _merge_moments(target, stats["count"], stats["mean"], stats["m2"])
+            _merge_bounds(target, stats["min"], stats["max"])
+    
+    return merged
+
+
+def summarize_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    numeric_summary = {}
+    
+    for name, column in stats["columns"].items():
+        if column["mean"] is None:
+            continue
+        
+        count = column["count"]
+        numeric_summary[name] = {
+            "count": count,
+            "mean": column["mean"],
+            "std": math.sqrt(column["m2"] / (count - 1)) if count > 1 else None,
+            "min": column["min"],
+            "max": column["max"]
+        }
+    
+    return {
+        "num_rows": stats["num_rows"],
+        "num_columns": len(stats["column_types"]),
+        "memory_usage": stats["uncompressed_bytes"],
+        "column_types": stats["column_types"],
+        "missing_values": {name: column["null_count"] for name, column in stats["columns"].items()},
+        "numeric_summary": numeric_summary
+    }
@@ -0,0 +1,77 @@
+import numpy as np
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    
+    # Bucket edges for the n - 2 interior points; the first and last points
+    # are always kept.
+    edges = np.linspace(1, n - 1, threshold - 1).astype("int64")
+    selected = np.empty(threshold, dtype="int64")
+    selected[0], selected[-1] = 0, n - 1
+    
+    # Averages of each bucket are independent of the selection, so compute
+    # them all at once; only the triangle step depends on the previous pick.
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+    
+    a = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[bucket + 1] = a
+    
+    return selected
+
+
+def minmax_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+    
+    y = np.asarray(y, dtype="float64")
+    buckets = (threshold - 2) // 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype("int64")
+    interior = y[1:n - 1]
+    filled_min = np.where(np.isnan(interior), np.inf, interior)
+    filled_max = np.where(np.isnan(interior), -np.inf, interior)
+    
+    bucket_of = np.repeat(np.arange(buckets), np.diff(edges))
+    mins = np.minimum.reduceat(filled_min, edges[:-1] - 1)
+    maxs = np.maximum.reduceat(filled_max, edges[:-1] - 1)
+    
+    # First index in each bucket that hits the bucket min / max.
+    positions = np.arange(1, n - 1)
+    is_min = filled_min == mins[bucket_of]
+    is_max = filled_max == maxs[bucket_of]
+    min_idx = np.full(buckets, n, dtype="int64")
+    max_idx = np.full(buckets, n, dtype="int64")
+    np.minimum.at(min_idx, bucket_of[is_min], positions[is_min])
+    np.minimum.at(max_idx, bucket_of[is_max], positions[is_max])
+    
+    indices = np.concatenate(([0], min_idx, max_idx, [n - 1]))
+    return np.unique(indices[indices < n])
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int, method: str = "lttb") -> np.ndarray:
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsampling method: {method}")
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    return lttb_indices(x, y, max_points)
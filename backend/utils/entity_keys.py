@@ -0,0 +1,56 @@
+from typing import Any, List, Sequence, Tuple, Union
+import hashlib
+import json
+import pyarrow as pa
+import pyarrow.compute as pc
+
+EntityKey = Union[str, int, Sequence[Any]]
+
+COMPOSITE_KEY_SEPARATOR = "\x1f"
+
+
+def normalize_entity_key(entity_key: EntityKey, entity_columns: List[str]) -> Tuple[Any, ...]:
+    values = tuple(entity_key) if isinstance(entity_key, (list, tuple)) else (entity_key,)
+    
+    if len(values) != len(entity_columns):
+        raise ValueError(
+            f"Entity key {entity_key!r} does not match entity columns {entity_columns}"
+        )
+    
+    return values
+
+
+def encode_entity_key(values: Sequence[Any]) -> str:
+    if len(values) == 1:
+        return str(values[0])
+    
+    canonical = json.dumps([str(v) for v in values], separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def online_key(group_name: str, values: Sequence[Any]) -> str:
+    return f"features:{group_name}:{encode_entity_key(values)}"
+
+
+def entity_keys_table(entity_keys: List[Tuple[Any, ...]], entity_columns: List[str], schema: pa.Schema) -> pa.Table:
+    return pa.table({
+        col: pa.array([key[idx] for key in entity_keys]).cast(schema.field(col).type)
+        for idx, col in enumerate(entity_columns)
+    })
+
+
+def composite_key_column(table: pa.Table, entity_columns: List[str]) -> pa.ChunkedArray:
+    return pc.binary_join_element_wise(
+        *[pc.cast(table.column(col), pa.string()) for col in entity_columns],
+        COMPOSITE_KEY_SEPARATOR
+    )
+
+
+def entity_key_mask(table: pa.Table, entity_keys: List[Tuple[Any, ...]], entity_columns: List[str]) -> pa.ChunkedArray:
+    # A hash join would reject list-typed payload columns (embeddings), so
+    # match on a single joined key column and filter instead.
+    keys = entity_keys_table(entity_keys, entity_columns, table.schema)
+    return pc.is_in(
+        composite_key_column(table, entity_columns),
+        value_set=composite_key_column(keys, entity_columns).combine_chunks()
+    )
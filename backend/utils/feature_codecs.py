@@ -0,0 +1,111 @@
+from typing import AbstractSet, Dict, Any, Optional, Union
+import json
+import msgpack
+import numpy as np
+
+RECORD_MAGIC = b"ZF"
+RECORD_VERSION = 1
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+ENCODING_MSGPACK_F16 = "msgpack-f16"
+
+_CODEC_IDS = {ENCODING_MSGPACK: 1, ENCODING_MSGPACK_F16: 2}
+_EXT_FLOAT32 = 1
+_EXT_FLOAT16 = 2
+_EXT_FLOAT64 = 3
+
+PACK_MIN_LENGTH = 8
+FLOAT16_MAX = 65504.0
+
+EMBEDDING_DTYPES = ("embedding", "vector")
+
+SUPPORTED_ENCODINGS = (ENCODING_JSON, ENCODING_MSGPACK, ENCODING_MSGPACK_F16)
+
+
+def is_embedding_dtype(dtype: Optional[str]) -> bool:
+    return bool(dtype) and dtype.split("[")[0].strip().lower() in EMBEDDING_DTYPES
+
+
+def _float_vector(value: Any) -> Optional[np.ndarray]:
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and value.ndim == 1 and len(value) >= PACK_MIN_LENGTH:
+            return value
+        return None
+    if (
+        isinstance(value, (list, tuple))
+        and len(value) >= PACK_MIN_LENGTH
+        and all(isinstance(v, float) for v in value)
+    ):
+        return np.asarray(value, dtype="float64")
+    return None
+
+
+def _pack_value(value: Any, narrow_ext: Optional[int]) -> Any:
+    vector = _float_vector(value)
+    if vector is not None:
+        # Only declared embeddings are narrowed; everything else is kept
+        # bit-exact as float64. float16 falls back to float32 when any
+        # component would overflow it.
+        if narrow_ext == _EXT_FLOAT16 and np.all(np.abs(vector[np.isfinite(vector)]) <= FLOAT16_MAX):
+            return msgpack.ExtType(_EXT_FLOAT16, vector.astype("<f2").tobytes())
+        if narrow_ext is not None:
+            return msgpack.ExtType(_EXT_FLOAT32, vector.astype("<f4").tobytes())
+        return msgpack.ExtType(_EXT_FLOAT64, vector.astype("<f8").tobytes())
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_FLOAT32:
+        return np.frombuffer(data, dtype="<f4").tolist()
+    if code == _EXT_FLOAT16:
+        return np.frombuffer(data, dtype="<f2").astype("<f4").tolist()
+    if code == _EXT_FLOAT64:
+        return np.frombuffer(data, dtype="<f8").tolist()
+    return msgpack.ExtType(code, data)
+
+
+def encode_record(
+    features: Dict[str, Any],
+    encoding: str = ENCODING_MSGPACK,
+    narrow: AbstractSet[str] = frozenset()
+) -> bytes:
+    if encoding == ENCODING_JSON:
+        return json.dumps(features, default=_default).encode("utf-8")
+    
+    if encoding not in _CODEC_IDS:
+        raise ValueError(f"Unsupported online encoding: {encoding}")
+    
+    narrow_ext = _EXT_FLOAT16 if encoding == ENCODING_MSGPACK_F16 else _EXT_FLOAT32
+    packed = {
+        key: _pack_value(value, narrow_ext if key in narrow else None)
+        for key, value in features.items()
+    }
+    header = RECORD_MAGIC + bytes([RECORD_VERSION, _CODEC_IDS[encoding]])
+    return header + msgpack.packb(packed, default=_default, use_bin_type=True)
+
+
+def decode_record(payload: Union[bytes, str]) -> Dict[str, Any]:
+    if isinstance(payload, str):
+        return json.loads(payload)
+    
+    if not payload.startswith(RECORD_MAGIC):
+        return json.loads(payload)
+    
+    version = payload[len(RECORD_MAGIC)]
+    if version != RECORD_VERSION:
+        raise ValueError(f"Unsupported feature record version: {version}")
+    
+    return msgpack.unpackb(payload[len(RECORD_MAGIC) + 2:], ext_hook=_ext_hook, raw=False)
@@ -0,0 +1,70 @@
+from typing import List, Optional
+import pandas as pd
+
+ROW_ID_COLUMN = "__row_id"
+FEATURE_TIMESTAMP_COLUMN = "__feature_timestamp"
+
+
+def prepare_entity_frame(entity_df: pd.DataFrame, timestamp_column: str) -> pd.DataFrame:
+    if timestamp_column not in entity_df.columns:
+        raise ValueError(f"Missing timestamp column: {timestamp_column}")
+    
+    entity_df = entity_df.reset_index(drop=True).copy()
+    entity_df[timestamp_column] = pd.to_datetime(entity_df[timestamp_column], utc=True)
+    
+    if entity_df[timestamp_column].isna().any():
+        raise ValueError(f"Timestamp column {timestamp_column} contains nulls")
+    
+    entity_df[ROW_ID_COLUMN] = range(len(entity_df))
+    return entity_df
+
+
+def point_in_time_join(
+    entity_df: pd.DataFrame,
+    feature_df: pd.DataFrame,
+    entity_columns: List[str],
+    timestamp_column: str,
+    feature_timestamp_column: str,
+    feature_names: List[str],
+    prefix: str,
+    tiebreak_columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    output_columns = [f"{prefix}{name}" for name in feature_names]
+    
+    if feature_df.empty:
+        return pd.DataFrame(None, index=entity_df.index, columns=output_columns)
+    
+    sort_columns = [FEATURE_TIMESTAMP_COLUMN] + [
+        c for c in tiebreak_columns or [] if c in feature_df.columns
+    ]
+    right = pd.DataFrame({
+        col: feature_df[col].astype(entity_df[col].dtype) for col in entity_columns
+    })
+    right[FEATURE_TIMESTAMP_COLUMN] = pd.to_datetime(feature_df[feature_timestamp_column], utc=True)
+    for column in sort_columns[1:]:
+        right[column] = feature_df[column]
+    for name, output in zip(feature_names, output_columns):
+        right[output] = feature_df[name] if name in feature_df.columns else None
+    
+    right = right.dropna(subset=[FEATURE_TIMESTAMP_COLUMN]).sort_values(sort_columns, kind="stable")
+    left = entity_df[[ROW_ID_COLUMN] + entity_columns + [timestamp_column]].sort_values(
+        timestamp_column,
+        kind="stable"
+    )
+    
+    merged = pd.merge_asof(
+        left,
+        right[entity_columns + [FEATURE_TIMESTAMP_COLUMN] + output_columns],
+        left_on=timestamp_column,
+        right_on=FEATURE_TIMESTAMP_COLUMN,
+        by=entity_columns if len(entity_columns) > 1 else entity_columns[0],
+        direction="backward",
+        allow_exact_matches=True
+    )
+    
+    joined = merged.set_index(ROW_ID_COLUMN)[output_columns].sort_index()
+    return joined.set_axis(entity_df.index)
+
+
+def assemble_training_frame(entity_df: pd.DataFrame, joined: List[pd.DataFrame]) -> pd.DataFrame:
+    return pd.concat([entity_df] + joined, axis=1).drop(columns=[ROW_ID_COLUMN])
@@ -0,0 +1,133 @@
+from typing import List, Tuple, Union
+from dataclasses import dataclass
+import re
+
+SEARCH_ENTITIES = {
+    "metrics": "metric",
+    "metric": "metric",
+    "params": "param",
+    "param": "param",
+    "tags": "tag",
+    "tag": "tag",
+    "attributes": "attribute",
+    "attribute": "attribute"
+}
+RUN_ATTRIBUTES = ("status", "run_name", "start_time", "end_time")
+FILTER_ATTRIBUTES = ("status", "run_name")
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w.])
+        |(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<op><=|>=|!=|==|=|<|>)
+        |(?P<name>[A-Za-z_][\w\-/]*(?:\.(?:`[^`]+`|[\w.\-/:]+))?)
+    )""",
+    re.VERBOSE
+)
+
+
+@dataclass(frozen=True)
+class SearchClause:
+    entity: str
+    key: str
+    op: str
+    value: Union[str, float]
+
+
+def _tokenize(expression: str) -> List[tuple]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Unexpected input at position {position}: {expression[position:position + 20]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    
+    return tokens
+
+
+def _unquote(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value[1:-1])
+
+
+def _parse_identifier(name: str) -> tuple:
+    prefix, _, key = name.partition(".")
+    entity = SEARCH_ENTITIES.get(prefix.lower())
+    
+    if entity is None:
+        if name in RUN_ATTRIBUTES:
+            return "attribute", name
+        raise ValueError(f"Unknown search field: {name}")
+    if not key:
+        raise ValueError(f"Missing key after {prefix}.")
+    if entity == "attribute" and key not in RUN_ATTRIBUTES:
+        raise ValueError(f"Unknown run attribute: {key}")
+    
+    return entity, key.strip("`")
+
+
+def _parse_clause(tokens: List[tuple]) -> SearchClause:
+    if len(tokens) != 3 or tokens[0][0] != "name" or tokens[1][0] != "op":
+        text = " ".join(value for _, value in tokens)
+        raise ValueError(f"Expected '<field> <op> <value>', got {text!r}")
+    
+    entity, key = _parse_identifier(tokens[0][1])
+    op = "=" if tokens[1][1] == "==" else tokens[1][1]
+    kind, raw = tokens[2]
+    
+    if kind == "number":
+        value: Union[str, float] = float(raw)
+    elif kind == "string":
+        value = _unquote(raw)
+    elif kind == "name":
+        value = raw
+    else:
+        raise ValueError(f"Expected a value after {tokens[1][1]}")
+    
+    if entity == "metric" and not isinstance(value, float):
+        raise ValueError(f"Metric {key} must be compared with a number")
+    if entity == "attribute" and key not in FILTER_ATTRIBUTES:
+        raise ValueError(f"Runs cannot be filtered by {key}")
+    if entity in ("tag", "attribute") and op not in ("=", "!="):
+        raise ValueError(f"{entity.capitalize()} {key} only supports = and !=")
+    if entity in ("tag", "attribute") and isinstance(value, float):
+        value = raw
+    if entity == "param" and isinstance(value, str) and op not in ("=", "!="):
+        raise ValueError(f"Parameter {key} can only be ordered against a number")
+    
+    return SearchClause(entity=entity, key=key, op=op, value=value)
+
+
+def parse_order_by(expression: str) -> Tuple[str, str, bool]:
+    field, _, direction = expression.strip().partition(" ")
+    direction = direction.strip().lower() or "asc"
+    if direction not in ("asc", "desc"):
+        raise ValueError(f"Invalid sort direction: {direction}")
+    
+    entity, key = _parse_identifier(field)
+    if entity in ("param", "tag"):
+        raise ValueError("Runs can only be ordered by metrics or run attributes")
+    
+    return entity, key, direction == "desc"
+
+
+def parse_search(expression: str) -> List[SearchClause]:
+    if not expression or not expression.strip():
+        return []
+    
+    clauses = []
+    current: List[tuple] = []
+    
+    for kind, value in _tokenize(expression):
+        if kind == "name" and value.lower() == "and":
+            clauses.append(_parse_clause(current))
+            current = []
+        else:
+            current.append((kind, value))
+    clauses.append(_parse_clause(current))
+    
+    return clauses
@@ -0,0 +1,304 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+ARITHMETIC_OPS = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": np.divide
+}
+ROLLING_AGGREGATIONS = ("mean", "sum", "min", "max", "count", "std")
+
+Columns = Mapping[str, np.ndarray]
+
+
+@dataclass
+class CompiledTransformation:
+    name: str
+    inputs: List[str]
+    fn: Callable[[Columns], np.ndarray]
+    on_demand: bool = False
+    window: Optional[Any] = None
+    aggregation: Optional[str] = None
+    
+    @property
+    def is_rolling(self) -> bool:
+        return self.aggregation is not None
+
+
+def _as_float(values: Any) -> np.ndarray:
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype="float64", na_value=np.nan)
+    return np.asarray(values, dtype="float64")
+
+
+def _operand(value: Any, inputs: List[str]) -> Callable[[Columns], Any]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return lambda columns: float(value)
+    if isinstance(value, str):
+        inputs.append(value)
+        return lambda columns: columns[value]
+    raise ValueError(f"Invalid transformation operand: {value!r}")
+
+
+def _compile_arithmetic(spec: Dict[str, Any], inputs: List[str]) -> Callable[[Columns], np.ndarray]:
+    op = ARITHMETIC_OPS[spec["op"]]
+    operands = [_operand(value, inputs) for value in spec.get("inputs", [])]
+    
+    if len(operands) < 2 or (spec["op"] in ("sub", "div") and len(operands) != 2):
+        raise ValueError(f"Transformation {spec['op']} has the wrong number of inputs")
+    if not inputs:
+        raise ValueError(f"Transformation {spec['op']} needs at least one column input")
+    
+    def fn(columns: Columns) -> np.ndarray:
+        result = operands[0](columns)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for operand in operands[1:]:
+                result = op(result, operand(columns))
+        result = np.asarray(result, dtype="float64")
+        result[np.isinf(result)] = np.nan
+        return result
+    
+    return fn
+
+
+def _compile_log(spec: Dict[str, Any], inputs: List[str]) -> Callable[[Columns], np.ndarray]:
+    source = _operand(spec.get("input"), inputs)
+    offset = float(spec.get("offset", 0.0))
+    
+    def fn(columns: Columns) -> np.ndarray:
+        shifted = source(columns) + offset
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.log(shifted)
+        result[shifted <= 0] = np.nan
+        return result
+    
+    return fn
+
+
+def _compile_bucketize(spec: Dict[str, Any], inputs: List[str]) -> Callable[[Columns], np.ndarray]:
+    source = _operand(spec.get("input"), inputs)
+    boundaries = np.asarray(spec.get("boundaries") or [], dtype="float64")
+    
+    if not len(boundaries) or np.any(np.diff(boundaries) <= 0):
+        raise ValueError("Bucketize boundaries must be a non-empty increasing list")
+    
+    def fn(columns: Columns) -> np.ndarray:
+        values = source(columns)
+        result = np.digitize(values, boundaries).astype("float64")
+        result[np.isnan(values)] = np.nan
+        return result
+    
+    return fn
+
+
+def _parse_window(window: Any) -> Any:
+    if isinstance(window, int) and not isinstance(window, bool) and window > 0:
+        return window
+    if isinstance(window, str):
+        try:
+            return pd.Timedelta(window)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid rolling window: {window!r}")
+
+
+def compile_transformation(name: str, spec: Dict[str, Any]) -> CompiledTransformation:
+    if not isinstance(spec, dict) or "op" not in spec:
+        raise ValueError(f"Transformation for {name} must be an object with an 'op'")
+    
+    op = spec["op"]
+    inputs: List[str] = []
+    
+    if op == "rolling":
+        aggregation = spec.get("agg", "mean")
+        if aggregation not in ROLLING_AGGREGATIONS:
+            raise ValueError(f"Unsupported rolling aggregation: {aggregation}")
+        if not isinstance(spec.get("input"), str):
+            raise ValueError("Rolling transformations need a column input")
+        
+        return CompiledTransformation(
+            name=name,
+            inputs=[spec["input"]],
+            fn=lambda columns: columns[spec["input"]],
+            window=_parse_window(spec.get("window")),
+            aggregation=aggregation
+        )
+    
+    if op in ARITHMETIC_OPS:
+        fn = _compile_arithmetic(spec, inputs)
+    elif op == "log":
+        fn = _compile_log(spec, inputs)
+    elif op == "bucketize":
+        fn = _compile_bucketize(spec, inputs)
+    else:
+        raise ValueError(f"Unsupported transformation op: {op}")
+    
+    return CompiledTransformation(
+        name=name,
+        inputs=inputs,
+        fn=fn,
+        on_demand=bool(spec.get("on_demand", False))
+    )
+
+
+def _order_steps(steps: List[CompiledTransformation]) -> List[CompiledTransformation]:
+    by_name = {step.name: step for step in steps}
+    ordered: List[CompiledTransformation] = []
+    state: Dict[str, int] = {}
+    
+    def visit(step: CompiledTransformation):
+        if state.get(step.name) == 2:
+            return
+        if state.get(step.name) == 1:
+            raise ValueError(f"Transformation cycle involving {step.name}")
+        
+        state[step.name] = 1
+        for dependency in step.inputs:
+            if dependency in by_name:
+                visit(by_name[dependency])
+        state[step.name] = 2
+        ordered.append(step)
+    
+    for step in steps:
+        visit(step)
+    
+    return ordered
+
+
+class _LazyColumns(dict):
+    def __init__(self, source: Callable[[str], Optional[np.ndarray]]):
+        super().__init__()
+        self._source = source
+    
+    def __missing__(self, key: str) -> np.ndarray:
+        values = self._source(key)
+        if values is None:
+            raise KeyError(key)
+        self[key] = values
+        return values
+
+
+class TransformationPlan:
+    def __init__(self, steps: List[CompiledTransformation]):
+        self.steps = _order_steps(steps)
+        self.rolling_steps = [s for s in self.steps if s.is_rolling]
+        self.ingest_steps = [s for s in self.steps if not s.is_rolling and not s.on_demand]
+        self.on_demand_steps = [s for s in self.steps if not s.is_rolling and s.on_demand]
+    
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+    
+    @staticmethod
+    def _evaluate(
+        steps: List[CompiledTransformation],
+        columns: Dict[str, np.ndarray],
+        skip: Tuple[str, ...] = ()
+    ) -> Dict[str, np.ndarray]:
+        outputs: Dict[str, np.ndarray] = {}
+        
+        for step in steps:
+            if step.name in skip:
+                continue
+            try:
+                outputs[step.name] = columns[step.name] = step.fn(columns)
+            except KeyError:
+                continue
+        
+        return outputs
+    
+    def apply_table(self, table: pa.Table) -> pa.Table:
+        if not self.ingest_steps:
+            return table
+        
+        def source(name: str) -> Optional[np.ndarray]:
+            if name not in table.column_names:
+                return None
+            return _as_float(table.column(name).to_pandas())
+        
+        outputs = self._evaluate(self.ingest_steps, _LazyColumns(source), skip=tuple(table.column_names))
+        for name, values in outputs.items():
+            table = table.append_column(name, pa.array(values, pa.float64(), from_pandas=True))
+        
+        return table
+    
+    def apply_records(self, records: List[Optional[Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        if not self.on_demand_steps:
+            return records
+        
+        records = [dict(record) if record is not None else None for record in records]
+        present = [record for record in records if record is not None]
+        if not present:
+            return records
+        
+        def source(name: str) -> Optional[np.ndarray]:
+            if not any(name in record for record in present):
+                return None
+            return _as_float([record.get(name) for record in present])
+        
+        outputs = self._evaluate(self.on_demand_steps, _LazyColumns(source))
+        for name, values in outputs.items():
+            for record, value in zip(present, values.tolist()):
+                record[name] = None if value != value else value
+        
+        return records
+    
+    def apply_frame(
+        self,
+        df: pd.DataFrame,
+        entity_columns: List[str],
+        time_column: str,
+        include_on_demand: bool = True
+    ) -> pd.DataFrame:
+        steps = [s for s in self.steps if include_on_demand or not s.on_demand]
+        if not steps or df.empty:
+            return df
+        
+        df = df.sort_values(entity_columns + [time_column], kind="stable").reset_index(drop=True)
+        
+        for step in steps:
+            if step.name in df.columns or any(i not in df.columns for i in step.inputs):
+                continue
+            
+            if step.is_rolling:
+                df[step.name] = self._rolling(df, step, entity_columns, time_column)
+            else:
+                columns = _LazyColumns(lambda name: _as_float(df[name]) if name in df.columns else None)
+                outputs = self._evaluate([step], columns)
+                if step.name in outputs:
+                    df[step.name] = outputs[step.name]
+        
+        return df
+    
+    @staticmethod
+    def _rolling(
+        df: pd.DataFrame,
+        step: CompiledTransformation,
+        entity_columns: List[str],
+        time_column: str
+    ) -> np.ndarray:
+        values = pd.Series(_as_float(df[step.inputs[0]]), index=df.index)
+        
+        if isinstance(step.window, pd.Timedelta):
+            values.index = pd.DatetimeIndex(pd.to_datetime(df[time_column], utc=True))
+        
+        grouped = values.groupby(
+            [df[col].to_numpy() for col in entity_columns],
+            sort=False,
+            dropna=False,
+            group_keys=False
+        )
+        rolled = getattr(grouped.rolling(step.window, min_periods=1), step.aggregation)()
+        
+        # Rows are sorted by entity and time, so groups are contiguous and the
+        # rolled values already line up with the frame.
+        return rolled.to_numpy()
+
+
+def compile_plan(transformations: Dict[str, Dict[str, Any]]) -> TransformationPlan:
+    return TransformationPlan([
+        compile_transformation(name, spec) for name, spec in transformations.items()
+    ])
@@ -53,6 +53,13 @@ export const experimentsApi = {
   logMetrics: (runId: number, metrics: any[]) => api.post(`/experiments/runs/${runId}/metrics`, metrics),
   logParameters: (runId: number, parameters: any[]) => api.post(`/experiments/runs/${runId}/parameters`, parameters),
   getMetrics: (runId: number) => api.get(`/experiments/runs/${runId}/metrics`),
+  getMetricHistory: (runId: number, params?: { keys?: string[]; step_min?: number; step_max?: number; max_points?: number; method?: 'lttb' | 'minmax' }) =>
+    api.get(`/experiments/runs/${runId}/metrics/history`, { params, paramsSerializer: { indexes: null } }),
+  streamMetrics: (runId: number, signal?: AbortSignal) =>
+    fetch(`${API_URL}/api/v1/experiments/runs/${runId}/metrics/stream`, {
+      headers: { Authorization: `Bearer ${localStorage.getItem('access_token') ?? ''}` },
+      signal,
+    }),
 }
 
 export const modelsApi = {
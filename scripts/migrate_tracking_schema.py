@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+
+from backend.core.database import Base, engine
+from backend.models.experiment import ExperimentRun, Metric, MetricSummary, Parameter
+
+# create_all only creates missing tables; columns added to existing tables
+# since the first deploy have to be added here.
+ADDED_COLUMNS = {
+    "experiment_runs": {"metrics_archive": "VARCHAR(500)"},
+    "parameters": {"value_float": "DOUBLE PRECISION"},
+    "metric_summaries": {"sum_value": "DOUBLE PRECISION NOT NULL DEFAULT 0"}
+}
+
+
+def _migrate(connection):
+    Base.metadata.create_all(connection, tables=[MetricSummary.__table__])
+    inspector = inspect(connection)
+    
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        for name, ddl in columns.items():
+            if name not in existing:
+                print(f"Adding {table}.{name}")
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+    
+    if connection.dialect.name == "postgresql":
+        tags = next(c for c in inspector.get_columns("experiment_runs") if c["name"] == "tags")
+        if tags["type"].__class__.__name__ != "JSONB":
+            print("Converting experiment_runs.tags to JSONB")
+            connection.execute(text("ALTER TABLE experiment_runs ALTER COLUMN tags TYPE JSONB USING tags::jsonb"))
+    
+    for model in (ExperimentRun, Parameter, Metric, MetricSummary):
+        for index in model.__table__.indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def migrate_tracking_schema(args):
+    async with engine.begin() as connection:
+        await connection.run_sync(_migrate)
+    
+    if args.backfill:
+        from backend.tasks.tracking_tasks import backfill_run_search_task
+        result = backfill_run_search_task.delay()
+        print(f"Queued run search backfill: {result.id}")
+    
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bring an existing tracking database up to the current schema")
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Queue the one-off task that fills parameter floats and metric summaries for existing runs"
+    )
+    
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(migrate_tracking_schema(parser.parse_args()))
@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from backend.core.config import settings
+from backend.core.database import async_session_maker, engine
+from backend.core.redis_pool import close_redis, init_redis
+from backend.models.feature import FeatureGroup
+from backend.services.feature_registry import listen_for_invalidations
+from backend.services.feature_stream import FeatureStreamConsumer
+
+
+async def _stream_groups(names):
+    if names:
+        return names
+    
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(FeatureGroup.name).where(
+                FeatureGroup.online_enabled.is_(True) | FeatureGroup.offline_enabled.is_(True)
+            )
+        )
+        return list(result.scalars().all())
+
+
+async def run_feature_stream_worker(args):
+    redis_client = init_redis()
+    group_names = await _stream_groups(args.groups)
+    if not group_names:
+        print("No feature groups to consume")
+        return
+    
+    consumer = FeatureStreamConsumer(
+        group_names,
+        consumer_name=args.consumer,
+        redis_client=redis_client,
+        batch_size=args.batch_size,
+        linger_ms=args.linger_ms
+    )
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, consumer.stop)
+    
+    invalidation_listener = asyncio.create_task(listen_for_invalidations(redis_client))
+    print(f"Consuming feature streams for: {', '.join(group_names)}")
+    
+    try:
+        await consumer.run()
+    finally:
+        invalidation_listener.cancel()
+        await close_redis()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consume feature rows from Redis Streams")
+    parser.add_argument("--groups", nargs="*", help="Feature group names (default: all)")
+    parser.add_argument("--consumer", help="Consumer name within the group (default: hostname)")
+    parser.add_argument("--batch-size", type=int, default=settings.FEATURE_STREAM_BATCH_SIZE)
+    parser.add_argument("--linger-ms", type=int, default=settings.FEATURE_STREAM_LINGER_MS)
+    
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_feature_stream_worker(parser.parse_args()))
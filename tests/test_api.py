@@ -17,3 +17,29 @@ async def test_root():
         response = await client.get("/")
         assert response.status_code == 200
         assert "Zenith" in response.json()["message"]
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_rejected_past_byte_limit():
+    from fastapi import HTTPException
+    from starlette.requests import Request
+    from backend.core.request_body import read_capped_body
+    
+    def make_request(chunks, headers=()):
+        messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+        messages.append({"type": "http.request", "body": b"", "more_body": False})
+        
+        async def receive():
+            return messages.pop(0)
+        
+        return Request({"type": "http", "method": "POST", "headers": list(headers)}, receive)
+    
+    assert await read_capped_body(make_request([b"1234", b"5678"]), 8) == b"12345678"
+    
+    with pytest.raises(HTTPException) as streamed:
+        await read_capped_body(make_request([b"12345", b"6789"]), 8)
+    assert streamed.value.status_code == 413
+    
+    with pytest.raises(HTTPException) as declared:
+        await read_capped_body(make_request([b"1"], headers=[(b"content-length", b"100")]), 8)
+    assert declared.value.status_code == 413
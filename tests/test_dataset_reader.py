@@ -0,0 +1,54 @@
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+from backend.utils.dataset_reader import parse_filter, scan_dataset
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    path = tmp_path / "data.parquet"
+    pq.write_table(
+        pa.table({
+            "id": list(range(20)),
+            "group": [i % 3 for i in range(20)],
+            "name": [f"row-{i}" for i in range(20)]
+        }),
+        path,
+        row_group_size=6
+    )
+    return str(path)
+
+
+def _read(path, **kwargs) -> pa.Table:
+    schema, batches = scan_dataset([path], batch_size=4, **kwargs)
+    return pa.Table.from_batches(list(batches), schema=schema)
+
+
+def test_row_range_read_spans_row_groups_with_projection(parquet_path):
+    table = _read(parquet_path, columns=["name"], row_start=4, row_end=14)
+    
+    assert table.column_names == ["name"]
+    assert table.column("name").to_pylist() == [f"row-{i}" for i in range(4, 14)]
+
+
+def test_row_range_read_filters_on_unprojected_columns(parquet_path):
+    table = _read(
+        parquet_path,
+        columns=["id"],
+        filters=[parse_filter("group == 0")],
+        row_start=5,
+        row_end=15
+    )
+    
+    assert table.column_names == ["id"]
+    assert table.column("id").to_pylist() == [6, 9, 12]
+
+
+def test_filtered_read_without_row_range(parquet_path):
+    table = _read(parquet_path, filters=[parse_filter("id >= 17"), parse_filter("name != 'row-18'")])
+    
+    assert table.column_names == ["id", "group", "name"]
+    assert table.column("id").to_pylist() == [17, 19]
+    
+    with pytest.raises(ValueError):
+        _read(parquet_path, filters=[parse_filter("missing == 1")])
@@ -0,0 +1,29 @@
+import statistics
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+from backend.utils.dataset_stats import compute_parquet_stats, compute_table_stats, merge_stats, summarize_stats
+
+
+def test_footer_stats_merge_across_chunks_matches_full_scan(tmp_path):
+    first = pa.table({"x": [1.0, 2.0, None, 4.0], "label": ["a", None, "b", "c"]})
+    second = pa.table({"x": [10.0, None, -3.0], "label": [None, None, "d"]})
+    pq.write_table(first, tmp_path / "a.parquet", row_group_size=2)
+    pq.write_table(second, tmp_path / "b.parquet", write_statistics=False)
+    
+    partials = [compute_parquet_stats(str(tmp_path / name)) for name in ("a.parquet", "b.parquet")]
+    summary = summarize_stats(merge_stats(partials))
+    
+    values = [1.0, 2.0, 4.0, 10.0, -3.0]
+    assert summary["num_rows"] == 7
+    assert summary["missing_values"] == {"x": 2, "label": 3}
+    assert summary["numeric_summary"]["x"]["count"] == len(values)
+    assert summary["numeric_summary"]["x"]["mean"] == pytest.approx(statistics.mean(values))
+    assert summary["numeric_summary"]["x"]["std"] == pytest.approx(statistics.stdev(values))
+    assert summary["numeric_summary"]["x"]["min"] == -3.0
+    assert summary["numeric_summary"]["x"]["max"] == 10.0
+    assert "label" not in summary["numeric_summary"]
+    
+    in_memory = summarize_stats(merge_stats([compute_table_stats(first), compute_table_stats(second)]))
+    assert in_memory["missing_values"] == summary["missing_values"]
+    assert in_memory["numeric_summary"]["x"] == pytest.approx(summary["numeric_summary"]["x"])
@@ -0,0 +1,61 @@
+from datetime import date
+import pytest
+import pyarrow as pa
+from backend.services.dataset_store import ChunkStore, _hash_table
+from backend.utils.dataset_reader import parse_filter, scan_dataset
+
+
+def test_hash_ignores_chunk_layout():
+    table = pa.table({"id": list(range(10)), "name": [f"row-{i}" for i in range(10)]})
+    rechunked = pa.Table.from_batches(table.to_batches(max_chunksize=3))
+    
+    assert rechunked.column("id").num_chunks > 1
+    assert _hash_table(rechunked) == _hash_table(table)
+    assert _hash_table(table.slice(1)) != _hash_table(table)
+
+
+def test_date_partition_filters_cast_string_literals(tmp_path):
+    days = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    table = pa.table({"day": pa.array(days * 2, pa.date32()), "value": list(range(6))})
+    store = ChunkStore(tmp_path)
+    manifest = store.write_batches(table.schema, iter(table.to_batches()), ["day"])
+    filters = [parse_filter("day >= '2024-01-02'")]
+    
+    entries = ChunkStore.select_chunks(manifest, filters)
+    assert sorted(entry["partition"]["day"] for entry in entries) == ["2024-01-02", "2024-01-03"]
+    
+    _, batches = scan_dataset(**store.scan_source(manifest, entries), filters=filters)
+    result = pa.Table.from_batches(list(batches))
+    assert sorted(result.column("value").to_pylist()) == [1, 2, 4, 5]
+    
+    with pytest.raises(ValueError):
+        ChunkStore.select_chunks(manifest, [parse_filter("day >= 'yesterday'")])
+
+
+def test_partition_filters_prune_chunks_before_scanning(tmp_path):
+    table = pa.table({
+        "region": ["eu", "us", None, "eu", "apac", "us"],
+        "year": [2023, 2023, 2024, 2024, 2024, 2024],
+        "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    })
+    store = ChunkStore(tmp_path)
+    manifest = store.write_batches(table.schema, iter(table.to_batches()), ["region", "year"])
+    
+    assert len(manifest["chunks"]) == 6
+    assert ChunkStore.select_chunks(manifest) == manifest["chunks"]
+    
+    entries = ChunkStore.select_chunks(manifest, [parse_filter("region in ('eu', 'us')"), parse_filter("year >= 2024")])
+    assert [entry["partition"] for entry in entries] == [
+        {"region": "eu", "year": "2024"},
+        {"region": "us", "year": "2024"}
+    ]
+    assert ChunkStore.manifest_stats(manifest, entries)["num_rows"] == 2
+    
+    nulls = ChunkStore.select_chunks(manifest, [parse_filter("region == null")])
+    assert [entry["num_rows"] for entry in nulls] == [1]
+    
+    # Non-partition filters are left to the scan and never prune chunks.
+    assert ChunkStore.select_chunks(manifest, [parse_filter("value > 100")]) == manifest["chunks"]
+    
+    _, batches = scan_dataset(**store.scan_source(manifest, entries), filters=[parse_filter("value > 4")])
+    assert pa.Table.from_batches(list(batches)).column("value").to_pylist() == [6.0]
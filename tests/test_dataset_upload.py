@@ -0,0 +1,58 @@
+import io
+import pytest
+import pyarrow as pa
+from backend.core.config import settings
+from backend.services.data import DataService, _ingest_upload
+from backend.services.dataset_store import ChunkStore
+from backend.utils.dataset_reader import scan_dataset
+
+
+class FakeUpload:
+    def __init__(self, data: bytes, filename: str = "data.csv"):
+        self.filename = filename
+        self._buffer = io.BytesIO(data)
+    
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+def _spooling_service(upload_path) -> DataService:
+    service = DataService.__new__(DataService)
+    service.upload_path = upload_path
+    return service
+
+
+@pytest.mark.asyncio
+async def test_spool_rejects_uploads_over_the_size_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 10)
+    service = _spooling_service(tmp_path)
+    
+    spool_path, size_bytes = await service._spool_upload(FakeUpload(b"0123456789"))
+    assert size_bytes == 10
+    assert spool_path.read_bytes() == b"0123456789"
+    
+    with pytest.raises(ValueError):
+        await service._spool_upload(FakeUpload(b"0123456789a"))
+    assert list(tmp_path.iterdir()) == [spool_path]
+
+
+def test_csv_upload_round_trips_through_parquet_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATASET_CHUNK_ROWS", 4)
+    csv_path = tmp_path / "upload.csv"
+    csv_path.write_text("id,name,score\n" + "".join(f"{i},row-{i},{i / 2}\n" for i in range(10)))
+    
+    manifest = _ingest_upload(csv_path, True, tmp_path / "store")
+    
+    assert manifest["num_rows"] == 10
+    assert len(manifest["chunks"]) == 3
+    assert all(entry["path"].endswith(".parquet") for entry in manifest["chunks"])
+    
+    store = ChunkStore(tmp_path / "store")
+    schema, batches = scan_dataset(**store.scan_source(manifest))
+    table = pa.Table.from_batches(list(batches), schema=schema)
+    
+    assert schema.field("id").type == pa.int64()
+    assert table.column("id").to_pylist() == list(range(10))
+    assert table.column("name").to_pylist() == [f"row-{i}" for i in range(10)]
+    assert table.column("score").to_pylist() == [i / 2 for i in range(10)]
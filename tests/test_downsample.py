@@ -0,0 +1,28 @@
+import numpy as np
+from backend.utils.downsample import lttb_indices, minmax_indices
+
+
+def test_lttb_keeps_endpoints_and_budget():
+    x = np.arange(10000)
+    y = np.sin(x / 100.0)
+    
+    indices = lttb_indices(x, y, 500)
+    
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == 9999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_minmax_preserves_spikes():
+    y = np.zeros(10000)
+    y[4321] = 100.0
+    y[8765] = -50.0
+    
+    indices = minmax_indices(y, 100)
+    
+    assert len(indices) <= 100
+    assert 4321 in indices and 8765 in indices
+
+
+def test_short_series_is_returned_unchanged():
+    assert lttb_indices(np.arange(5), np.arange(5), 100).tolist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,18 @@
+import pyarrow as pa
+from backend.utils.entity_keys import entity_key_mask
+
+
+def test_entity_key_mask_matches_composite_keys_with_list_columns():
+    table = pa.table({
+        "user_id": [1, 1, 2, 2],
+        "region": ["eu", "us", "eu", "us"],
+        "embedding": [[0.1, 0.2]] * 4
+    })
+    
+    matched = table.filter(entity_key_mask(table, [(1, "us"), (2, "eu"), (3, "eu")], ["user_id", "region"]))
+    
+    assert matched.select(["user_id", "region"]).to_pylist() == [
+        {"user_id": 1, "region": "us"},
+        {"user_id": 2, "region": "eu"}
+    ]
+    assert matched.column("embedding").to_pylist() == [[0.1, 0.2]] * 2
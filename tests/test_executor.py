@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from backend.core.executor import BoundedExecutor, ExecutorSaturatedError, ExecutorTimeoutError
+
+
+@pytest.mark.asyncio
+async def test_timed_out_work_keeps_its_slot_until_it_finishes():
+    executor = BoundedExecutor("test", ThreadPoolExecutor(max_workers=1), max_workers=1, max_queue=0)
+    release = threading.Event()
+    
+    with pytest.raises(ExecutorTimeoutError):
+        await executor.run("block", release.wait, timeout=0.05)
+    
+    assert executor.in_flight == 1
+    with pytest.raises(ExecutorSaturatedError):
+        await executor.run("next", lambda: None)
+    
+    release.set()
+    for _ in range(100):
+        if executor.in_flight == 0:
+            break
+        await asyncio.sleep(0.01)
+    
+    assert executor.in_flight == 0
+    assert await executor.run("next", lambda: 42) == 42
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_upload_through_timed_out_executor_returns_504(tmp_path, monkeypatch):
+    from httpx import AsyncClient
+    from backend.api.datasets import get_current_active_user, get_db
+    from backend.core import executor as executor_module
+    from backend.core.config import settings
+    from backend.main import app
+    from backend.services import data as data_module
+    
+    release = threading.Event()
+    executor = BoundedExecutor("process", ThreadPoolExecutor(max_workers=1), max_workers=1, max_queue=0)
+    
+    def init_service(self, db):
+        self.db = db
+        self.storage_path = tmp_path
+        self.upload_path = tmp_path / ".uploads"
+        self.upload_path.mkdir(exist_ok=True)
+    
+    async def no_db():
+        yield None
+    
+    monkeypatch.setattr(settings, "DATA_EXECUTOR_TIMEOUT", 0.05)
+    monkeypatch.setitem(executor_module._executors, "process", executor)
+    monkeypatch.setattr(data_module, "_ingest_upload", lambda *args: release.wait())
+    monkeypatch.setattr(data_module.DataService, "__init__", init_service)
+    app.dependency_overrides[get_current_active_user] = lambda: None
+    app.dependency_overrides[get_db] = no_db
+    
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/datasets",
+                params={"name": "slow", "project_id": 1, "version": "v1"},
+                files={"file": ("data.csv", b"a,b\n1,2\n", "text/csv")}
+            )
+    finally:
+        release.set()
+        app.dependency_overrides.clear()
+        executor.shutdown()
+    
+    assert response.status_code == 504
+    assert "timed out" in response.json()["detail"]
+    assert list((tmp_path / ".uploads").iterdir()) == []
@@ -0,0 +1,47 @@
+import json
+import pytest
+from backend.services import feature_cache
+from backend.services.feature_cache import (
+    ONLINE_INVALIDATION_CHANNEL, OnlineFeatureCache, is_missing, publish_online_invalidation
+)
+
+
+def test_near_cache_evicts_least_recently_used():
+    cache = OnlineFeatureCache(max_entries=2, ttl_seconds=60)
+    cache.put("features:users:1", "users", {"age": 1})
+    cache.put("features:users:2", "users", {"age": 2})
+    
+    cache.get("features:users:1")
+    cache.put("features:users:3", "users", {"age": 3})
+    
+    assert cache.get("features:users:1") == {"age": 1}
+    assert is_missing(cache.get("features:users:2"))
+    assert cache.stats()["evictions"] == 1
+
+
+def test_near_cache_invalidates_by_key_and_group():
+    cache = OnlineFeatureCache(max_entries=10, ttl_seconds=60)
+    cache.put("features:users:1", "users", {"age": 1})
+    cache.put("features:users:2", "users", {"age": 2})
+    cache.put("features:items:1", "items", {"price": 3})
+    
+    cache.invalidate(keys=["features:users:1"])
+    assert is_missing(cache.get("features:users:1"))
+    
+    cache.invalidate(group_name="users")
+    assert is_missing(cache.get("features:users:2"))
+    assert cache.get("features:items:1") == {"price": 3}
+
+
+@pytest.mark.asyncio
+async def test_writers_publish_invalidations_even_with_their_near_cache_off(monkeypatch):
+    published = []
+    
+    class FakeRedis:
+        async def publish(self, channel, message):
+            published.append((channel, json.loads(message)))
+    
+    monkeypatch.setattr(feature_cache, "online_feature_cache", OnlineFeatureCache(10, 60, enabled=False))
+    await publish_online_invalidation(FakeRedis(), "users", ["features:users:1"])
+    
+    assert published == [(ONLINE_INVALIDATION_CHANNEL, {"group": None, "keys": ["features:users:1"]})]
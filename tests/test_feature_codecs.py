@@ -0,0 +1,55 @@
+import json
+from backend.utils.feature_codecs import (
+    ENCODING_JSON, ENCODING_MSGPACK, ENCODING_MSGPACK_F16, decode_record, encode_record, is_embedding_dtype
+)
+
+
+def test_msgpack_round_trip_packs_embeddings():
+    features = {"user_id": "u1", "age": 31, "embedding": [0.5] * 64}
+    
+    payload = encode_record(features, ENCODING_MSGPACK, narrow={"embedding"})
+    
+    assert len(payload) < len(json.dumps(features))
+    assert decode_record(payload) == features
+
+
+def test_float16_encoding_is_lossy_but_close():
+    features = {"embedding": [0.1 * i for i in range(16)]}
+    
+    decoded = decode_record(encode_record(features, ENCODING_MSGPACK_F16, narrow={"embedding"}))
+    
+    assert all(abs(a - b) < 1e-2 for a, b in zip(decoded["embedding"], features["embedding"]))
+
+
+def test_undeclared_vectors_round_trip_exactly():
+    features = {
+        "item_ids": [2 ** 24 + i for i in range(16)],
+        "scores": [1 / 3 + i for i in range(16)],
+        "large": [1e6 * i for i in range(16)]
+    }
+    
+    for encoding in (ENCODING_MSGPACK, ENCODING_MSGPACK_F16):
+        assert decode_record(encode_record(features, encoding)) == features
+
+
+def test_float16_falls_back_to_float32_on_overflow():
+    features = {"embedding": [70000.0] * 16}
+    
+    decoded = decode_record(encode_record(features, ENCODING_MSGPACK_F16, narrow={"embedding"}))
+    
+    assert decoded == features
+
+
+def test_embedding_dtypes():
+    assert is_embedding_dtype("embedding")
+    assert is_embedding_dtype("vector[768]")
+    assert not is_embedding_dtype("float64")
+    assert not is_embedding_dtype(None)
+
+
+def test_legacy_json_records_remain_readable():
+    features = {"user_id": "u1", "score": 0.25}
+    
+    assert decode_record(json.dumps(features)) == features
+    assert decode_record(json.dumps(features).encode("utf-8")) == features
+    assert decode_record(encode_record(features, ENCODING_JSON)) == features
@@ -0,0 +1,107 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+from backend.schemas.feature import FeatureGroupSpec
+from backend.services import feature_registry
+from backend.services.feature_registry import (
+    INVALIDATION_CHANNEL, FeatureGroupCache, feature_group_cache, listen_for_invalidations, publish_invalidation
+)
+
+
+def _spec(group_id: int, name: str) -> FeatureGroupSpec:
+    return FeatureGroupSpec(
+        id=group_id,
+        name=name,
+        project_id=1,
+        online_enabled=True,
+        offline_enabled=True,
+        entity_columns=["user_id"]
+    )
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.channels = []
+        self.deliver = asyncio.Event()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def subscribe(self, *channels):
+        self.channels.extend(channels)
+    
+    async def listen(self):
+        await self.deliver.wait()
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class FakeRedis:
+    def __init__(self, messages=()):
+        self.published = []
+        self._pubsub = FakePubSub(list(messages))
+    
+    def pubsub(self):
+        return self._pubsub
+    
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+def test_group_cache_hits_by_id_and_name_until_ttl_expires(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(feature_registry, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    cache = FeatureGroupCache(ttl_seconds=30)
+    spec = _spec(1, "users")
+    
+    assert cache.get(group_id=1) is None
+    cache.put(spec)
+    assert cache.get(group_id=1) is spec
+    assert cache.get(name="users") is spec
+    
+    clock[0] += 31
+    assert cache.get(name="users") is None
+    assert cache.stats() == {"size": 1, "hits": 2, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_applied_locally_and_by_listeners():
+    feature_group_cache.clear()
+    feature_group_cache.put(_spec(1, "users"))
+    feature_group_cache.put(_spec(2, "items"))
+    
+    redis_client = FakeRedis()
+    await publish_invalidation(redis_client, name="users")
+    assert feature_group_cache.get(name="users") is None
+    assert redis_client.published == [(INVALIDATION_CHANNEL, {"group_id": None, "name": "users"})]
+    
+    message = {"type": "message", "channel": INVALIDATION_CHANNEL.encode(), "data": json.dumps({"group_id": 2})}
+    listener_redis = FakeRedis([message])
+    listener = asyncio.create_task(listen_for_invalidations(listener_redis))
+    
+    try:
+        pubsub = listener_redis.pubsub()
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if pubsub.channels:
+                break
+        assert pubsub.channels and feature_group_cache.get(group_id=2) is None
+        
+        # The listener clears the cache on (re)subscribe; repopulate it and
+        # only then deliver the remote invalidation.
+        feature_group_cache.put(_spec(2, "items"))
+        pubsub.deliver.set()
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if feature_group_cache.get(group_id=2) is None:
+                break
+        assert feature_group_cache.get(group_id=2) is None
+    finally:
+        listener.cancel()
+        feature_group_cache.clear()
@@ -0,0 +1,59 @@
+import pytest
+from backend.services.feature_stream import FeatureStreamConsumer, dead_letter_key
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def xadd(self, key, fields, **kwargs):
+        self.redis_client.dead_letters.append((key, fields))
+    
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self, claimed):
+        self.claimed = claimed
+        self.acked = []
+        self.dead_letters = []
+    
+    async def xautoclaim(self, *args, **kwargs):
+        return self.claimed
+    
+    async def xack(self, key, group, *ids):
+        self.acked.extend(ids)
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.mark.asyncio
+async def test_reclaim_acks_deleted_entries_and_dead_letters_malformed_ones():
+    redis_client = FakeRedis((b"0-0", [
+        (b"1-0", {b"data": b'{"user_id": 1}'}),
+        (b"2-0", None),
+        (b"3-0", {b"data": None}),
+        (b"4-0", {b"data": b"[1, 2]"})
+    ], [b"5-0"]))
+    consumer = FeatureStreamConsumer(["users"], consumer_name="test", redis_client=redis_client)
+    ingested = []
+    
+    async def ingest_rows(group_name, rows):
+        ingested.extend(rows)
+        return None
+    
+    consumer._ingest_rows = ingest_rows
+    await consumer._reclaim()
+    
+    assert ingested == [{"user_id": 1}]
+    assert sorted(redis_client.acked) == [b"1-0", b"2-0", b"3-0", b"4-0", b"5-0"]
+    assert [fields["id"] for _, fields in redis_client.dead_letters] == [b"3-0", b"4-0"]
+    assert {key for key, _ in redis_client.dead_letters} == {dead_letter_key("users")}
@@ -0,0 +1,46 @@
+import pyarrow as pa
+from backend.schemas.feature import FeatureGroupSpec
+from backend.services.materialization import build_materialization_table, latest_per_entity
+from backend.services.offline_store import INGESTED_AT_COLUMN, OfflineFeatureStore
+
+
+def test_latest_per_entity_keeps_newest_row_per_composite_key():
+    table = pa.table({
+        "user_id": [1, 1, 1, 2],
+        "region": ["eu", "eu", "us", "eu"],
+        "event_time": [1, 3, 2, 5],
+        "spend": [10.0, 30.0, 20.0, 50.0]
+    })
+    
+    latest = latest_per_entity(table, ["user_id", "region"], "event_time")
+    
+    assert latest.to_pylist() == [
+        {"user_id": 1, "region": "eu", "event_time": 3, "spend": 30.0},
+        {"user_id": 1, "region": "us", "event_time": 2, "spend": 20.0},
+        {"user_id": 2, "region": "eu", "event_time": 5, "spend": 50.0}
+    ]
+
+
+def test_incremental_materialization_filters_composite_keys_with_list_features(tmp_path):
+    offline_store = OfflineFeatureStore(tmp_path)
+    offline_store.append("users", pa.table({
+        "user_id": [1, 2, 1, 2],
+        "region": ["us", "eu", "eu", "us"],
+        "emb": [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]],
+        INGESTED_AT_COLUMN: pa.array([1000, 1000, 3000, 3000], pa.timestamp("us", tz="UTC"))
+    }))
+    group = FeatureGroupSpec(
+        id=1,
+        name="users",
+        project_id=1,
+        online_enabled=True,
+        offline_enabled=True,
+        entity_columns=["user_id", "region"]
+    )
+    
+    table = build_materialization_table(offline_store, group, since=2000, until=4000)
+    
+    assert table.select(["user_id", "region", "emb"]).to_pylist() == [
+        {"user_id": 1, "region": "eu", "emb": [1.0, 0.0]},
+        {"user_id": 2, "region": "us", "emb": [1.0, 1.0]}
+    ]
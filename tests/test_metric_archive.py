@@ -0,0 +1,62 @@
+from datetime import datetime
+import os
+import time
+import pyarrow as pa
+from backend.services.metric_archive import METRIC_ARCHIVE_SCHEMA, MetricArchive, summarize_archive
+
+
+def _rows(ids, keys, steps):
+    return pa.Table.from_pydict({
+        "id": ids,
+        "key": keys,
+        "value": [float(step) for step in steps],
+        "timestamp": [datetime(2026, 1, 1)] * len(ids),
+        "step": steps
+    }, schema=METRIC_ARCHIVE_SCHEMA)
+
+
+def test_archive_sorts_by_key_and_step_and_filters_reads(tmp_path):
+    archive = MetricArchive(tmp_path)
+    name = archive.write(42, archive.build([_rows([1, 2, 3, 4], ["loss", "acc", "loss", "acc"], [2, 1, 1, 2])]))
+    
+    table = archive.read(name)
+    assert table.column("key").to_pylist() == ["acc", "acc", "loss", "loss"]
+    assert table.column("step").to_pylist() == [1, 2, 1, 2]
+    
+    filtered = archive.read(name, keys=["loss"], step_min=2, columns=["step", "value"])
+    assert filtered.to_pylist() == [{"step": 2, "value": 2.0}]
+
+
+def test_rewriting_an_archive_merges_late_rows(tmp_path):
+    archive = MetricArchive(tmp_path)
+    first = archive.write(7, archive.build([_rows([1, 2], ["loss", "loss"], [1, 2])]))
+    second = archive.write(7, archive.build([_rows([3], ["loss"], [3])], previous=first))
+    archive.remove(first)
+    
+    assert second != first
+    assert not (tmp_path / first).exists()
+    assert archive.read(second).column("id").to_pylist() == [1, 2, 3]
+
+
+def test_retired_archives_age_from_retirement(tmp_path):
+    archive = MetricArchive(tmp_path)
+    name = archive.write(3, archive.build([_rows([1], ["loss"], [1])]))
+    path = tmp_path / name
+    os.utime(path, (0, 0))
+    
+    assert archive.stale_names(older_than=time.time() - 60) == [name]
+    
+    archive.retire(name)
+    assert archive.stale_names(older_than=time.time() - 60) == []
+
+
+def test_summarize_archive_reports_latest_point_per_key(tmp_path):
+    table = MetricArchive(tmp_path).build([_rows([1, 2, 3, 4], ["loss", "acc", "loss", "acc"], [5, 1, 2, 3])])
+    
+    summary = {row["key"]: row for row in summarize_archive(table)}
+    
+    assert summary["loss"]["step_last"] == 5
+    assert summary["loss"]["value_last"] == 5.0
+    assert summary["acc"]["value_min"] == 1.0
+    assert summary["acc"]["value_sum"] == 4.0
+    assert summary["acc"]["value_count"] == 2
@@ -0,0 +1,36 @@
+import json
+import pytest
+from backend.services.metric_stream import MetricStreamHub, MetricStreamSaturatedError
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events_and_reports_gap():
+    hub = MetricStreamHub(max_queue=2, max_subscribers=10)
+    subscription = hub.subscribe(7)
+    
+    for step in range(4):
+        hub.dispatch(7, ("metrics", json.dumps({"steps": [step]})))
+    
+    event, data = await subscription.next_event(timeout=0.1)
+    assert event == "gap"
+    assert json.loads(data) == {"dropped_events": 2}
+    
+    remaining = [await subscription.next_event(timeout=0.1) for _ in range(2)]
+    assert [json.loads(data)["steps"] for _, data in remaining] == [[2], [3]]
+    assert await subscription.next_event(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_hub_limits_subscribers_and_forgets_empty_runs():
+    hub = MetricStreamHub(max_queue=2, max_subscribers=1)
+    subscription = hub.subscribe(1)
+    assert not hub.has_capacity()
+    
+    with pytest.raises(MetricStreamSaturatedError):
+        hub.subscribe(2)
+    
+    hub.unsubscribe(subscription)
+    assert hub.has_capacity()
+    assert hub.stats()["runs"] == 0
+    hub.dispatch(1, ("metrics", "{}"))
+    assert subscription.queue.empty()
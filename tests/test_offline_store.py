@@ -0,0 +1,48 @@
+from pathlib import Path
+import pyarrow as pa
+import pyarrow.dataset as ds
+from backend.core.config import settings
+from backend.services import offline_store as offline_store_module
+from backend.services.offline_store import OfflineFeatureStore
+
+
+def _rows(store: OfflineFeatureStore, files=None) -> list:
+    if files is None:
+        table = store.read("users", columns=["user_id"])
+    else:
+        table = ds.dataset(files, format="parquet").to_table(columns=["user_id"])
+    return sorted(table.column("user_id").to_pylist())
+
+
+def test_append_during_compaction_keeps_every_row_visible(tmp_path, monkeypatch):
+    store = OfflineFeatureStore(tmp_path)
+    store.append("users", pa.table({"user_id": [1, 2], "score": [0.1, 0.2]}))
+    store.append("users", pa.table({"user_id": [3], "score": [0.3]}))
+    snapshot = store.list_files("users")
+    
+    write_parquet = offline_store_module._write_parquet_atomic
+    appended = []
+    
+    def write_part_with_concurrent_append(table, path, **kwargs):
+        # A writer lands a new segment while compaction is merging the old ones.
+        if "parts" in path.parts and not appended:
+            appended.append(store.append("users", pa.table({"user_id": [4], "score": [0.4]})))
+        write_parquet(table, path, **kwargs)
+    
+    monkeypatch.setattr(offline_store_module, "_write_parquet_atomic", write_part_with_concurrent_append)
+    summary = store.compact("users", ["user_id"])
+    
+    assert summary["segments_compacted"] == 2
+    assert appended[0].name not in store.load_manifest("users")["compacted_segments"]
+    assert _rows(store) == [1, 2, 3, 4]
+    # Readers that listed files before compaction can still open them.
+    assert _rows(store, snapshot) == [1, 2, 3]
+    
+    monkeypatch.setattr(offline_store_module, "_write_parquet_atomic", write_parquet)
+    monkeypatch.setattr(settings, "FEATURE_STORE_COMPACTION_GRACE_SECONDS", -1)
+    summary = store.compact("users", ["user_id"])
+    
+    assert summary["segments_compacted"] == 1
+    assert summary["total_parts"] == 2
+    assert not any(Path(path).exists() for path in snapshot)
+    assert _rows(store) == [1, 2, 3, 4]
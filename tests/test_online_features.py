@@ -0,0 +1,126 @@
+from datetime import datetime, timezone
+import time
+import pytest
+import pyarrow as pa
+from backend.schemas.feature import FeatureGroupSpec
+from backend.services import data as data_module
+from backend.core.config import settings
+from backend.services.data import FRESHNESS_FIELD, FeatureStoreService, _encode_online_rows
+from backend.services.offline_store import INGESTED_AT_COLUMN
+from backend.utils.entity_keys import online_key
+from backend.utils.feature_codecs import decode_record, encode_record
+
+
+class FakeRedis:
+    def __init__(self, records):
+        self.values = {key: encode_record(record) for key, record in records.items()}
+        self.mget_calls = []
+    
+    async def get(self, key):
+        return self.values.get(key)
+    
+    async def mget(self, keys):
+        self.mget_calls.append(list(keys))
+        return [self.values.get(key) for key in keys]
+
+
+def _group(group_id: int, name: str, entity_column: str, **kwargs) -> FeatureGroupSpec:
+    return FeatureGroupSpec(
+        id=group_id,
+        name=name,
+        project_id=1,
+        online_enabled=True,
+        offline_enabled=True,
+        entity_columns=[entity_column],
+        **kwargs
+    )
+
+
+def _service(monkeypatch, groups, records) -> FeatureStoreService:
+    async def get_feature_groups_by_name(db, names):
+        return {name: groups[name] for name in names if name in groups}
+    
+    async def get_feature_group(db, group_id=None, name=None):
+        return next((g for g in groups.values() if g.id == group_id or g.name == name), None)
+    
+    monkeypatch.setattr(data_module, "get_feature_groups_by_name", get_feature_groups_by_name)
+    monkeypatch.setattr(data_module, "get_feature_group", get_feature_group)
+    service = FeatureStoreService.__new__(FeatureStoreService)
+    service.db = None
+    service.redis_client = FakeRedis(records)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_assembles_columns_with_missing_keys(monkeypatch):
+    now = time.time()
+    groups = {"users": _group(1, "users", "user_id"), "items": _group(2, "items", "item_id")}
+    service = _service(monkeypatch, groups, {
+        online_key("users", [1]): {"age": 31, "country": "de", INGESTED_AT_COLUMN: now - 5},
+        online_key("users", [3]): {"age": 47},
+        online_key("items", [2]): {"price": 9.5}
+    })
+    
+    columns, freshness = await service.get_online_features_batch(
+        [1, 2, 3],
+        ["users:age", "users:country", "items:price"]
+    )
+    
+    assert columns == {
+        "users:age": [31, None, 47],
+        "users:country": ["de", None, None],
+        "items:price": [None, 9.5, None]
+    }
+    assert freshness["users"][0] == pytest.approx(5, abs=1)
+    assert freshness["users"][1:] == [None, None]
+    assert freshness["items"] == [None, None, None]
+    assert len(service.redis_client.mget_calls) == 1
+    assert len(service.redis_client.mget_calls[0]) == 6
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_rejects_unknown_groups_and_bad_refs(monkeypatch):
+    service = _service(monkeypatch, {"users": _group(1, "users", "user_id")}, {})
+    
+    with pytest.raises(ValueError):
+        await service.get_online_features_batch([1], ["missing:age"])
+    with pytest.raises(ValueError):
+        await service.get_online_features_batch([1], ["users"])
+
+
+def test_online_rows_get_the_full_ttl_and_keep_their_ingest_time():
+    ingested_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    table = pa.table({
+        "user_id": [1, 2],
+        "age": [31, 47],
+        INGESTED_AT_COLUMN: pa.array([ingested_at, None], pa.timestamp("us", tz="UTC"))
+    })
+    
+    rows = _encode_online_rows(table, _group(1, "users", "user_id", online_ttl_seconds=600))
+    assert [(key, ttl) for key, _, ttl in rows] == [(online_key("users", [1]), 600), (online_key("users", [2]), 600)]
+    assert decode_record(rows[0][1])[INGESTED_AT_COLUMN] == ingested_at.timestamp()
+    assert decode_record(rows[1][1])[INGESTED_AT_COLUMN] == pytest.approx(time.time(), abs=5)
+    
+    rows = _encode_online_rows(table, _group(1, "users", "user_id"))
+    assert {ttl for _, _, ttl in rows} == {settings.FEATURE_STORE_ONLINE_TTL}
+
+
+@pytest.mark.asyncio
+async def test_reads_drop_records_older_than_max_age(monkeypatch):
+    now = time.time()
+    groups = {"users": _group(1, "users", "user_id", max_staleness_seconds=60)}
+    service = _service(monkeypatch, groups, {
+        online_key("users", [1]): {"age": 31, INGESTED_AT_COLUMN: now - 10},
+        online_key("users", [2]): {"age": 47, INGESTED_AT_COLUMN: now - 120}
+    })
+    
+    fresh = await service.get_online_features(1, 1)
+    assert fresh["age"] == 31
+    assert fresh[FRESHNESS_FIELD] == pytest.approx(10, abs=1)
+    assert await service.get_online_features(1, 2) is None
+    assert (await service.get_online_features(1, 2, max_age_seconds=300))["age"] == 47
+    assert await service.get_online_features(1, 1, max_age_seconds=5) is None
+    
+    columns, freshness = await service.get_online_features_batch([1, 2], ["users:age"], max_age_seconds=30)
+    assert columns == {"users:age": [31, None]}
+    assert freshness["users"][1] is None
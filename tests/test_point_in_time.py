@@ -0,0 +1,89 @@
+import pandas as pd
+from backend.utils.point_in_time import (
+    assemble_training_frame, point_in_time_join, prepare_entity_frame
+)
+
+
+def _features():
+    return pd.DataFrame({
+        "user_id": [1, 1, 2, 1],
+        "event_time": pd.to_datetime(
+            ["2024-01-01", "2024-01-03", "2024-01-02", "2024-01-05"], utc=True
+        ),
+        "clicks": [10, 30, 20, 50]
+    })
+
+
+def test_point_in_time_join_uses_latest_value_as_of_each_row():
+    entities = prepare_entity_frame(
+        pd.DataFrame({
+            "user_id": [1, 1, 2, 2],
+            "event_timestamp": ["2024-01-04", "2024-01-01", "2024-01-01", "2024-01-06"]
+        }),
+        "event_timestamp"
+    )
+    
+    joined = point_in_time_join(
+        entities,
+        _features(),
+        entity_columns=["user_id"],
+        timestamp_column="event_timestamp",
+        feature_timestamp_column="event_time",
+        feature_names=["clicks"],
+        prefix="activity:"
+    )
+    result = assemble_training_frame(entities, [joined])
+    
+    assert list(result["user_id"]) == [1, 1, 2, 2]
+    assert result["activity:clicks"].tolist()[:2] == [30, 10]
+    assert pd.isna(result["activity:clicks"].iloc[2])
+    assert result["activity:clicks"].iloc[3] == 20
+
+
+def test_point_in_time_join_with_no_feature_rows():
+    entities = prepare_entity_frame(
+        pd.DataFrame({"user_id": [1], "event_timestamp": ["2024-01-04"]}),
+        "event_timestamp"
+    )
+    
+    joined = point_in_time_join(
+        entities,
+        pd.DataFrame(),
+        entity_columns=["user_id"],
+        timestamp_column="event_timestamp",
+        feature_timestamp_column="event_time",
+        feature_names=["clicks"],
+        prefix="activity:"
+    )
+    
+    assert list(joined.columns) == ["activity:clicks"]
+    assert len(joined) == 1
+
+
+def test_point_in_time_join_with_composite_entity_key():
+    entities = prepare_entity_frame(
+        pd.DataFrame({
+            "user_id": [1, 1],
+            "region": ["eu", "us"],
+            "event_timestamp": ["2024-01-04", "2024-01-04"]
+        }),
+        "event_timestamp"
+    )
+    features = pd.DataFrame({
+        "user_id": [1, 1],
+        "region": ["eu", "us"],
+        "event_time": pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True),
+        "spend": [5.0, 7.0]
+    })
+    
+    joined = point_in_time_join(
+        entities,
+        features,
+        entity_columns=["user_id", "region"],
+        timestamp_column="event_timestamp",
+        feature_timestamp_column="event_time",
+        feature_names=["spend"],
+        prefix="billing:"
+    )
+    
+    assert joined["billing:spend"].tolist() == [5.0, 7.0]
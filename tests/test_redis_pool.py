@@ -0,0 +1,24 @@
+import pytest
+import redis.asyncio as aioredis
+from backend.core import redis_pool
+from backend.core.config import settings
+
+
+@pytest.mark.asyncio
+async def test_shared_pool_is_created_once_and_reset_on_close(monkeypatch):
+    monkeypatch.setattr(redis_pool, "_client", None)
+    
+    client = redis_pool.init_redis()
+    assert redis_pool.get_redis() is client
+    assert redis_pool.init_redis() is client
+    assert isinstance(client.connection_pool, aioredis.BlockingConnectionPool)
+    assert client.connection_pool.max_connections == settings.REDIS_MAX_CONNECTIONS
+    assert redis_pool.redis_pool_stats()["in_use"] == 0
+    
+    await redis_pool.close_redis()
+    assert redis_pool._client is None
+    assert redis_pool.redis_pool_stats()["idle"] == 0
+    
+    reopened = redis_pool.get_redis()
+    assert reopened is not client
+    await redis_pool.close_redis()
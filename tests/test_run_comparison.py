@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from backend.services.tracking import align_series
+
+
+def _series():
+    return {
+        1: {"loss": (np.array([0, 10]), np.array([1.0, 0.0]))},
+        2: {"loss": (np.array([5, 20]), np.array([0.8, 0.2]))}
+    }
+
+
+def test_align_series_interpolates_onto_shared_grid():
+    aligned = align_series(_series(), grid_points=5)
+    
+    assert aligned["loss"]["steps"] == [0, 5, 10, 15, 20]
+    assert aligned["loss"]["values"][1] == [1.0, 0.5, 0.0, None, None]
+    assert aligned["loss"]["values"][2] == pytest.approx([None, 0.8, 0.6, 0.4, 0.2])
+
+
+def test_align_series_carries_previous_value_forward():
+    aligned = align_series(_series(), grid_points=5, method="previous")
+    
+    assert aligned["loss"]["values"][1] == [1.0, 1.0, 0.0, None, None]
+    assert aligned["loss"]["values"][2] == [None, 0.8, 0.8, 0.8, 0.2]
@@ -0,0 +1,43 @@
+import pytest
+from backend.utils.run_search import SearchClause, parse_order_by, parse_search
+
+
+def test_parse_search_compiles_typed_clauses():
+    clauses = parse_search("params.learning_rate < 1e-3 and metrics.val_loss <= 0.2 AND tags.team = nlp")
+    
+    assert clauses == [
+        SearchClause("param", "learning_rate", "<", 0.001),
+        SearchClause("metric", "val_loss", "<=", 0.2),
+        SearchClause("tag", "team", "=", "nlp")
+    ]
+
+
+def test_parse_search_handles_quoted_keys_and_values():
+    clauses = parse_search("metrics.`train/loss` > .5 and status == 'completed' and tags.version = 2")
+    
+    assert clauses == [
+        SearchClause("metric", "train/loss", ">", 0.5),
+        SearchClause("attribute", "status", "=", "completed"),
+        SearchClause("tag", "version", "=", "2")
+    ]
+
+
+@pytest.mark.parametrize("expression", [
+    "metrics.loss < low",
+    "unknown = 1",
+    "tags.team > 1",
+    "params.optimizer < adam",
+    "params.lr <",
+    "params.lr < 1 and"
+])
+def test_parse_search_rejects_invalid_filters(expression):
+    with pytest.raises(ValueError):
+        parse_search(expression)
+
+
+def test_parse_order_by():
+    assert parse_order_by("metrics.val_loss") == ("metric", "val_loss", False)
+    assert parse_order_by("start_time DESC") == ("attribute", "start_time", True)
+    
+    with pytest.raises(ValueError):
+        parse_order_by("params.lr desc")
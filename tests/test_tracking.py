@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import json
+import numpy as np
+import pyarrow as pa
+import pytest
+from backend.models.experiment import Metric, MetricSummary
+from backend.services import tracking
+from backend.services.tracking import MetricBuffer, MetricColumns, parse_metric_batch, write_metrics
+from backend.utils.dataset_reader import ARROW_STREAM_MEDIA_TYPE
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def commit(self):
+        pass
+
+
+class FakeDb:
+    def __init__(self, dialect: str, driver: str):
+        self.dialect = SimpleNamespace(name=dialect, driver=driver)
+        self.statements = []
+    
+    async def connection(self):
+        return SimpleNamespace(dialect=self.dialect)
+    
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+
+
+def _points(n: int) -> MetricColumns:
+    return MetricColumns(["loss"] * n, np.arange(n, dtype="float64"), np.arange(n))
+
+
+@pytest.mark.asyncio
+async def test_buffer_requeues_failed_runs_and_drops_after_retry_limit(monkeypatch):
+    failing = {1}
+    written = []
+    
+    async def write_metrics(session, run_id, metrics):
+        if run_id in failing:
+            raise RuntimeError("copy failed")
+        written.append((run_id, len(metrics)))
+        return len(metrics)
+    
+    async def publish_metric_points(run_id, metrics):
+        pass
+    
+    monkeypatch.setattr(tracking, "async_session_maker", FakeSession)
+    monkeypatch.setattr(tracking, "write_metrics", write_metrics)
+    monkeypatch.setattr(tracking, "publish_metric_points", publish_metric_points)
+    
+    buffer = MetricBuffer(max_points=1000, flush_interval=60, max_retries=1)
+    await buffer.add(1, _points(3))
+    await buffer.add(2, _points(2))
+    
+    assert await buffer.flush() == 2
+    assert written == [(2, 2)]
+    assert buffer.stats()["pending_points"] == 3
+    
+    failing.clear()
+    await buffer.add(1, _points(1))
+    assert await buffer.flush() == 4
+    assert written == [(2, 2), (1, 3), (1, 1)]
+    
+    failing.add(1)
+    await buffer.add(1, _points(5))
+    await buffer.flush()
+    await buffer.flush()
+    assert buffer.stats()["pending_points"] == 0
+    assert buffer.stats()["dropped_points"] == 5
+
+
+def test_parse_metric_batch_reads_json_and_arrow_columns():
+    metrics = parse_metric_batch(
+        json.dumps({"keys": ["loss", "acc"], "values": [0.5, 0.9]}).encode(),
+        "application/json"
+    )
+    assert metrics.keys == ["loss", "acc"]
+    assert metrics.values.tolist() == [0.5, 0.9]
+    assert metrics.steps.tolist() == [0, 0]
+    
+    table = pa.table({
+        "key": ["loss", "loss"],
+        "value": [0.4, 0.3],
+        "step": pa.array([1, None], pa.int64()),
+        "timestamp": pa.array([datetime(2024, 1, 1, tzinfo=timezone.utc)] * 2, pa.timestamp("us", tz="UTC"))
+    })
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    
+    metrics = parse_metric_batch(sink.getvalue().to_pybytes(), ARROW_STREAM_MEDIA_TYPE)
+    assert metrics.values.tolist() == [0.4, 0.3]
+    assert metrics.steps.tolist() == [1, 0]
+    assert metrics.records(7)[0] == (7, "loss", 0.4, datetime(2024, 1, 1), 1)
+    
+    with pytest.raises(ValueError):
+        parse_metric_batch(json.dumps({"keys": ["loss"], "values": [1.0, 2.0]}).encode(), "application/json")
+
+
+@pytest.mark.asyncio
+async def test_write_metrics_falls_back_to_insert_without_asyncpg():
+    db = FakeDb("sqlite", "aiosqlite")
+    metrics = MetricColumns(["loss", "loss", "acc"], np.array([0.5, 0.4, 0.9]), np.array([1, 2, 2]))
+    
+    assert await write_metrics(db, 3, metrics) == 3
+    
+    (insert_rows, rows), (upsert, _) = db.statements
+    assert insert_rows.table is Metric.__table__
+    assert [(row["run_id"], row["key"], row["value"], row["step"]) for row in rows] == [
+        (3, "loss", 0.5, 1),
+        (3, "loss", 0.4, 2),
+        (3, "acc", 0.9, 2)
+    ]
+    assert upsert.table is MetricSummary.__table__
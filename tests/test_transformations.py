@@ -0,0 +1,49 @@
+import math
+import pandas as pd
+import pyarrow as pa
+import pytest
+from backend.utils.transformations import compile_plan
+
+
+def test_ingest_plan_resolves_dependencies_between_derived_features():
+    plan = compile_plan({
+        "log_ratio": {"op": "log", "input": "ratio"},
+        "ratio": {"op": "div", "inputs": ["clicks", "views"]},
+        "views_bucket": {"op": "bucketize", "input": "views", "boundaries": [10, 100]}
+    })
+    table = pa.table({"clicks": [5.0, 1.0, None], "views": [50.0, 0.0, 500.0]})
+    
+    result = plan.apply_table(table).to_pydict()
+    
+    assert result["ratio"] == [0.1, None, None]
+    assert math.isclose(result["log_ratio"][0], math.log(0.1))
+    assert result["views_bucket"] == [1.0, 0.0, 2.0]
+
+
+def test_on_demand_features_apply_to_served_records():
+    plan = compile_plan({"total": {"op": "add", "inputs": ["a", "b", 1], "on_demand": True}})
+    
+    records = plan.apply_records([{"a": 1, "b": 2}, None])
+    
+    assert records == [{"a": 1, "b": 2, "total": 4.0}, None]
+
+
+def test_rolling_aggregate_is_computed_per_entity():
+    plan = compile_plan({"spend_2": {"op": "rolling", "input": "spend", "window": 2, "agg": "sum"}})
+    df = pd.DataFrame({
+        "user_id": [2, 1, 1, 1],
+        "ts": [1, 1, 2, 3],
+        "spend": [7.0, 1.0, 2.0, 3.0]
+    })
+    
+    result = plan.apply_frame(df, ["user_id"], "ts")
+    
+    assert result["spend_2"].tolist() == [1.0, 3.0, 5.0, 7.0]
+
+
+def test_cyclic_declarations_are_rejected():
+    with pytest.raises(ValueError):
+        compile_plan({
+            "a": {"op": "add", "inputs": ["b", 1]},
+            "b": {"op": "add", "inputs": ["a", 1]}
+        })